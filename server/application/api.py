@@ -1,16 +1,20 @@
 """HTTP API entrypoints grouped by domain."""
 
 from server.domains.admin.api import (
+    admin_reports_api,
     admin_table_truncate_api,
     admin_tables_api,
+    admin_tables_recount_api,
     admin_teams_api,
     admin_users_api,
 )
-from server.domains.auth.api import frontend_bootstrap, health, signup_api
+from server.domains.auth.api import frontend_bootstrap, health, metrics, signup_api
 from server.domains.data_updates.api import data_updates_api
 from server.domains.projects.api import dashboard_summary, project_management_api, projects
 from server.domains.research_notes.api import (
     research_note_detail_api,
+    research_note_page_search_api,
+    research_note_search_api,
     research_note_update_api,
     research_notes_api,
 )
@@ -18,8 +22,10 @@ from server.domains.researchers.api import researchers_api
 from server.domains.signatures.api import final_download_api, signature_api
 
 __all__ = [
+    "admin_reports_api",
     "admin_table_truncate_api",
     "admin_tables_api",
+    "admin_tables_recount_api",
     "admin_teams_api",
     "admin_users_api",
     "dashboard_summary",
@@ -27,9 +33,12 @@ __all__ = [
     "final_download_api",
     "frontend_bootstrap",
     "health",
+    "metrics",
     "project_management_api",
     "projects",
     "research_note_detail_api",
+    "research_note_page_search_api",
+    "research_note_search_api",
     "research_note_update_api",
     "research_notes_api",
     "researchers_api",
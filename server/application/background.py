@@ -0,0 +1,44 @@
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.db import close_old_connections, connection
+
+logger = logging.getLogger(__name__)
+
+_EXECUTOR_LOCK = threading.Lock()
+_EXECUTOR: ThreadPoolExecutor | None = None
+
+
+def _executor() -> ThreadPoolExecutor:
+    global _EXECUTOR
+    if _EXECUTOR is None:
+        with _EXECUTOR_LOCK:
+            if _EXECUTOR is None:
+                _EXECUTOR = ThreadPoolExecutor(
+                    max_workers=getattr(settings, "BACKGROUND_TASK_WORKERS", 2),
+                    thread_name_prefix="projectnote-bg",
+                )
+    return _EXECUTOR
+
+
+def _run(func, args: tuple) -> None:
+    close_old_connections()
+    try:
+        func(*args)
+    except Exception:
+        logger.exception("Background task %s failed", getattr(func, "__name__", func))
+    finally:
+        connection.close()
+
+
+def submit_background(func, *args) -> None:
+    """Run `func(*args)` off the request path, on the in-process worker pool.
+
+    With BACKGROUND_TASKS_EAGER the call runs inline instead (tests, single-process tools).
+    """
+    if getattr(settings, "BACKGROUND_TASKS_EAGER", False):
+        func(*args)
+        return
+    _executor().submit(_run, func, args)
@@ -0,0 +1,202 @@
+"""Per-request query count, DB time, total time and stage timings.
+
+Budgets live in settings.REQUEST_BUDGETS, keyed by the URL pattern of the matched route
+(``"frontend/projects/<str:project_id>"``); routes without an entry fall back to
+REQUEST_BUDGET_DEFAULT. Exceeding a budget logs a warning in production, and tests assert
+on the recorded numbers through ``response.wsgi_request.request_stats``.
+
+Queries are counted by one execute wrapper installed on every database connection, which adds
+them to the stats of the request in the current context; async views run their ORM calls in
+other threads (each with its own connections) and are still counted.
+
+Slow code paths mark their stages with ``timing_span``; the stages of a request are logged
+as one structured entry and, for super admins (or everyone with SERVER_TIMING_ENABLED), sent
+back as a ``Server-Timing`` header:
+
+    with timing_span("render"):
+        pdf.drawImage(...)
+"""
+
+import logging
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db import connections
+from django.db.backends.signals import connection_created
+
+from server.application import metrics
+from server.application.web_support import REQUEST_PROFILE_ATTR
+
+logger = logging.getLogger(__name__)
+
+BUDGET_METRICS = ("queries", "db_ms", "total_ms")
+
+_current_stats: ContextVar["RequestStats | None"] = ContextVar("request_stats", default=None)
+
+
+@dataclass
+class RequestStats:
+    route: str = ""
+    queries: int = 0
+    db_ms: float = 0.0
+    total_ms: float = 0.0
+    # Self time per stage in ms: a nested span's time is not counted again in the enclosing one.
+    spans: dict[str, float] = field(default_factory=dict)
+    _open_spans: list[float] = field(default_factory=list, repr=False)
+
+    def __call__(self, execute, sql, params, many, context):
+        # Usable on its own with connection.execute_wrapper(stats).
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries += 1
+            self.db_ms += (time.perf_counter() - started) * 1000
+
+    def server_timing(self) -> str:
+        entries = [f"{name};dur={duration:.1f}" for name, duration in self.spans.items()]
+        entries.append(f'db;dur={self.db_ms:.1f};desc="{self.queries} queries"')
+        entries.append(f"total;dur={self.total_ms:.1f}")
+        return ", ".join(entries)
+
+    def as_log_fields(self) -> dict:
+        return {
+            "route": self.route,
+            "queries": self.queries,
+            "db_ms": round(self.db_ms, 1),
+            "total_ms": round(self.total_ms, 1),
+            "spans": {name: round(duration, 1) for name, duration in self.spans.items()},
+        }
+
+
+@contextmanager
+def timing_span(name: str):
+    """Add the time spent in the block to stage `name` of the current request, if any."""
+    stats = _current_stats.get()
+    if stats is None:
+        yield
+        return
+    started = time.perf_counter()
+    stats._open_spans.append(0.0)
+    try:
+        yield
+    finally:
+        elapsed = (time.perf_counter() - started) * 1000
+        nested = stats._open_spans.pop()
+        stats.spans[name] = stats.spans.get(name, 0.0) + elapsed - nested
+        if stats._open_spans:
+            stats._open_spans[-1] += elapsed
+
+
+def request_budget(route: str) -> dict:
+    return getattr(settings, "REQUEST_BUDGETS", {}).get(route) or getattr(settings, "REQUEST_BUDGET_DEFAULT", {})
+
+
+def budget_violations(stats: RequestStats, metrics: tuple[str, ...] = BUDGET_METRICS) -> list[str]:
+    budget = request_budget(stats.route)
+    return [
+        f"{metric} {round(getattr(stats, metric), 1)} > {budget[metric]}"
+        for metric in metrics
+        if metric in budget and getattr(stats, metric) > budget[metric]
+    ]
+
+
+def _record_query(execute, sql, params, many, context):
+    stats = _current_stats.get()
+    if stats is None:
+        return execute(sql, params, many, context)
+    return stats(execute, sql, params, many, context)
+
+
+def _install_query_recorder(connection, **kwargs) -> None:
+    if _record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(_record_query)
+
+
+def install_query_recorders() -> None:
+    """Install the recorder on this thread's connections; new connections get it on connect."""
+    for alias in connections:
+        _install_query_recorder(connections[alias])
+
+
+connection_created.connect(_install_query_recorder)
+
+
+def server_timing_allowed(request) -> bool:
+    """Internal timings go only to super admins unless SERVER_TIMING_ENABLED opens them to all.
+
+    Only reads what the view already loaded (the resolved profile or an accessed session), so
+    deciding never costs a query of its own; requests that never identified the user get no header.
+    """
+    if getattr(settings, "SERVER_TIMING_ENABLED", False):
+        return True
+    if hasattr(request, REQUEST_PROFILE_ATTR):
+        profile = getattr(request, REQUEST_PROFILE_ATTR)
+    else:
+        session = getattr(request, "session", None)
+        profile = session.get("user_profile") if session is not None and session.accessed else None
+    return bool((profile or {}).get("is_super_admin"))
+
+
+class RequestInstrumentationMiddleware:
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response) -> None:
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+        install_query_recorders()
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        stats, token = self._start(request)
+        started = time.perf_counter()
+        try:
+            response = self.get_response(request)
+        finally:
+            _current_stats.reset(token)
+        stats.total_ms = (time.perf_counter() - started) * 1000
+        return self._finish(request, response, stats, server_timing_allowed(request))
+
+    async def __acall__(self, request):
+        stats, token = self._start(request)
+        started = time.perf_counter()
+        try:
+            response = await self.get_response(request)
+        finally:
+            _current_stats.reset(token)
+        stats.total_ms = (time.perf_counter() - started) * 1000
+        return self._finish(request, response, stats, server_timing_allowed(request))
+
+    @staticmethod
+    def _start(request):
+        stats = RequestStats()
+        request.request_stats = stats
+        return stats, _current_stats.set(stats)
+
+    @staticmethod
+    def _finish(request, response, stats: RequestStats, show_timing: bool):
+        match = getattr(request, "resolver_match", None)
+        stats.route = match.route if match else ""
+        if show_timing:
+            response["Server-Timing"] = stats.server_timing()
+        metrics.observe_request(stats, request.method, response.status_code)
+
+        violations = budget_violations(stats)
+        if violations:
+            logger.warning(
+                "Request budget exceeded for %s %s: %s",
+                request.method,
+                stats.route or request.path,
+                "; ".join(violations),
+                extra=stats.as_log_fields(),
+            )
+        elif stats.spans:
+            logger.info("Request timing for %s %s: %s", request.method, stats.route or request.path, stats.server_timing(), extra=stats.as_log_fields())
+        return response
@@ -0,0 +1,273 @@
+"""Prometheus-format counters and histograms shared by every worker process on the host.
+
+Each process keeps its values in memory and writes a snapshot to its own JSON file under
+METRICS_DIR (at most every METRICS_FLUSH_INTERVAL seconds, and at exit); ``/metrics`` sums
+the snapshots of all processes, so counters keep growing across workers and restarts. Each
+scrape folds the snapshots of exited processes into one retired.json, so the directory does
+not grow with every restart:
+
+    PDF_CACHE_REQUESTS.inc(cache="note_file", result="hit")
+    PDF_RENDER_SECONDS.observe(0.42, format="pdf")
+"""
+
+import atexit
+import json
+import math
+import os
+import threading
+import time
+import uuid
+from pathlib import Path
+
+from django.conf import settings
+
+try:
+    import fcntl
+except ImportError:  # Windows: snapshots are summed but never compacted.
+    fcntl = None
+
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+QUERY_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 200, 500)
+SIZE_BUCKETS = tuple(float(2**power) for power in range(14, 30, 2))  # 16 KiB .. 256 MiB
+COUNT_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000)
+
+_REGISTRY: dict[str, "_Metric"] = {}
+_lock = threading.Lock()
+_counters: dict[tuple, float] = {}
+_histograms: dict[tuple, list[float]] = {}  # bucket counts..., sum, count
+_last_flush = 0.0
+_snapshot_name = f"{os.getpid()}-{uuid.uuid4().hex[:8]}.json"
+RETIRED_SNAPSHOT = "retired.json"
+
+
+def _reset_after_fork() -> None:
+    """A preforked worker (gunicorn --preload) starts with its own snapshot file and empty values.
+
+    Otherwise every worker would inherit the master's file name and counts, overwrite each
+    other's snapshots and never be retired, since the master's pid stays alive.
+    """
+    global _lock, _last_flush, _snapshot_name
+    _lock = threading.Lock()  # another thread may have held it at fork time
+    _counters.clear()
+    _histograms.clear()
+    _last_flush = 0.0
+    _snapshot_name = f"{os.getpid()}-{uuid.uuid4().hex[:8]}.json"
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        _REGISTRY[name] = self
+
+    def _key(self, labels: dict) -> tuple:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        return (self.name, tuple(str(labels[label]) for label in self.labelnames))
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def inc(self, amount: float = 1.0, **labels) -> None:
+        key = self._key(labels)
+        with _lock:
+            _counters[key] = _counters.get(key, 0.0) + amount
+        flush_if_due()
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple[str, ...] = (), buckets: tuple = DURATION_BUCKETS) -> None:
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(float(bound) for bound in buckets)
+
+    def observe(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        with _lock:
+            values = _histograms.setdefault(key, [0.0] * (len(self.buckets) + 2))
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    values[index] += 1
+                    break
+            values[-2] += value
+            values[-1] += 1
+        flush_if_due()
+
+
+REQUESTS = Counter("projectnote_requests_total", "HTTP requests by route, method and status.", ("route", "method", "status"))
+REQUEST_SECONDS = Histogram("projectnote_request_duration_seconds", "Request latency by route.", ("route",))
+REQUEST_QUERIES = Histogram("projectnote_request_queries", "Database queries per request by route.", ("route",), QUERY_BUCKETS)
+PDF_CACHE_REQUESTS = Counter("projectnote_pdf_cache_requests_total", "PDF cache lookups by cache and result.", ("cache", "result"))
+PDF_RENDER_SECONDS = Histogram("projectnote_pdf_render_seconds", "Time to build one PDF by source file format.", ("format",))
+PDF_MERGE_BYTES = Histogram("projectnote_pdf_merge_bytes", "Size of merged PDF exports.", ("kind",), SIZE_BUCKETS)
+PDF_MERGE_FILES = Histogram("projectnote_pdf_merge_files", "Documents merged into one PDF export.", ("kind",), COUNT_BUCKETS)
+UPLOAD_BYTES = Counter("projectnote_upload_bytes_total", "Bytes received in file uploads by endpoint.", ("endpoint",))
+
+
+def observe_request(stats, method: str, status: int) -> None:
+    route = stats.route or "unmatched"
+    REQUESTS.inc(route=route, method=method, status=status)
+    REQUEST_SECONDS.observe(stats.total_ms / 1000, route=route)
+    REQUEST_QUERIES.observe(stats.queries, route=route)
+
+
+def _metrics_dir() -> Path:
+    return Path(settings.METRICS_DIR)
+
+
+def flush(force: bool = True) -> None:
+    """Write this process's snapshot; without `force` only once per METRICS_FLUSH_INTERVAL."""
+    global _last_flush
+    now = time.monotonic()
+    with _lock:
+        if not force and now - _last_flush < settings.METRICS_FLUSH_INTERVAL:
+            return
+        _last_flush = now
+        snapshot = _snapshot(_counters, _histograms)
+    directory = _metrics_dir()
+    try:
+        directory.mkdir(parents=True, exist_ok=True)
+        _write_snapshot(directory / _snapshot_name, snapshot)
+    except OSError:
+        return
+
+
+def _snapshot(counters: dict[tuple, float], histograms: dict[tuple, list[float]]) -> dict:
+    return {
+        "counters": [[name, list(labels), value] for (name, labels), value in counters.items()],
+        "histograms": [[name, list(labels), values] for (name, labels), values in histograms.items()],
+    }
+
+
+def _write_snapshot(path: Path, snapshot: dict) -> None:
+    temp_path = path.with_name(f".{path.name}.tmp")
+    temp_path.write_text(json.dumps(snapshot), encoding="utf-8")
+    os.replace(temp_path, path)
+
+
+def flush_if_due() -> None:
+    flush(force=False)
+
+
+atexit.register(flush)
+
+
+def _collect() -> tuple[dict[tuple, float], dict[tuple, list[float]]]:
+    directory = _metrics_dir()
+    _retire_dead_snapshots(directory)
+    return _merge_snapshots(sorted(directory.glob("*.json")))
+
+
+def _merge_snapshots(paths: list[Path]) -> tuple[dict[tuple, float], dict[tuple, list[float]]]:
+    counters: dict[tuple, float] = {}
+    histograms: dict[tuple, list[float]] = {}
+    for path in paths:
+        try:
+            snapshot = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            continue
+        for name, labels, value in snapshot.get("counters", []):
+            key = (name, tuple(labels))
+            counters[key] = counters.get(key, 0.0) + value
+        for name, labels, values in snapshot.get("histograms", []):
+            key = (name, tuple(labels))
+            metric = _REGISTRY.get(name)
+            if not metric or len(values) != len(metric.buckets) + 2:
+                continue
+            merged = histograms.setdefault(key, [0.0] * len(values))
+            for index, value in enumerate(values):
+                merged[index] += value
+    return counters, histograms
+
+
+def _process_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except OSError:
+        return True
+    return True
+
+
+def _retire_dead_snapshots(directory: Path) -> None:
+    """Fold snapshots of exited processes into RETIRED_SNAPSHOT and delete them.
+
+    Runs under an exclusive lock so concurrent scrapes from different workers never count a
+    snapshot twice. A snapshot carrying this process's pid but not its name was left by an
+    earlier process that had the same pid.
+    """
+    if fcntl is None or not directory.is_dir():
+        return
+    try:
+        lock = (directory / ".retired.lock").open("a")
+    except OSError:
+        return
+    with lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        dead = []
+        for path in directory.glob("*.json"):
+            pid, _, _ = path.name.partition("-")
+            if path.name == _snapshot_name or not pid.isdigit():
+                continue
+            if int(pid) != os.getpid() and _process_alive(int(pid)):
+                continue
+            dead.append(path)
+        if not dead:
+            return
+        retired_path = directory / RETIRED_SNAPSHOT
+        try:
+            _write_snapshot(retired_path, _snapshot(*_merge_snapshots([retired_path, *dead])))
+            for path in dead:
+                path.unlink(missing_ok=True)
+        except OSError:
+            return
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels_text(pairs: list[tuple[str, str]]) -> str:
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in pairs) + "}" if pairs else ""
+
+
+def _number(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf"
+    return repr(float(value))
+
+
+def render_prometheus() -> str:
+    """All processes' metrics in the Prometheus text exposition format (version 0.0.4)."""
+    flush()
+    counters, histograms = _collect()
+    lines: list[str] = []
+    for name, metric in _REGISTRY.items():
+        lines.append(f"# HELP {name} {metric.documentation}")
+        lines.append(f"# TYPE {name} {metric.kind}")
+        if metric.kind == "counter":
+            for (key_name, labels), value in sorted(counters.items()):
+                if key_name == name:
+                    lines.append(f"{name}{_labels_text(list(zip(metric.labelnames, labels)))} {_number(value)}")
+            continue
+        for (key_name, labels), values in sorted(histograms.items()):
+            if key_name != name:
+                continue
+            pairs = list(zip(metric.labelnames, labels))
+            cumulative = 0.0
+            for bound, count in zip((*metric.buckets, math.inf), values[:-2] + [values[-1] - sum(values[:-2])]):
+                cumulative += count
+                lines.append(f"{name}_bucket{_labels_text([*pairs, ('le', _number(bound))])} {_number(cumulative)}")
+            lines.append(f"{name}_sum{_labels_text(pairs)} {_number(values[-2])}")
+            lines.append(f"{name}_count{_labels_text(pairs)} {_number(values[-1])}")
+    return "\n".join(lines) + "\n"
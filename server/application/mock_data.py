@@ -1,24 +1,47 @@
+import random
+import uuid
+from io import BytesIO
+from pathlib import Path
+
+from django.conf import settings
+from django.contrib.auth.hashers import make_password
+from django.db import transaction
 from django.utils import timezone
 
 from server.domains.admin.models import Team, UserAccount
 from server.domains.data_updates.models import DataUpdate
 from server.domains.projects.models import Project, ProjectMember
 from server.domains.research_notes.models import ResearchNote, ResearchNoteFile, ResearchNoteFolder
+from server.domains.research_notes.search import ResearchNoteSearchIndex
 from server.domains.signatures.models import SignatureState
+from server.domains.stats import StatsRepository
+
+SCALE_SUMMARIES = (
+    "시료 전처리 조건을 비교한 실험 기록",
+    "측정 장비 보정 결과와 편차 분석",
+    "주간 연구 회의 논의 사항 정리",
+    "프로토타입 성능 시험 결과",
+    "선행 문헌 조사 및 참고 자료 요약",
+    "데이터 수집 절차 변경 사항",
+)
+
+
+def _clear_demo_tables() -> None:
+    ProjectMember.objects.all().delete()
+    ResearchNoteFile.objects.all().delete()
+    ResearchNoteFolder.objects.all().delete()
+    ResearchNote.objects.all().delete()
+    Project.objects.all().delete()
+    DataUpdate.objects.all().delete()
+    SignatureState.objects.all().delete()
+    UserAccount.objects.all().delete()
+    Team.objects.all().delete()
 
 
 def seed_demo_data(reset: bool = False) -> dict[str, int]:
     """Create deterministic mock data without relying on management commands."""
     if reset:
-        ProjectMember.objects.all().delete()
-        ResearchNoteFile.objects.all().delete()
-        ResearchNoteFolder.objects.all().delete()
-        ResearchNote.objects.all().delete()
-        Project.objects.all().delete()
-        DataUpdate.objects.all().delete()
-        SignatureState.objects.all().delete()
-        UserAccount.objects.all().delete()
-        Team.objects.all().delete()
+        _clear_demo_tables()
 
     team1, _ = Team.objects.get_or_create(name="딥테크딥스", defaults={"description": "R&D 팀", "join_code": "100001"})
     team2, _ = Team.objects.get_or_create(name="ProjectNote Lab", defaults={"description": "Product 팀", "join_code": "100002"})
@@ -74,8 +97,6 @@ def seed_demo_data(reset: bool = False) -> dict[str, int]:
             "owner": "노승희",
             "project_code": project.code,
             "period": "2026.01.01 ~ 2026.12.31",
-            "files": 1,
-            "members": 2,
             "summary": "데모 데이터로 생성된 연구노트입니다.",
         },
     )
@@ -103,3 +124,173 @@ def seed_demo_data(reset: bool = False) -> dict[str, int]:
         "researchers": UserAccount.objects.count(),
         "notes": ResearchNote.objects.count(),
     }
+
+
+def sample_pdf_bytes(pages: int = 2) -> bytes:
+    """A small text PDF; `invariant` keeps the bytes identical between runs."""
+    from server.application import pdf_toolkit
+
+    buffer = BytesIO()
+    pdf = pdf_toolkit.canvas.Canvas(buffer, pagesize=pdf_toolkit.A4, invariant=1)
+    for page in range(pages):
+        pdf_toolkit.set_pdf_font(pdf, 12)
+        for line in range(40):
+            pdf.drawString(40, 800 - line * 18, f"합성 연구노트 {page + 1}쪽 {line + 1}행 - synthetic research note text")
+        pdf.showPage()
+    pdf.save()
+    return buffer.getvalue()
+
+
+def sample_png_bytes() -> bytes:
+    from PIL import Image
+
+    buffer = BytesIO()
+    Image.new("RGB", (1240, 1754), (246, 248, 252)).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def seed_scale_data(
+    teams: int = 2,
+    users: int = 20,
+    projects: int = 10,
+    notes_per_project: int = 100,
+    files_per_note: int = 2,
+    *,
+    seed: int = 0,
+    image_ratio: float = 0.3,
+    write_files: bool = False,
+    pdf_pages: int = 2,
+    storage_root: str | Path | None = None,
+    password: str = "secret123",
+    batch_size: int = 2000,
+    reset: bool = False,
+) -> dict[str, int]:
+    """Generate a large synthetic dataset with batched bulk_create, identical for the same seed.
+
+    Users are spread round-robin over the teams and the first user of each team is its owner,
+    named ``scale-user-00001`` and so on, all sharing `password`. Every project belongs to one
+    team and lists the team owner plus a few team members. Ids, names, owners and file formats
+    come from `seed`; with `write_files` each file is written under `storage_root` (default
+    RESEARCH_NOTES_STORAGE_ROOT) in the same ``<username>/<note id>/`` layout uploads use.
+    bulk_create skips the model signals, so counters and the search index are rebuilt at the end.
+    """
+    if teams < 1 or users < teams:
+        raise ValueError("teams must be at least 1 and users at least teams")
+    if reset:
+        _clear_demo_tables()
+
+    rng = random.Random(seed)
+    root = Path(storage_root or settings.RESEARCH_NOTES_STORAGE_ROOT)
+    payloads = {"pdf": sample_pdf_bytes(pdf_pages), "png": sample_png_bytes()} if write_files else {}
+
+    def next_uuid() -> uuid.UUID:
+        return uuid.UUID(int=rng.getrandbits(128), version=4)
+
+    def flush(model, rows: list) -> None:
+        if rows:
+            model.objects.bulk_create(rows, batch_size=batch_size)
+            rows.clear()
+
+    project_rows: list[Project] = []
+    members: list[ProjectMember] = []
+    notes: list[ResearchNote] = []
+    folders: list[ResearchNoteFolder] = []
+    files: list[ResearchNoteFile] = []
+
+    def flush_pending() -> None:
+        # Parents go first: members and notes reference projects, folders and files reference notes.
+        flush(Project, project_rows)
+        flush(ProjectMember, members)
+        flush(ResearchNote, notes)
+        flush(ResearchNoteFolder, folders)
+        flush(ResearchNoteFile, files)
+
+    with transaction.atomic():
+        team_rows = Team.objects.bulk_create(
+            [
+                Team(name=f"스케일팀 {index + 1:03d}", description=f"synthetic team (seed {seed})", join_code=f"{500000 + index:06d}")
+                for index in range(teams)
+            ],
+            batch_size=batch_size,
+        )
+        encoded_password = make_password(password, salt=f"scaleseed{seed}")
+        user_rows = UserAccount.objects.bulk_create(
+            [
+                UserAccount(
+                    username=f"scale-user-{index + 1:05d}",
+                    display_name=f"연구원{index + 1:05d}",
+                    email=f"scale-user-{index + 1:05d}@example.com",
+                    password=encoded_password,
+                    role=UserAccount.Role.OWNER if index < teams else UserAccount.Role.MEMBER,
+                    team=team_rows[index % teams],
+                    is_approved=True,
+                )
+                for index in range(users)
+            ],
+            batch_size=batch_size,
+        )
+        team_users = [user_rows[index::teams] for index in range(teams)]
+
+        for project_index in range(projects):
+            team_index = project_index % teams
+            owner, *others = team_users[team_index]
+            project = Project(
+                id=next_uuid(),
+                name=f"스케일 프로젝트 {project_index + 1:05d}",
+                status=Project.Status.ACTIVE,
+                manager=owner.display_name,
+                organization=team_rows[team_index].name,
+                company=team_rows[team_index],
+                code=f"PN-SCALE-{project_index + 1:05d}",
+                description=f"synthetic project (seed {seed})",
+            )
+            project_rows.append(project)
+            project_users = [owner, *rng.sample(others, min(len(others), 4))]
+            members.extend(
+                ProjectMember(project=project, user=user, role="owner" if user is owner else "member") for user in project_users
+            )
+
+            for note_index in range(notes_per_project):
+                author = rng.choice(project_users)
+                note = ResearchNote(
+                    id=next_uuid(),
+                    project=project,
+                    title=f"{project.code} 연구노트 {note_index + 1:05d}",
+                    owner=author.display_name,
+                    owner_username=author.username,
+                    project_code=project.code,
+                    period="2026.01.01 ~ 2026.12.31",
+                    summary=rng.choice(SCALE_SUMMARIES),
+                )
+                notes.append(note)
+                folder = root / author.username / str(note.id)
+                folders.append(ResearchNoteFolder(note=note, name=str(folder)))
+                for file_index in range(files_per_note):
+                    file_format = "png" if rng.random() < image_ratio else "pdf"
+                    name = f"file-{file_index + 1:03d}.{file_format}"
+                    files.append(
+                        ResearchNoteFile(
+                            note=note,
+                            name=name,
+                            author=author.display_name,
+                            format=file_format,
+                            created=f"2026.{rng.randint(1, 12):02d}.{rng.randint(1, 28):02d} / 10:00 AM",
+                        )
+                    )
+                    if write_files:
+                        folder.mkdir(parents=True, exist_ok=True)
+                        (folder / name).write_bytes(payloads[file_format])
+                if len(notes) >= batch_size:
+                    flush_pending()
+
+        flush_pending()
+        StatsRepository().recount_all()
+        ResearchNoteSearchIndex().rebuild()
+
+    return {
+        "teams": teams,
+        "researchers": users,
+        "projects": projects,
+        "notes": projects * notes_per_project,
+        "files": projects * notes_per_project * files_per_note,
+    }
@@ -0,0 +1,77 @@
+"""pypdf/reportlab loaded on first use, plus the Korean CID font shared by every PDF export.
+
+Importing the PDF stack and registering the CID font costs a noticeable share of worker boot,
+management command and test start-up time, while only the PDF export views need it:
+
+    from server.application import pdf_toolkit
+
+    pdf = pdf_toolkit.canvas.Canvas(buffer, pagesize=pdf_toolkit.A4)
+    pdf_toolkit.set_pdf_font(pdf, 12)
+"""
+
+import importlib
+import threading
+
+# Lazily resolved attribute -> (module, attribute or None for the module itself).
+_LAZY_ATTRIBUTES = {
+    "PageObject": ("pypdf", "PageObject"),
+    "PdfReader": ("pypdf", "PdfReader"),
+    "PdfWriter": ("pypdf", "PdfWriter"),
+    "Transformation": ("pypdf", "Transformation"),
+    "A4": ("reportlab.lib.pagesizes", "A4"),
+    "ImageReader": ("reportlab.lib.utils", "ImageReader"),
+    "canvas": ("reportlab.pdfgen.canvas", None),
+}
+KOREAN_FONT_CANDIDATES = ("HYGothic-Medium", "HYSMyeongJo-Medium")
+
+_font_lock = threading.Lock()
+_korean_font: str | None = None
+_korean_font_resolved = False
+
+
+def __getattr__(name: str):
+    try:
+        module_name, attribute = _LAZY_ATTRIBUTES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    module = importlib.import_module(module_name)
+    value = module if attribute is None else getattr(module, attribute)
+    globals()[name] = value
+    return value
+
+
+def korean_font() -> str | None:
+    """Name of the registered Korean CID font, registering it once per process."""
+    global _korean_font, _korean_font_resolved
+    if _korean_font_resolved:
+        return _korean_font
+    with _font_lock:
+        if not _korean_font_resolved:
+            _korean_font = _register_korean_font()
+            _korean_font_resolved = True
+    return _korean_font
+
+
+def _register_korean_font() -> str | None:
+    from reportlab.pdfbase import pdfmetrics
+    from reportlab.pdfbase.cidfonts import UnicodeCIDFont
+
+    for font_name in KOREAN_FONT_CANDIDATES:
+        try:
+            pdfmetrics.getFont(font_name)
+            return font_name
+        except KeyError:
+            try:
+                pdfmetrics.registerFont(UnicodeCIDFont(font_name))
+                return font_name
+            except Exception:
+                continue
+    return None
+
+
+def set_pdf_font(pdf, size: int, bold: bool = False) -> None:
+    font_name = korean_font()
+    if font_name:
+        pdf.setFont(font_name, size)
+        return
+    pdf.setFont("Helvetica-Bold" if bold else "Helvetica", size)
@@ -0,0 +1,188 @@
+"""On-demand sampling profiler for single requests, available to super admins only.
+
+A super admin adds ``?_profile=1`` or the ``X-Profile-Request: 1`` header to any request; a
+background thread samples the request thread's stack every PROFILE_SAMPLE_INTERVAL_MS and the
+result is stored under PROFILES_DIR as collapsed stacks (``frame;frame;frame count``), the
+input format of flamegraph.pl and speedscope. The response carries the profile id in
+``X-Profile-Id`` and /frontend/admin/profiles lists the most recent PROFILES_KEEP profiles.
+
+Under ASGI the middleware chain runs on the event loop while a sync view runs in the request's
+thread-sensitive sync_to_async thread, so ``process_view`` moves the sampler onto the thread that
+actually runs the view. Async views keep sampling the event-loop thread, where stacks of other
+requests served concurrently on that loop show up as well.
+"""
+
+import json
+import re
+import sys
+import threading
+import time
+import uuid
+from collections import Counter
+from datetime import datetime, timezone
+from pathlib import Path
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+
+from server.application.web_support import effective_user_profile, is_super_admin_request
+
+PROFILE_QUERY_FLAG = "_profile"
+PROFILE_HEADER = "HTTP_X_PROFILE_REQUEST"
+PROFILE_ID_PATTERN = re.compile(r"^[0-9]{8}-[0-9]{6}-[0-9]{6}-[0-9a-f]{6}$")
+REQUEST_SAMPLER_ATTR = "_projectnote_stack_sampler"
+
+_PROJECT_ROOT = str(settings.PROJECT_ROOT)
+
+
+class StackSampler:
+    """Counts the stacks of one thread, sampled from a daemon thread at a fixed interval."""
+
+    def __init__(self, thread_id: int, interval: float) -> None:
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks: Counter[str] = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="projectnote-profiler", daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            names = []
+            while frame is not None:
+                names.append(_frame_name(frame))
+                frame = frame.f_back
+            if names:
+                self.stacks[";".join(reversed(names))] += 1
+
+    def collapsed(self) -> str:
+        return "".join(f"{stack} {count}\n" for stack, count in self.stacks.most_common())
+
+
+def _frame_name(frame) -> str:
+    code = frame.f_code
+    filename = code.co_filename
+    if filename.startswith(_PROJECT_ROOT):
+        filename = filename[len(_PROJECT_ROOT) + 1 :]
+    elif "site-packages/" in filename:
+        filename = filename.split("site-packages/", 1)[1]
+    return f"{code.co_name} ({filename}:{code.co_firstlineno})".replace(";", ":")
+
+
+def _profiling_flagged(request) -> bool:
+    return request.GET.get(PROFILE_QUERY_FLAG) == "1" or request.META.get(PROFILE_HEADER) == "1"
+
+
+def profiling_requested(request) -> bool:
+    return _profiling_flagged(request) and is_super_admin_request(request)
+
+
+def _profiles_dir() -> Path:
+    return Path(settings.PROFILES_DIR)
+
+
+def save_profile(request, response, sampler: StackSampler, elapsed_ms: float) -> str:
+    now = datetime.now(timezone.utc)
+    # Sortable by creation time, which is what pruning and the admin list rely on.
+    profile_id = f"{now:%Y%m%d-%H%M%S-%f}-{uuid.uuid4().hex[:6]}"
+    directory = _profiles_dir()
+    directory.mkdir(parents=True, exist_ok=True)
+    (directory / f"{profile_id}.collapsed").write_text(sampler.collapsed(), encoding="utf-8")
+    match = getattr(request, "resolver_match", None)
+    meta = {
+        "id": profile_id,
+        "created_at": now.isoformat(timespec="seconds"),
+        "method": request.method,
+        "path": request.get_full_path(),
+        "route": match.route if match else "",
+        "status": response.status_code,
+        "duration_ms": round(elapsed_ms, 1),
+        "samples": sum(sampler.stacks.values()),
+        "interval_ms": settings.PROFILE_SAMPLE_INTERVAL_MS,
+        "username": str((effective_user_profile(request) or {}).get("username") or request.user.get_username()),
+    }
+    (directory / f"{profile_id}.json").write_text(json.dumps(meta, ensure_ascii=False), encoding="utf-8")
+    _prune(directory)
+    return profile_id
+
+
+def _prune(directory: Path) -> None:
+    for stale in sorted(directory.glob("*.json"), reverse=True)[settings.PROFILES_KEEP :]:
+        stale.unlink(missing_ok=True)
+        stale.with_suffix(".collapsed").unlink(missing_ok=True)
+
+
+def list_profiles(limit: int | None = None) -> list[dict]:
+    profiles = []
+    for path in sorted(_profiles_dir().glob("*.json"), reverse=True)[: limit or settings.PROFILES_KEEP]:
+        try:
+            profiles.append(json.loads(path.read_text(encoding="utf-8")))
+        except (OSError, ValueError):
+            continue
+    return profiles
+
+
+def profile_path(profile_id: str) -> Path | None:
+    if not PROFILE_ID_PATTERN.match(profile_id):
+        return None
+    path = _profiles_dir() / f"{profile_id}.collapsed"
+    return path if path.is_file() else None
+
+
+class RequestProfilerMiddleware:
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response) -> None:
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        # Under ASGI this sync hook runs via sync_to_async in the same thread-sensitive executor
+        # as the sync view that follows, so the current thread is the one worth sampling.
+        sampler = getattr(request, REQUEST_SAMPLER_ATTR, None)
+        if sampler is not None and not iscoroutinefunction(view_func):
+            sampler.thread_id = threading.get_ident()
+        return None
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        if not profiling_requested(request):
+            return self.get_response(request)
+
+        sampler = StackSampler(threading.get_ident(), settings.PROFILE_SAMPLE_INTERVAL_MS / 1000)
+        setattr(request, REQUEST_SAMPLER_ATTR, sampler)
+        sampler.start()
+        started = time.perf_counter()
+        try:
+            response = self.get_response(request)
+        finally:
+            sampler.stop()
+        response["X-Profile-Id"] = save_profile(request, response, sampler, (time.perf_counter() - started) * 1000)
+        return response
+
+    async def __acall__(self, request):
+        # Checking for a super admin loads the session user, so only flagged requests pay for it.
+        if not (_profiling_flagged(request) and await sync_to_async(is_super_admin_request)(request)):
+            return await self.get_response(request)
+
+        sampler = StackSampler(threading.get_ident(), settings.PROFILE_SAMPLE_INTERVAL_MS / 1000)
+        setattr(request, REQUEST_SAMPLER_ATTR, sampler)
+        sampler.start()
+        started = time.perf_counter()
+        try:
+            response = await self.get_response(request)
+        finally:
+            sampler.stop()
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        response["X-Profile-Id"] = await sync_to_async(save_profile)(request, response, sampler, elapsed_ms)
+        return response
@@ -0,0 +1,169 @@
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import column, func, select, table
+
+from server.application.sqlalchemy_session import fetch_core_rows
+from server.domains.admin.models import UserAccount
+
+# Lightweight Core table handles: only the columns the reports read, no reflection at import time.
+company_table = table(
+    "workflow_app_company",
+    column("id"),
+    column("name"),
+    column("join_code"),
+    column("note_count"),
+    column("file_count"),
+    column("last_activity_at"),
+)
+user_account_table = table(
+    "workflow_app_useraccount",
+    column("id"),
+    column("team_id"),
+    column("display_name"),
+    column("role"),
+)
+project_table = table(
+    "workflow_app_project",
+    column("id"),
+    column("name"),
+    column("status"),
+    column("company_id"),
+    column("note_count"),
+    column("file_count"),
+    column("last_activity_at"),
+)
+research_note_table = table("workflow_app_researchnote", column("id"), column("project_id"), column("created_at"))
+data_update_table = table("workflow_app_dataupdate", column("id"), column("target"), column("status"), column("updated_at"))
+
+
+def _iso(value) -> str | None:
+    if value is None or value == "":
+        return None
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value).replace(" ", "T", 1)
+
+
+def _db_timestamp(value: datetime) -> str:
+    # SQLite stores UTC datetimes as "YYYY-MM-DD HH:MM:SS[.ffffff]" text.
+    return value.astimezone(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+
+
+def team_stats(limit: int | None = None) -> list[dict]:
+    """Per-team user/project counts, owner name and materialized note totals in one statement."""
+    member_counts = (
+        select(user_account_table.c.team_id, func.count().label("user_count"))
+        .group_by(user_account_table.c.team_id)
+        .subquery("member_counts")
+    )
+    project_counts = (
+        select(project_table.c.company_id, func.count().label("project_count"))
+        .group_by(project_table.c.company_id)
+        .subquery("project_counts")
+    )
+    owner_name = (
+        select(user_account_table.c.display_name)
+        .where(user_account_table.c.team_id == company_table.c.id, user_account_table.c.role == UserAccount.Role.OWNER.value)
+        .limit(1)
+        .scalar_subquery()
+    )
+    user_count = func.coalesce(member_counts.c.user_count, 0)
+    statement = (
+        select(
+            company_table.c.id.label("team_id"),
+            company_table.c.name.label("team_name"),
+            company_table.c.join_code,
+            user_count.label("user_count"),
+            func.coalesce(project_counts.c.project_count, 0).label("project_count"),
+            company_table.c.note_count,
+            company_table.c.file_count,
+            company_table.c.last_activity_at,
+            owner_name.label("owner_name"),
+        )
+        .select_from(
+            company_table.outerjoin(member_counts, member_counts.c.team_id == company_table.c.id).outerjoin(
+                project_counts, project_counts.c.company_id == company_table.c.id
+            )
+        )
+        .order_by(user_count.desc(), company_table.c.name)
+    )
+    if limit:
+        statement = statement.limit(limit)
+
+    rows = fetch_core_rows(statement)
+    for row in rows:
+        row["last_activity_at"] = _iso(row["last_activity_at"])
+    return rows
+
+
+def project_activity(limit: int = 20, days: int = 30) -> list[dict]:
+    """Most recently active projects with their note totals and notes created in the last `days` days."""
+    since = _db_timestamp(datetime.now(timezone.utc) - timedelta(days=days))
+    recent_notes = (
+        select(research_note_table.c.project_id, func.count().label("recent_notes"))
+        .where(research_note_table.c.created_at >= since)
+        .group_by(research_note_table.c.project_id)
+        .subquery("recent_notes")
+    )
+    statement = (
+        select(
+            project_table.c.id.label("project_id"),
+            project_table.c.name,
+            project_table.c.status,
+            company_table.c.name.label("team_name"),
+            project_table.c.note_count,
+            project_table.c.file_count,
+            func.coalesce(recent_notes.c.recent_notes, 0).label("recent_notes"),
+            project_table.c.last_activity_at,
+        )
+        .select_from(
+            project_table.outerjoin(company_table, company_table.c.id == project_table.c.company_id).outerjoin(
+                recent_notes, recent_notes.c.project_id == project_table.c.id
+            )
+        )
+        .order_by(project_table.c.last_activity_at.is_(None), project_table.c.last_activity_at.desc(), project_table.c.name)
+        .limit(limit)
+    )
+
+    rows = fetch_core_rows(statement)
+    for row in rows:
+        # UUID primary keys are stored as 32-character hex text in SQLite.
+        row["project_id"] = str(uuid.UUID(str(row["project_id"])))
+        row["last_activity_at"] = _iso(row["last_activity_at"])
+    return rows
+
+
+def data_update_history(limit: int = 20) -> dict:
+    """Data update/export job totals per status plus the latest jobs."""
+    by_status = (
+        select(
+            data_update_table.c.status,
+            func.count().label("count"),
+            func.max(data_update_table.c.updated_at).label("last_updated_at"),
+        )
+        .group_by(data_update_table.c.status)
+        .order_by(data_update_table.c.status)
+    )
+    recent = (
+        select(data_update_table.c.id, data_update_table.c.target, data_update_table.c.status, data_update_table.c.updated_at)
+        .order_by(data_update_table.c.updated_at.desc(), data_update_table.c.id.desc())
+        .limit(limit)
+    )
+
+    status_rows = fetch_core_rows(by_status)
+    for row in status_rows:
+        row["last_updated_at"] = _iso(row["last_updated_at"])
+    recent_rows = [
+        {"id": f"upd-{row['id']}", "target": row["target"], "status": row["status"], "updated_at": _iso(row["updated_at"])}
+        for row in fetch_core_rows(recent)
+    ]
+    return {"by_status": status_rows, "recent": recent_rows}
+
+
+def admin_report(limit: int = 20) -> dict:
+    return {
+        "teams": team_stats(),
+        "projects": project_activity(limit=limit),
+        "data_updates": data_update_history(limit=limit),
+    }
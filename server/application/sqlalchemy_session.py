@@ -1,28 +1,111 @@
+import threading
 from pathlib import Path
 
 from django.conf import settings
 from django.db import connection
-from sqlalchemy import create_engine, text
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.dialects import sqlite
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import QueuePool
+
+from server.application.sqlite_tuning import DEFAULT_SQLITE_PRAGMAS, sqlite_pragma_statements
+
+_ENGINE_LOCK = threading.Lock()
+_ENGINES: dict[str, Engine] = {}
+_SESSION_FACTORIES: dict[str, sessionmaker[Session]] = {}
+# Django's SQLite cursor expects "format" placeholders (%s), so Core statements are compiled for it.
+_DJANGO_CURSOR_DIALECT = sqlite.dialect(paramstyle="format")
 
 
 def sqlalchemy_database_url() -> str:
     db_name = connection.settings_dict.get("NAME") or settings.DATABASES["default"]["NAME"]
+    if str(db_name).startswith("file:"):
+        # URI-style names (the shared in-memory test database) need uri=true for pysqlite.
+        separator = "&" if "?" in str(db_name) else "?"
+        return f"sqlite:///{db_name}{separator}uri=true"
     db_path = Path(db_name)
     return f"sqlite:///{db_path}"
 
 
-def sqlalchemy_engine():
-    return create_engine(sqlalchemy_database_url(), future=True)
+def _apply_engine_pragmas(dbapi_connection, _connection_record) -> None:
+    if not getattr(settings, "SQLITE_PERFORMANCE_PROFILE", False):
+        return
+    pragmas = getattr(settings, "SQLITE_PRAGMAS", DEFAULT_SQLITE_PRAGMAS)
+    cursor = dbapi_connection.cursor()
+    try:
+        for statement in sqlite_pragma_statements(pragmas):
+            cursor.execute(statement)
+    finally:
+        cursor.close()
+
+
+def _create_engine(url: str) -> Engine:
+    engine = create_engine(
+        url,
+        future=True,
+        poolclass=QueuePool,
+        pool_size=getattr(settings, "SQLALCHEMY_POOL_SIZE", 5),
+        max_overflow=getattr(settings, "SQLALCHEMY_MAX_OVERFLOW", 5),
+        pool_pre_ping=True,
+        connect_args={"check_same_thread": False},
+    )
+    event.listen(engine, "connect", _apply_engine_pragmas)
+    return engine
+
+
+def sqlalchemy_engine() -> Engine:
+    """Return the process-wide pooled engine for the current database, creating it on first use."""
+    url = sqlalchemy_database_url()
+    engine = _ENGINES.get(url)
+    if engine is None:
+        with _ENGINE_LOCK:
+            engine = _ENGINES.get(url)
+            if engine is None:
+                engine = _ENGINES[url] = _create_engine(url)
+    return engine
 
 
 def sqlalchemy_session_factory() -> sessionmaker[Session]:
-    return sessionmaker(bind=sqlalchemy_engine(), autoflush=False, autocommit=False, future=True)
+    url = sqlalchemy_database_url()
+    factory = _SESSION_FACTORIES.get(url)
+    if factory is None:
+        with _ENGINE_LOCK:
+            factory = _SESSION_FACTORIES.get(url)
+            if factory is None:
+                factory = _SESSION_FACTORIES[url] = sessionmaker(bind=sqlalchemy_engine(), autoflush=False, autocommit=False, future=True)
+    return factory
+
+
+def dispose_sqlalchemy_engines() -> None:
+    with _ENGINE_LOCK:
+        for engine in _ENGINES.values():
+            engine.dispose()
+        _ENGINES.clear()
+        _SESSION_FACTORIES.clear()
+
+
+def _uses_django_connection() -> bool:
+    # In-memory databases (the test database) are private to Django's connection.
+    return connection.vendor != "sqlite" or connection.is_in_memory_db()
+
+
+def fetch_core_rows(statement) -> list[dict]:
+    """Execute a SQLAlchemy Core select and return its rows as dicts."""
+    if _uses_django_connection():
+        compiled = statement.compile(dialect=_DJANGO_CURSOR_DIALECT)
+        params = [compiled.params[name] for name in compiled.positiontup or []]
+        with connection.cursor() as cursor:
+            cursor.execute(str(compiled), params)
+            columns = [column[0] for column in cursor.description]
+            return [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+    with sqlalchemy_engine().connect() as conn:
+        return [dict(row._mapping) for row in conn.execute(statement)]
 
 
 def sqlalchemy_table_names() -> list[str]:
-    db_name = connection.settings_dict.get("NAME")
-    if db_name == ":memory:":
+    if _uses_django_connection():
         with connection.cursor() as cursor:
             cursor.execute("SELECT name FROM sqlite_master WHERE type='table' ORDER BY name")
             return [row[0] for row in cursor.fetchall()]
@@ -0,0 +1,101 @@
+from django.conf import settings
+from django.core.checks import Tags, Warning, register
+from django.db import connections
+
+DEFAULT_SQLITE_PRAGMAS = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "busy_timeout": 5000,
+    "mmap_size": 256 * 1024 * 1024,
+    "cache_size": -64 * 1024,
+    "temp_store": "MEMORY",
+}
+# PRAGMA 조회 결과는 숫자 코드로 돌아오므로 설정값과 비교할 때 이름으로 되돌린다.
+_PRAGMA_VALUE_NAMES = {
+    "synchronous": {0: "OFF", 1: "NORMAL", 2: "FULL", 3: "EXTRA"},
+    "temp_store": {0: "DEFAULT", 1: "FILE", 2: "MEMORY"},
+}
+_FILE_ONLY_PRAGMAS = {"journal_mode", "mmap_size"}
+DEFAULT_SQLITE_TRANSACTION_MODE = "IMMEDIATE"
+
+
+def sqlite_pragma_statements(pragmas: dict, in_memory: bool = False) -> list[str]:
+    statements = []
+    for name, value in pragmas.items():
+        if value in (None, "") or (in_memory and name in _FILE_ONLY_PRAGMAS):
+            continue
+        statements.append(f"PRAGMA {name}={value}")
+    return statements
+
+
+def apply_sqlite_pragmas(sender, connection, **kwargs) -> None:
+    """connection_created receiver applying SQLITE_PRAGMAS to every new SQLite connection."""
+    if connection.vendor != "sqlite" or not getattr(settings, "SQLITE_PERFORMANCE_PROFILE", False):
+        return
+    pragmas = getattr(settings, "SQLITE_PRAGMAS", DEFAULT_SQLITE_PRAGMAS)
+    raw_connection = connection.connection
+    for statement in sqlite_pragma_statements(pragmas, in_memory=connection.is_in_memory_db()):
+        raw_connection.execute(statement)
+
+
+def effective_sqlite_pragmas(alias: str = "default") -> dict:
+    connection = connections[alias]
+    pragmas = getattr(settings, "SQLITE_PRAGMAS", DEFAULT_SQLITE_PRAGMAS)
+    effective = {}
+    with connection.cursor() as cursor:
+        for name in pragmas:
+            cursor.execute(f"PRAGMA {name}")
+            row = cursor.fetchone()
+            value = row[0] if row else None
+            effective[name] = _PRAGMA_VALUE_NAMES.get(name, {}).get(value, value)
+    return effective
+
+
+def sqlite_pragma_report(alias: str = "default") -> dict:
+    connection = connections[alias]
+    if connection.vendor != "sqlite":
+        return {"alias": alias, "vendor": connection.vendor, "pragmas": {}}
+
+    configured = getattr(settings, "SQLITE_PRAGMAS", DEFAULT_SQLITE_PRAGMAS)
+    effective = effective_sqlite_pragmas(alias)
+    in_memory = connection.is_in_memory_db()
+    rows = {}
+    for name, expected in configured.items():
+        actual = effective.get(name)
+        skipped = in_memory and name in _FILE_ONLY_PRAGMAS
+        rows[name] = {
+            "configured": expected,
+            "effective": actual,
+            "matches": skipped or str(actual).upper() == str(expected).upper(),
+        }
+    return {
+        "alias": alias,
+        "vendor": "sqlite",
+        "enabled": bool(getattr(settings, "SQLITE_PERFORMANCE_PROFILE", False)),
+        "in_memory": in_memory,
+        "transaction_mode": str(connection.settings_dict.get("OPTIONS", {}).get("transaction_mode") or "DEFERRED").upper(),
+        "pragmas": rows,
+    }
+
+
+@register(Tags.database)
+def check_sqlite_performance_profile(app_configs=None, databases=None, **kwargs) -> list:
+    if not getattr(settings, "SQLITE_PERFORMANCE_PROFILE", False):
+        return []
+
+    messages = []
+    for alias in databases or []:
+        report = sqlite_pragma_report(alias)
+        mismatched = {name: row for name, row in report["pragmas"].items() if not row["matches"]}
+        if report.get("transaction_mode", DEFAULT_SQLITE_TRANSACTION_MODE) != DEFAULT_SQLITE_TRANSACTION_MODE:
+            mismatched["transaction_mode"] = {"effective": report["transaction_mode"], "configured": DEFAULT_SQLITE_TRANSACTION_MODE}
+        if mismatched:
+            detail = ", ".join(f"{name}={row['effective']} (expected {row['configured']})" for name, row in mismatched.items())
+            messages.append(
+                Warning(
+                    f"SQLite performance profile is not fully applied on '{alias}': {detail}",
+                    hint="Check SQLITE_* settings and that the database file is writable.",
+                    id="workflow_app.W001",
+                )
+            )
+    return messages
@@ -1,67 +1,85 @@
 import json
 import os
-from functools import wraps
+from collections import defaultdict
+from functools import partial, wraps
+from io import BytesIO
 from pathlib import Path
 
-from django.contrib.auth.hashers import check_password, make_password
+from asgiref.sync import iscoroutinefunction, sync_to_async
+from django.conf import settings
+from django.contrib.auth.hashers import check_password
+from django.core.cache import caches
 from django.db import connection
 from django.db.utils import OperationalError, ProgrammingError
-from django.db.models import Count, OuterRef, Subquery
-from django.http import JsonResponse
+from django.http import FileResponse, JsonResponse
 from django.shortcuts import redirect
+from django.utils.functional import SimpleLazyObject
 
+from server.application import reporting
 from server.domains.admin import AdminRepository
-from server.domains.admin.models import SuperAdminAccount, Team, UserAccount
+from server.domains.admin.repository import SUPER_ADMIN_SEED_CACHE_KEY
+from server.domains.admin.models import SuperAdminAccount, UserAccount
 from server.domains.data_updates import DataUpdateRepository
 from server.domains.projects import ProjectRepository, ProjectService
-from server.domains.projects.models import Project
-from server.domains.research_notes import ResearchNoteRepository
-from server.domains.research_notes.models import ResearchNote
+from server.domains.research_notes import ResearchNoteRepository, ResearchNoteSearchIndex, ResearchNoteTextExtractor
 from server.domains.researchers import ResearcherRepository
 from server.domains.signatures import SignatureRepository
+from server.domains.stats import StatsRepository
 
 admin_repository = AdminRepository()
 project_repository = ProjectRepository()
 researcher_repository = ResearcherRepository()
 research_note_repository = ResearchNoteRepository()
+research_note_search_index = ResearchNoteSearchIndex()
+research_note_text_extractor = ResearchNoteTextExtractor(research_note_repository, research_note_search_index)
 data_update_repository = DataUpdateRepository()
 signature_repository = SignatureRepository()
+stats_repository = StatsRepository()
 project_service = ProjectService(project_repository)
 SUPER_ADMIN_JSON_PATH = Path(__file__).resolve().parent.parent / "super_admin_accounts.json"
+REQUEST_PROFILE_ATTR = "_projectnote_user_profile"
+SESSION_PROFILE_FIELDS = (
+    "id",
+    "username",
+    "name",
+    "role",
+    "email",
+    "organization",
+    "major",
+    "team",
+    "team_id",
+    "is_super_admin",
+    "is_approved",
+)
 
 
 def dashboard_counts() -> dict:
-    return {
-        "teams": Team.objects.count(),
-        "projects": Project.objects.count(),
-        "researchers": UserAccount.objects.count(),
-        "notes": ResearchNote.objects.count(),
-    }
+    return stats_repository.dashboard_counts()
 
 def organization_user_stats(limit: int | None = None) -> list[dict]:
-    owner_display_name = UserAccount.objects.filter(team=OuterRef("pk"), role=UserAccount.Role.OWNER).values("display_name")[:1]
-    teams = Team.objects.annotate(
-        user_count=Count("members"),
-        owner_name=Subquery(owner_display_name),
-    ).order_by("-user_count", "name")
-    if limit:
-        teams = teams[:limit]
+    teams = reporting.team_stats(limit)
+
+    members_by_team: dict[int, list[dict]] = defaultdict(list)
+    approved_members = (
+        UserAccount.objects.filter(team_id__in=[team["team_id"] for team in teams], is_approved=True)
+        .order_by("display_name")
+        .values("id", "display_name", "role", "team_id")
+    )
+    for member in approved_members:
+        team_id = member.pop("team_id")
+        members_by_team[team_id].append(member)
 
     stats = []
     for team in teams:
-        members = list(
-            UserAccount.objects.filter(team_id=team.id, is_approved=True)
-            .order_by("display_name")
-            .values("id", "display_name", "role")
-        )
+        members = members_by_team.get(team["team_id"], [])
         owner_member = next((member for member in members if member["role"] == UserAccount.Role.OWNER), None)
         stats.append(
             {
-                "team_id": team.id,
-                "team_name": team.name,
-                "user_count": team.user_count,
-                "join_code": team.join_code,
-                "owner_name": team.owner_name or "미지정",
+                "team_id": team["team_id"],
+                "team_name": team["team_name"],
+                "user_count": team["user_count"],
+                "join_code": team["join_code"],
+                "owner_name": team["owner_name"] or "미지정",
                 "owner_user_id": owner_member["id"] if owner_member else None,
                 "members": members,
             }
@@ -84,6 +102,15 @@ def organization_user_stats(limit: int | None = None) -> list[dict]:
 
 
 def effective_user_profile(request) -> dict | None:
+    if hasattr(request, REQUEST_PROFILE_ATTR):
+        return getattr(request, REQUEST_PROFILE_ATTR)
+
+    profile = _resolve_user_profile(request)
+    setattr(request, REQUEST_PROFILE_ATTR, profile)
+    return profile
+
+
+def _resolve_user_profile(request) -> dict | None:
     if not request.user.is_authenticated:
         return request.session.get("user_profile")
 
@@ -92,43 +119,103 @@ def effective_user_profile(request) -> dict | None:
         profile = admin_repository.find_super_admin_profile_by_username(request.user.username)
 
     if profile:
-        existing = request.session.get("user_profile", {})
-        if existing.get("signature_data_url"):
-            profile["signature_data_url"] = existing["signature_data_url"]
-        request.session["user_profile"] = profile
+        session_profile = _session_profile(profile)
+        if request.session.get("user_profile") != session_profile:
+            request.session["user_profile"] = session_profile
         return profile
 
     return request.session.get("user_profile")
 
+
+def clear_request_user_profile(request) -> None:
+    if hasattr(request, REQUEST_PROFILE_ATTR):
+        delattr(request, REQUEST_PROFILE_ATTR)
+
 def page_context(request, extra: dict | None = None) -> dict:
     context = {
         "current_user": effective_user_profile(request)
         or {
             "name": "게스트",
             "role": "관리자",
-        }
+        },
+        "fragment_cache_timeout": settings.FRAGMENT_CACHE_TIMEOUT,
     }
     if extra:
         context.update(extra)
     return context
 
 
+def deferred(func, *args, **kwargs) -> SimpleLazyObject:
+    """Page context value computed on first use, so a cache hit on the {% cache %} block that
+    renders it skips the queries entirely."""
+    return SimpleLazyObject(partial(func, *args, **kwargs))
+
+
+def _login_required_redirect(request):
+    user_profile = effective_user_profile(request)
+
+    if not request.user.is_authenticated and not user_profile:
+        next_url = request.get_full_path()
+        return redirect(f"/login?next={next_url}")
+
+    if (user_profile and user_profile.get("is_super_admin")) or request.user.is_staff or request.user.is_superuser:
+        return redirect("/frontend/admin/dashboard")
+    return None
+
+
 def login_required_page(view_func):
-    @wraps(view_func)
-    def _wrapped(request, *args, **kwargs):
-        user_profile = effective_user_profile(request)
+    if iscoroutinefunction(view_func):
 
-        if not request.user.is_authenticated and not user_profile:
-            next_url = request.get_full_path()
-            return redirect(f"/login?next={next_url}")
+        @wraps(view_func)
+        async def _async_wrapped(request, *args, **kwargs):
+            # The session profile and request.user are loaded lazily from the database.
+            response = await sync_to_async(_login_required_redirect)(request)
+            if response is not None:
+                return response
+            return await view_func(request, *args, **kwargs)
 
-        if (user_profile and user_profile.get("is_super_admin")) or request.user.is_staff or request.user.is_superuser:
-            return redirect("/frontend/admin/dashboard")
+        return _async_wrapped
+
+    @wraps(view_func)
+    def _wrapped(request, *args, **kwargs):
+        response = _login_required_redirect(request)
+        if response is not None:
+            return response
         return view_func(request, *args, **kwargs)
 
     return _wrapped
 
 
+class StreamingFileResponse(FileResponse):
+    """FileResponse that keeps streaming in chunks when served over ASGI.
+
+    Django consumes a plain FileResponse under ASGI with ``sync_to_async(list)``, holding the
+    whole file in memory and a worker thread until it is read. Here chunks are read one at a
+    time off the event loop instead; WSGI servers still use ``wsgi.file_wrapper`` as before.
+    """
+
+    block_size = 64 * 1024
+
+    async def __aiter__(self):
+        filelike = self.file_to_stream
+        if filelike is None:
+            async for part in super().__aiter__():
+                yield part
+            return
+        if isinstance(filelike, BytesIO):
+            while chunk := filelike.read(self.block_size):
+                yield chunk
+            return
+        read = sync_to_async(filelike.read, thread_sensitive=False)
+        while chunk := await read(self.block_size):
+            yield chunk
+
+
+def is_super_admin_request(request) -> bool:
+    user_profile = effective_user_profile(request)
+    return bool((user_profile or {}).get("is_super_admin", False)) or request.user.is_staff or request.user.is_superuser
+
+
 def admin_required_page(view_func):
     @wraps(view_func)
     def _wrapped(request, *args, **kwargs):
@@ -137,8 +224,7 @@ def admin_required_page(view_func):
             next_url = request.get_full_path()
             return redirect(f"/admin/login?next={next_url}")
 
-        is_super_admin = bool((user_profile or {}).get("is_super_admin", False)) or request.user.is_staff or request.user.is_superuser
-        if not is_super_admin:
+        if not is_super_admin_request(request):
             next_url = request.get_full_path()
             return redirect(f"/admin/login?next={next_url}")
         return view_func(request, *args, **kwargs)
@@ -146,21 +232,23 @@ def admin_required_page(view_func):
     return _wrapped
 
 
+def _session_profile(profile: dict) -> dict:
+    # Only small identity fields live in the session so it fits a signed cookie; large values
+    # such as signature images are read from their repositories when a page needs them.
+    return {field: profile.get(field) for field in SESSION_PROFILE_FIELDS}
+
+
 def save_login_session(request, username: str, user: dict) -> None:
-    request.session["user_profile"] = {
-        "id": user.get("id"),
-        "username": username,
-        "name": user["name"],
-        "role": user["role"],
-        "email": user["email"],
-        "organization": user["organization"],
-        "major": user["major"],
-        "team": user.get("team", "-"),
-        "team_id": user.get("team_id"),
-        "is_super_admin": bool(user.get("is_super_admin", False)),
-        "is_approved": bool(user.get("is_approved", True)),
-        "signature_data_url": request.session.get("user_profile", {}).get("signature_data_url", ""),
-    }
+    clear_request_user_profile(request)
+    request.session["user_profile"] = _session_profile(
+        {
+            **user,
+            "username": username,
+            "team": user.get("team", "-"),
+            "is_super_admin": bool(user.get("is_super_admin", False)),
+            "is_approved": bool(user.get("is_approved", True)),
+        }
+    )
 
 
 def json_uuid_validation_error(field: str, raw_input: str) -> JsonResponse:
@@ -202,31 +290,24 @@ def _load_super_admin_users() -> dict[str, dict[str, str]]:
     }
 
 
-def _sync_super_admin_accounts() -> None:
+def sync_super_admin_accounts(force: bool = False) -> int:
+    """Sync the JSON seed into SuperAdminAccount and flag this process as synced.
+
+    Runs after migrate/flush and from `manage.py sync_super_admins`; logins only trigger it when no
+    sync has been recorded yet, so they never re-read the seed file or re-hash seed passwords.
+    """
     if not _super_admin_table_exists():
-        return
-
-    for username, user in _load_super_admin_users().items():
-        try:
-            raw_or_hashed_password = user.get("password", "")
-            normalized_password = (
-                raw_or_hashed_password
-                if str(raw_or_hashed_password).startswith("pbkdf2_")
-                else make_password(raw_or_hashed_password)
-            )
-            SuperAdminAccount.objects.update_or_create(
-                username=username,
-                defaults={
-                    "display_name": user.get("name", username),
-                    "email": user.get("email", f"{username}@projectnote.local"),
-                    "password": normalized_password,
-                    "organization": user.get("organization", "ProjectNote"),
-                    "major": user.get("major", "관리"),
-                    "is_active": True,
-                },
-            )
-        except (OperationalError, ProgrammingError):
-            return
+        return 0
+
+    users = _load_super_admin_users()
+    try:
+        written = admin_repository.sync_super_admin_seed(users, force=force)
+    except (OperationalError, ProgrammingError):
+        return 0
+    # A plain flag in the cache every worker shares: per-account digests in SuperAdminAccount
+    # already detect seed changes on the next sync.
+    caches["shared"].set(SUPER_ADMIN_SEED_CACHE_KEY, True, None)
+    return written
 
 
 def _super_admin_table_exists() -> bool:
@@ -258,11 +339,14 @@ def _authenticate_super_admin_from_seed_data(username: str, password: str) -> di
 
 
 def authenticate_super_admin(username: str, password: str) -> dict[str, str] | None:
-    if not _super_admin_table_exists():
-        return _authenticate_super_admin_from_seed_data(username, password)
-
-    _sync_super_admin_accounts()
     try:
-        return admin_repository.find_super_admin_for_login(username, password)
+        if not caches["shared"].get(SUPER_ADMIN_SEED_CACHE_KEY):
+            sync_super_admin_accounts()
+        user = admin_repository.find_super_admin_for_login(username, password)
+        if user is None and not SuperAdminAccount.objects.exists():
+            # Emptied after the flag was set (flush, or a truncate the flag did not hear about).
+            sync_super_admin_accounts()
+            user = admin_repository.find_super_admin_for_login(username, password)
+        return user
     except (OperationalError, ProgrammingError):
         return _authenticate_super_admin_from_seed_data(username, password)
@@ -0,0 +1 @@
+"""Runnable performance benchmarks (python -m server.benchmarks.<name>)."""
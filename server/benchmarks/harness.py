@@ -0,0 +1,112 @@
+"""Shared plumbing for the Django-level benchmarks: a throwaway database, timed samples and
+JSON results that can be compared against a stored baseline."""
+
+import json
+import os
+import resource
+import statistics
+import sys
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+
+def setup_django() -> None:
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "server.config.settings")
+    import django
+
+    django.setup()
+
+
+@contextmanager
+def django_test_database() -> Iterator[None]:
+    """Create and migrate a test database for the duration of the block, like the test runner."""
+    setup_django()
+    from django.db import connection
+    from django.test.utils import setup_test_environment, teardown_test_environment
+
+    setup_test_environment()
+    old_name = connection.creation.create_test_db(verbosity=0, keepdb=False)
+    try:
+        yield
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+        teardown_test_environment()
+
+
+def peak_rss_mb() -> float:
+    # ru_maxrss is reported in KiB on Linux and in bytes on macOS.
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+def measure(name: str, request: Callable[[], object], repeat: int, before_each: Callable[[], None] | None = None) -> dict:
+    """Run `request` `repeat` times and report latency, query count and peak RSS growth."""
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+
+    latencies: list[float] = []
+    queries: list[int] = []
+    statuses: dict[str, int] = {}
+    rss_before = peak_rss_mb()
+    for _ in range(repeat):
+        if before_each:
+            before_each()
+        with CaptureQueriesContext(connection) as captured:
+            started = time.perf_counter()
+            response = request()
+            latencies.append((time.perf_counter() - started) * 1000)
+        queries.append(len(captured))
+        status = str(getattr(response, "status_code", "-"))
+        statuses[status] = statuses.get(status, 0) + 1
+
+    ordered = sorted(latencies)
+    return {
+        "name": name,
+        "samples": repeat,
+        "statuses": statuses,
+        "latency_ms": {
+            "p50": round(statistics.median(ordered), 2),
+            "p95": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))], 2),
+            "max": round(ordered[-1], 2),
+            "mean": round(statistics.fmean(ordered), 2),
+        },
+        "queries": {"min": min(queries), "max": max(queries)},
+        "peak_rss_mb": peak_rss_mb(),
+        "peak_rss_growth_mb": round(peak_rss_mb() - rss_before, 1),
+    }
+
+
+def compare_with_baseline(result: dict, baseline: dict, tolerance: float) -> list[dict]:
+    """Scenario-by-scenario p50 latency and max query count against a baseline result."""
+    previous = {scenario["name"]: scenario for scenario in baseline.get("scenarios", [])}
+    comparison = []
+    for scenario in result.get("scenarios", []):
+        old = previous.get(scenario["name"])
+        if not old:
+            continue
+        old_p50 = old["latency_ms"]["p50"]
+        latency_ratio = round(scenario["latency_ms"]["p50"] / old_p50, 3) if old_p50 else None
+        comparison.append(
+            {
+                "name": scenario["name"],
+                "p50_ms": scenario["latency_ms"]["p50"],
+                "baseline_p50_ms": old_p50,
+                "latency_ratio": latency_ratio,
+                "queries": scenario["queries"]["max"],
+                "baseline_queries": old["queries"]["max"],
+                "regression": bool(
+                    (latency_ratio is not None and latency_ratio > 1 + tolerance)
+                    or scenario["queries"]["max"] > old["queries"]["max"]
+                ),
+            }
+        )
+    return comparison
+
+
+def write_result(result: dict, output: Path | None) -> None:
+    payload = json.dumps(result, ensure_ascii=False, indent=2)
+    if output:
+        output.write_text(payload, encoding="utf-8")
+    print(payload)
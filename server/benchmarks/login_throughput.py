@@ -0,0 +1,86 @@
+"""Measure sequential /login throughput and how many password hashes each login computes.
+
+    python -m server.benchmarks.login_throughput --users 20 --logins 100
+"""
+
+import argparse
+import time
+from pathlib import Path
+
+from server.benchmarks.harness import django_test_database, write_result
+
+
+def _count_hashes():
+    from django.contrib.auth.hashers import get_hashers
+
+    counter = {"hashes": 0}
+    for hasher in get_hashers():
+        original = hasher.encode
+
+        def counting_encode(*args, _original=original, **kwargs):
+            counter["hashes"] += 1
+            return _original(*args, **kwargs)
+
+        hasher.encode = counting_encode
+    return counter
+
+
+def _seed_users(count: int, password: str) -> list[str]:
+    from django.contrib.auth.hashers import make_password
+
+    from server.domains.admin.models import Team, UserAccount
+
+    team = Team.objects.create(name="벤치마크팀", description="login benchmark", join_code="900900")
+    encoded = make_password(password)
+    UserAccount.objects.bulk_create(
+        [
+            UserAccount(
+                username=f"bench-user-{index}",
+                display_name=f"벤치마크{index}",
+                email=f"bench-user-{index}@example.com",
+                password=encoded,
+                role=UserAccount.Role.MEMBER,
+                team=team,
+                is_approved=True,
+            )
+            for index in range(count)
+        ]
+    )
+    return [f"bench-user-{index}" for index in range(count)]
+
+
+def run(users: int = 20, logins: int = 100, password: str = "bench-pass-1234") -> dict:
+    with django_test_database():
+        from django.test import Client
+
+        usernames = _seed_users(users, password)
+        counter = _count_hashes()
+        statuses: dict[str, int] = {}
+        started = time.perf_counter()
+        for index in range(logins):
+            response = Client().post("/login", {"username": usernames[index % len(usernames)], "password": password})
+            statuses[str(response.status_code)] = statuses.get(str(response.status_code), 0) + 1
+        elapsed = time.perf_counter() - started
+
+    return {
+        "users": users,
+        "logins": logins,
+        "statuses": statuses,
+        "elapsed_seconds": round(elapsed, 4),
+        "logins_per_second": round(logins / elapsed, 1) if elapsed else 0.0,
+        "password_hashes_per_login": round(counter["hashes"] / logins, 2) if logins else 0.0,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=20)
+    parser.add_argument("--logins", type=int, default=100)
+    parser.add_argument("--output", type=Path, help="write the JSON result to this file")
+    args = parser.parse_args()
+
+    write_result(run(args.users, args.logins), args.output)
+
+
+if __name__ == "__main__":
+    main()
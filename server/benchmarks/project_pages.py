@@ -0,0 +1,125 @@
+"""End-to-end latency, query count and peak RSS of project export, print and page views at scale.
+
+    python -m server.benchmarks.project_pages --notes 50 --files 2 --repeat 5 --output result.json
+    python -m server.benchmarks.project_pages --baseline result.json --fail-on-regression
+
+The dataset comes from `seed_scale_data` with real PDF and PNG files, written to a throwaway
+test database and a temporary storage root, so nothing touches projectnote.db or the
+configured research note storage.
+"""
+
+import argparse
+import json
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+from server.benchmarks.harness import compare_with_baseline, django_test_database, measure, write_result
+
+BENCH_USERNAME = "scale-user-00001"
+BENCH_PASSWORD = "bench-pass-1234"
+
+
+def _get(client, url: str):
+    response = client.get(url)
+    if getattr(response, "streaming", False):
+        b"".join(response.streaming_content)
+    return response
+
+
+def run(
+    projects: int = 1,
+    notes: int = 20,
+    files: int = 2,
+    image_ratio: float = 0.5,
+    pdf_pages: int = 2,
+    repeat: int = 5,
+    seed: int = 42,
+) -> dict:
+    with tempfile.TemporaryDirectory() as temp_dir, django_test_database():
+        from django.test import Client, override_settings
+
+        from server.application.mock_data import seed_scale_data
+        from server.domains.projects.models import Project
+
+        storage_root = Path(temp_dir)
+        with override_settings(RESEARCH_NOTES_STORAGE_ROOT=str(storage_root)):
+            # One team, so the logged-in team owner is a member of every generated project.
+            dataset = seed_scale_data(
+                teams=1,
+                users=5,
+                projects=projects,
+                notes_per_project=notes,
+                files_per_note=files,
+                seed=seed,
+                image_ratio=image_ratio,
+                write_files=True,
+                pdf_pages=pdf_pages,
+                password=BENCH_PASSWORD,
+            )
+            client = Client()
+            login = client.post("/login", {"username": BENCH_USERNAME, "password": BENCH_PASSWORD})
+            if login.status_code != 302:
+                raise RuntimeError(f"benchmark login failed with HTTP {login.status_code}")
+
+            project_id = str(Project.objects.order_by("code").values_list("id", flat=True)[0])
+            export_url = f"/api/v1/projects/{project_id}/research-notes/export-pdf"
+            pdf_cache = storage_root / "_pdf_cache"
+            scenarios = [
+                measure(
+                    "export_pdf_cold",
+                    lambda: _get(client, export_url),
+                    repeat,
+                    before_each=lambda: shutil.rmtree(pdf_cache, ignore_errors=True),
+                ),
+            ]
+            _get(client, export_url)
+            scenarios.append(measure("export_pdf_warm", lambda: _get(client, export_url), repeat))
+            for name, url in (
+                ("print_page", f"/frontend/projects/{project_id}/research-notes/print"),
+                ("project_detail_page", f"/frontend/projects/{project_id}"),
+                ("project_research_notes_page", f"/frontend/projects/{project_id}/research-notes"),
+                ("projects_list_api", "/api/v1/projects"),
+                ("research_notes_list_api", "/api/v1/research-notes"),
+            ):
+                scenarios.append(measure(name, lambda url=url: _get(client, url), repeat))
+
+    config = {
+        "projects": projects,
+        "notes_per_project": notes,
+        "files_per_note": files,
+        "image_ratio": image_ratio,
+        "pdf_pages": pdf_pages,
+        "repeat": repeat,
+        "seed": seed,
+    }
+    return {"config": config, "dataset": dataset, "scenarios": scenarios}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--projects", type=int, default=1)
+    parser.add_argument("--notes", type=int, default=20, help="notes per project")
+    parser.add_argument("--files", type=int, default=2, help="files per note")
+    parser.add_argument("--image-ratio", type=float, default=0.5, help="share of PNG files, the rest are PDFs")
+    parser.add_argument("--pdf-pages", type=int, default=2)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", type=Path, help="write the JSON result to this file")
+    parser.add_argument("--baseline", type=Path, help="compare against a previous JSON result")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="allowed p50 slowdown before flagging a regression")
+    parser.add_argument("--fail-on-regression", action="store_true")
+    args = parser.parse_args()
+
+    result = run(args.projects, args.notes, args.files, args.image_ratio, args.pdf_pages, args.repeat, args.seed)
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        result["comparison"] = compare_with_baseline(result, baseline, args.tolerance)
+    write_result(result, args.output)
+    if args.fail_on_regression and any(item["regression"] for item in result.get("comparison", [])):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""Compare SQLite write/read concurrency with stock settings and the tuned pragma profile.
+
+Writers read a row and then update it, like a Django view inside atomic(). "tuned_deferred"
+keeps the tuned PRAGMAs but begins transactions DEFERRED, showing the read-to-write lock
+upgrades that fail immediately whatever busy_timeout is; "tuned" begins them IMMEDIATE, as
+the Django connection does (SQLITE_TRANSACTION_MODE).
+
+    python -m server.benchmarks.sqlite_concurrency --writers 8 --readers 8 --ops 200
+"""
+
+import argparse
+import json
+import sqlite3
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from server.application.sqlite_tuning import DEFAULT_SQLITE_PRAGMAS, DEFAULT_SQLITE_TRANSACTION_MODE, sqlite_pragma_statements
+
+STOCK_PRAGMAS = {"journal_mode": "DELETE", "synchronous": "FULL"}
+
+
+def _prepare(db_path: Path, pragmas: dict) -> None:
+    with sqlite3.connect(db_path) as conn:
+        for statement in sqlite_pragma_statements(pragmas):
+            conn.execute(statement)
+        conn.execute("CREATE TABLE IF NOT EXISTS bench_session (id INTEGER PRIMARY KEY, payload TEXT, touched REAL)")
+        conn.executemany("INSERT INTO bench_session (payload, touched) VALUES (?, ?)", [("x" * 200, time.time())] * 1000)
+
+
+def _run_profile(
+    name: str, pragmas: dict, transaction_mode: str, writers: int, readers: int, ops: int, timeout: float, think: float
+) -> dict:
+    with tempfile.TemporaryDirectory() as temp_dir:
+        db_path = Path(temp_dir) / "bench.db"
+        _prepare(db_path, pragmas)
+        lock = threading.Lock()
+        stats = {"writes": 0, "reads": 0, "locked_errors": 0}
+
+        def _connect() -> sqlite3.Connection:
+            conn = sqlite3.connect(db_path, timeout=timeout, isolation_level=None, check_same_thread=False)
+            for statement in sqlite_pragma_statements(pragmas):
+                conn.execute(statement)
+            return conn
+
+        def _writer(worker_id: int) -> None:
+            conn = _connect()
+            for index in range(ops):
+                row_id = (worker_id * ops + index) % 1000 + 1
+                try:
+                    conn.execute(f"BEGIN {transaction_mode}")
+                    conn.execute("SELECT touched FROM bench_session WHERE id=?", (row_id,)).fetchone()
+                    time.sleep(think)  # view work between the read and the write
+                    conn.execute("UPDATE bench_session SET touched=? WHERE id=?", (time.time(), row_id))
+                    conn.execute("INSERT INTO bench_session (payload, touched) VALUES (?, ?)", ("y" * 200, time.time()))
+                    conn.execute("COMMIT")
+                    with lock:
+                        stats["writes"] += 1
+                except sqlite3.OperationalError:
+                    if conn.in_transaction:
+                        conn.execute("ROLLBACK")
+                    with lock:
+                        stats["locked_errors"] += 1
+            conn.close()
+
+        def _reader(worker_id: int) -> None:
+            conn = _connect()
+            for index in range(ops):
+                try:
+                    conn.execute("SELECT payload FROM bench_session WHERE id=?", ((worker_id + index) % 1000 + 1,)).fetchone()
+                    with lock:
+                        stats["reads"] += 1
+                except sqlite3.OperationalError:
+                    with lock:
+                        stats["locked_errors"] += 1
+            conn.close()
+
+        threads = [threading.Thread(target=_writer, args=(i,)) for i in range(writers)]
+        threads += [threading.Thread(target=_reader, args=(i,)) for i in range(readers)]
+        started = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - started
+
+    return {
+        "profile": name,
+        "pragmas": pragmas,
+        "transaction_mode": transaction_mode,
+        "elapsed_seconds": round(elapsed, 4),
+        "writes_per_second": round(stats["writes"] / elapsed, 1) if elapsed else 0.0,
+        "reads_per_second": round(stats["reads"] / elapsed, 1) if elapsed else 0.0,
+        **stats,
+    }
+
+
+def run(writers: int = 8, readers: int = 8, ops: int = 200, timeout: float = 5.0, think: float = 0.001) -> dict:
+    stock = _run_profile("stock", STOCK_PRAGMAS, "DEFERRED", writers, readers, ops, timeout, think)
+    tuned_deferred = _run_profile("tuned_deferred", DEFAULT_SQLITE_PRAGMAS, "DEFERRED", writers, readers, ops, timeout, think)
+    tuned = _run_profile("tuned", DEFAULT_SQLITE_PRAGMAS, DEFAULT_SQLITE_TRANSACTION_MODE, writers, readers, ops, timeout, think)
+    speedup = round(stock["elapsed_seconds"] / tuned["elapsed_seconds"], 2) if tuned["elapsed_seconds"] else None
+    return {"writers": writers, "readers": readers, "ops": ops, "results": [stock, tuned_deferred, tuned], "speedup": speedup}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--writers", type=int, default=8)
+    parser.add_argument("--readers", type=int, default=8)
+    parser.add_argument("--ops", type=int, default=200)
+    parser.add_argument("--timeout", type=float, default=5.0, help="sqlite3 connect timeout in seconds")
+    parser.add_argument("--think", type=float, default=0.001, help="seconds each writer spends between its read and its write")
+    parser.add_argument("--output", type=Path, help="write the JSON result to this file")
+    args = parser.parse_args()
+
+    result = run(args.writers, args.readers, args.ops, args.timeout, args.think)
+    payload = json.dumps(result, ensure_ascii=False, indent=2)
+    if args.output:
+        args.output.write_text(payload, encoding="utf-8")
+    print(payload)
+
+
+if __name__ == "__main__":
+    main()
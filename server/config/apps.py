@@ -1,4 +1,16 @@
 from django.apps import AppConfig
+from django.db import DEFAULT_DB_ALIAS
+from django.db.backends.signals import connection_created
+from django.db.models.signals import post_migrate
+
+
+def _sync_super_admin_seed(sender, using: str = DEFAULT_DB_ALIAS, plan=None, **kwargs) -> None:
+    # flush also sends post_migrate, without a plan; the next super-admin login re-seeds instead.
+    if using != DEFAULT_DB_ALIAS or plan is None:
+        return
+    from server.application.web_support import sync_super_admin_accounts
+
+    sync_super_admin_accounts()
 
 
 class ServerAppConfig(AppConfig):
@@ -6,3 +18,13 @@ class ServerAppConfig(AppConfig):
     name = "server"
 
     label = "workflow_app"
+
+    def ready(self) -> None:
+        from server.application.sqlite_tuning import apply_sqlite_pragmas
+        from server.domains.research_notes import signals as research_note_signals  # noqa: F401
+        from server.domains.stats import signals  # noqa: F401
+
+        connection_created.connect(apply_sqlite_pragmas, dispatch_uid="projectnote_sqlite_pragmas")
+        # Not sender=self: post_migrate skips app configs without a models module, and this app's
+        # models live in the domain packages. Repeat calls per migrate only compare stored digests.
+        post_migrate.connect(_sync_super_admin_seed, dispatch_uid="projectnote_super_admin_seed")
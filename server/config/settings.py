@@ -22,11 +22,13 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    "server.application.instrumentation.RequestInstrumentationMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
+    "server.application.profiling.RequestProfilerMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
 ]
@@ -51,13 +53,36 @@ TEMPLATES = [
 WSGI_APPLICATION = "server.config.wsgi.application"
 ASGI_APPLICATION = "server.config.asgi.application"
 
+SQLITE_PERFORMANCE_PROFILE = os.getenv("SQLITE_PERFORMANCE_PROFILE", "true").strip().lower() == "true"
+SQLITE_BUSY_TIMEOUT_MS = int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000"))
+# IMMEDIATE takes the write lock at BEGIN, where busy_timeout can wait for it. A deferred
+# transaction that reads first and then writes fails at once with "database is locked" when
+# another connection wrote in between, however long busy_timeout is.
+SQLITE_TRANSACTION_MODE = os.getenv("SQLITE_TRANSACTION_MODE", "IMMEDIATE" if SQLITE_PERFORMANCE_PROFILE else "DEFERRED").strip().upper()
+
 DATABASES = {
     "default": {
         "ENGINE": "django.db.backends.sqlite3",
         "NAME": BASE_DIR / "projectnote.db",
+        "OPTIONS": {
+            "timeout": SQLITE_BUSY_TIMEOUT_MS / 1000,
+            "transaction_mode": SQLITE_TRANSACTION_MODE,
+        },
     }
 }
 
+SQLITE_PRAGMAS = {
+    "journal_mode": os.getenv("SQLITE_JOURNAL_MODE", "WAL"),
+    "synchronous": os.getenv("SQLITE_SYNCHRONOUS", "NORMAL"),
+    # Same value as the sqlite3 connect timeout above; the PRAGMA also covers the SQLAlchemy engine.
+    "busy_timeout": SQLITE_BUSY_TIMEOUT_MS,
+    "mmap_size": int(os.getenv("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024))),
+    "cache_size": int(os.getenv("SQLITE_CACHE_SIZE", str(-64 * 1024))),
+    "temp_store": os.getenv("SQLITE_TEMP_STORE", "MEMORY"),
+}
+SQLALCHEMY_POOL_SIZE = int(os.getenv("SQLALCHEMY_POOL_SIZE", "5"))
+SQLALCHEMY_MAX_OVERFLOW = int(os.getenv("SQLALCHEMY_MAX_OVERFLOW", "5"))
+
 LANGUAGE_CODE = "ko-kr"
 TIME_ZONE = "Asia/Seoul"
 USE_I18N = True
@@ -65,7 +90,83 @@ USE_TZ = True
 
 STATIC_URL = "static/"
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
-SESSION_ENGINE = "django.contrib.sessions.backends.db"
+SESSION_ENGINES = {
+    "db": "django.contrib.sessions.backends.db",
+    "cached_db": "django.contrib.sessions.backends.cached_db",
+    "signed_cookies": "django.contrib.sessions.backends.signed_cookies",
+}
+SESSION_BACKEND = os.getenv("SESSION_BACKEND", "db").strip().lower()
+if SESSION_BACKEND not in SESSION_ENGINES:
+    raise ValueError(f"SESSION_BACKEND must be one of {', '.join(SESSION_ENGINES)}: {SESSION_BACKEND!r}")
+SESSION_ENGINE = SESSION_ENGINES[SESSION_BACKEND]
+# cached_db reads sessions from a cache every worker process on the host can see.
+SESSION_CACHE_ALIAS = "sessions"
+CACHES = {
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+    "sessions": {
+        "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+        "LOCATION": os.getenv("SESSION_CACHE_LOCATION", str(PROJECT_ROOT / "storage" / "session_cache")),
+    },
+    # Shared by every worker on the host, so a membership change made in one worker is seen
+    # by all of them instead of only the one that handled the write.
+    "project_access": {
+        "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+        "LOCATION": os.getenv("PROJECT_ACCESS_CACHE_LOCATION", str(PROJECT_ROOT / "storage" / "project_access_cache")),
+    },
+    # Small cross-worker state such as the admin table counts.
+    "shared": {
+        "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+        "LOCATION": os.getenv("SHARED_CACHE_LOCATION", str(PROJECT_ROOT / "storage" / "shared_cache")),
+    },
+}
+# Lifetime of {% cache %} page fragments; keys carry content_version, so writes invalidate them sooner.
+FRAGMENT_CACHE_TIMEOUT = int(os.getenv("FRAGMENT_CACHE_TIMEOUT", "600"))
+PROJECT_ACCESS_CACHE_TIMEOUT = int(os.getenv("PROJECT_ACCESS_CACHE_TIMEOUT", "60"))
+ADMIN_TABLE_COUNTS_CACHE_TIMEOUT = int(os.getenv("ADMIN_TABLE_COUNTS_CACHE_TIMEOUT", "300"))
+# Rows ANALYZE reads per index from the admin UI (PRAGMA analysis_limit); 0 scans everything.
+ADMIN_ANALYZE_LIMIT = int(os.getenv("ADMIN_ANALYZE_LIMIT", "1000"))
+BACKGROUND_TASKS_EAGER = os.getenv("BACKGROUND_TASKS_EAGER", "false").strip().lower() == "true"
+BACKGROUND_TASK_WORKERS = int(os.getenv("BACKGROUND_TASK_WORKERS", "2"))
+RESEARCH_NOTE_TEXT_EXTRACTION_BUDGET = float(os.getenv("RESEARCH_NOTE_TEXT_EXTRACTION_BUDGET", "2.0"))
+# false leaves extraction entirely to `manage.py resume_text_extraction --watch` in its own process,
+# so CPU-bound PDF parsing never competes with requests for a web worker's GIL.
+RESEARCH_NOTE_TEXT_EXTRACTION_IN_WEB = os.getenv("RESEARCH_NOTE_TEXT_EXTRACTION_IN_WEB", "true").strip().lower() == "true"
+# A pending extraction untouched this long is treated as orphaned by a dead web worker.
+RESEARCH_NOTE_TEXT_EXTRACTION_STALE_SECONDS = int(os.getenv("RESEARCH_NOTE_TEXT_EXTRACTION_STALE_SECONDS", "300"))
+# Per-process metric snapshots summed by /metrics; keep it on a host-local disk shared by the workers.
+METRICS_DIR = os.getenv("METRICS_DIR", str(PROJECT_ROOT / "storage" / "metrics"))
+METRICS_FLUSH_INTERVAL = float(os.getenv("METRICS_FLUSH_INTERVAL", "1.0"))
+METRICS_ALLOWED_IPS = [ip.strip() for ip in os.getenv("METRICS_ALLOWED_IPS", "127.0.0.1,::1").split(",") if ip.strip()]
+METRICS_TOKEN = os.getenv("METRICS_TOKEN", "").strip()
+# Sampling profiles requested by super admins with ?_profile=1 or X-Profile-Request: 1.
+PROFILES_DIR = os.getenv("PROFILES_DIR", str(PROJECT_ROOT / "storage" / "profiles"))
+PROFILES_KEEP = int(os.getenv("PROFILES_KEEP", "50"))
+PROFILE_SAMPLE_INTERVAL_MS = float(os.getenv("PROFILE_SAMPLE_INTERVAL_MS", "2"))
+# Server-Timing exposes DB and stage timings; without this only super admins receive the header.
+SERVER_TIMING_ENABLED = os.getenv("SERVER_TIMING_ENABLED", "false").strip().lower() == "true"
+# Per-route query/time budgets checked by RequestInstrumentationMiddleware (keys are URL patterns).
+# Query limits match the cold-cache counts on the test dataset; exceeding one logs a warning
+# and fails test_request_budgets_hold_for_key_routes.
+REQUEST_BUDGET_DEFAULT = {
+    "queries": int(os.getenv("REQUEST_BUDGET_DEFAULT_QUERIES", "50")),
+    "total_ms": float(os.getenv("REQUEST_BUDGET_DEFAULT_MS", "1000")),
+}
+REQUEST_BUDGETS = {
+    "api/v1/projects": {"queries": 1, "total_ms": 300},
+    "api/v1/research-notes": {"queries": 1, "total_ms": 300},
+    "api/v1/research-notes/<str:note_id>": {"queries": 1, "total_ms": 300},
+    "api/v1/dashboard/summary": {"queries": 3, "total_ms": 300},
+    "api/v1/projects/<str:project_id>/research-notes/export-pdf": {"queries": 11, "total_ms": 10000},
+    "frontend/workflows": {"queries": 4, "total_ms": 500},
+    "frontend/projects": {"queries": 6, "total_ms": 500},
+    "frontend/projects/<str:project_id>": {"queries": 12, "total_ms": 500},
+    "frontend/projects/<str:project_id>/researchers": {"queries": 6, "total_ms": 500},
+    "frontend/projects/<str:project_id>/research-notes": {"queries": 8, "total_ms": 500},
+    "frontend/projects/<str:project_id>/research-notes/print": {"queries": 12, "total_ms": 1000},
+    "frontend/research-notes": {"queries": 4, "total_ms": 500},
+    "frontend/research-notes/<str:note_id>": {"queries": 5, "total_ms": 500},
+    "frontend/research-notes/<str:note_id>/viewer": {"queries": 11, "total_ms": 1000},
+}
 
 RESEARCH_NOTES_STORAGE_INTERNAL_ROOT = PROJECT_ROOT / "storage" / "research_notes"
 RESEARCH_NOTES_STORAGE_USE_EXTERNAL = (
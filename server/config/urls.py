@@ -12,6 +12,7 @@ from server.domains.signatures import api as signatures_api
 urlpatterns = [
     path("api/v1/auth/signup", api.signup_api),
     path("api/v1/health", api.health),
+    path("metrics", api.metrics),
     path("api/v1/frontend/bootstrap", api.frontend_bootstrap),
     path("api/v1/dashboard/summary", api.dashboard_summary),
     path("api/v1/projects", api.projects),
@@ -19,19 +20,25 @@ urlpatterns = [
     path("api/v1/projects/<str:project_id>/update", projects_api.project_update_api),
     path("api/v1/projects/<str:project_id>/cover", projects_api.project_cover_update_api),
     path("api/v1/projects/<str:project_id>/cover/print", projects_api.project_cover_print_api),
+    path("api/v1/projects/<str:project_id>/cover/image", projects_api.project_cover_image_api),
     path("api/v1/projects/<str:project_id>/researchers", projects_api.project_add_researcher_api),
     path("api/v1/projects/<str:project_id>/researchers/remove", projects_api.project_remove_researcher_api),
     path("api/v1/projects/<str:project_id>/research-notes/upload", projects_api.project_upload_research_note_api),
     path("api/v1/projects/<str:project_id>/research-notes/export-pdf", projects_api.project_research_notes_export_pdf_api),
     path("api/v1/researchers", api.researchers_api),
+    path("api/v1/researchers/bulk-invite", researchers_api.researchers_bulk_invite_api),
     path("api/v1/data-updates", api.data_updates_api),
     path("api/v1/final-download", api.final_download_api),
     path("api/v1/signatures", api.signature_api),
     path("api/v1/admin/teams", api.admin_teams_api),
     path("api/v1/admin/users", api.admin_users_api),
+    path("api/v1/admin/reports", api.admin_reports_api),
     path("api/v1/admin/tables", api.admin_tables_api),
+    path("api/v1/admin/tables/recount", api.admin_tables_recount_api),
     path("api/v1/admin/tables/<str:table_name>/truncate", api.admin_table_truncate_api),
     path("api/v1/research-notes", api.research_notes_api),
+    path("api/v1/research-notes/search", api.research_note_search_api),
+    path("api/v1/research-notes/search/pages", api.research_note_page_search_api),
     path("api/v1/research-notes/<str:note_id>", api.research_note_detail_api),
     path("api/v1/research-notes/<str:note_id>/update", api.research_note_update_api),
     path("api/v1/research-notes/<str:note_id>/viewer-export-pdf", research_notes_api.research_note_viewer_export_pdf_api),
@@ -43,6 +50,8 @@ urlpatterns = [
     path("frontend/admin/teams", admin_api.admin_teams_page),
     path("frontend/admin/users", admin_api.admin_users_page),
     path("frontend/admin/tables", admin_api.admin_tables_page),
+    path("frontend/admin/profiles", admin_api.admin_profiles_page),
+    path("frontend/admin/profiles/<str:profile_id>", admin_api.admin_profile_download),
 
     path("login", auth_api.login_page),
     path("signup", auth_api.signup_page),
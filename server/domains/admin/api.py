@@ -1,9 +1,18 @@
-from django.http import JsonResponse
+from django.http import FileResponse, Http404, JsonResponse
 from django.shortcuts import redirect, render
 from django.views.decorators.csrf import ensure_csrf_cookie
 from django.views.decorators.http import require_GET, require_http_methods
 
-from server.application.web_support import admin_repository, admin_required_page, dashboard_counts, page_context, organization_user_stats
+from server.application import profiling, reporting
+from server.application.web_support import (
+    admin_repository,
+    admin_required_page,
+    dashboard_counts,
+    organization_user_stats,
+    page_context,
+    research_note_search_index,
+    stats_repository,
+)
 
 
 def _admin_navigation(current: str) -> list[dict[str, str]]:
@@ -12,6 +21,7 @@ def _admin_navigation(current: str) -> list[dict[str, str]]:
         {"key": "users", "title": "사용자 관리", "href": "/frontend/admin/users"},
         {"key": "teams", "title": "팀 관리", "href": "/frontend/admin/teams"},
         {"key": "tables", "title": "테이블 관리", "href": "/frontend/admin/tables"},
+        {"key": "profiles", "title": "요청 프로파일", "href": "/frontend/admin/profiles"},
     ]
     for item in items:
         item["active"] = item["key"] == current
@@ -85,6 +95,22 @@ def admin_tables_api(_request):
     return JsonResponse(admin_repository.list_managed_tables(), safe=False)
 
 
+@require_GET
+@admin_required_page
+def admin_reports_api(request):
+    try:
+        limit = max(1, min(int(request.GET.get("limit", "20")), 200))
+    except ValueError:
+        return JsonResponse({"detail": "limit은 숫자여야 합니다."}, status=400)
+    return JsonResponse(reporting.admin_report(limit=limit))
+
+
+@require_http_methods(["POST"])
+@admin_required_page
+def admin_tables_recount_api(_request):
+    return JsonResponse(admin_repository.recount_managed_tables(), safe=False)
+
+
 @require_http_methods(["POST"])
 @admin_required_page
 def admin_table_truncate_api(_request, table_name: str):
@@ -92,6 +118,9 @@ def admin_table_truncate_api(_request, table_name: str):
         admin_repository.truncate_table(table_name)
     except ValueError as exc:
         return JsonResponse({"detail": str(exc)}, status=400)
+    stats_repository.recount_all()
+    if table_name in {"workflow_app_researchnote", "workflow_app_researchnotefile"}:
+        research_note_search_index.rebuild()
     return JsonResponse({"message": f"{table_name} 테이블 데이터가 삭제되었습니다."})
 
 
@@ -114,6 +143,7 @@ def admin_dashboard_page(request):
             {
                 "summary": dashboard_counts(),
                 "organization_user_stats": organization_user_stats(),
+                "project_activity": reporting.project_activity(limit=10),
                 "admin_nav_items": _admin_navigation("dashboard"),
             },
         ),
@@ -159,3 +189,23 @@ def admin_tables_page(request):
         "admin/tables.html",
         page_context(request, {"tables": admin_repository.list_managed_tables(), "admin_nav_items": _admin_navigation("tables")}),
     )
+
+
+@require_GET
+@ensure_csrf_cookie
+@admin_required_page
+def admin_profiles_page(request):
+    return render(
+        request,
+        "admin/profiles.html",
+        page_context(request, {"profiles": profiling.list_profiles(), "admin_nav_items": _admin_navigation("profiles")}),
+    )
+
+
+@require_GET
+@admin_required_page
+def admin_profile_download(_request, profile_id: str):
+    path = profiling.profile_path(profile_id)
+    if not path:
+        raise Http404("Profile not found")
+    return FileResponse(path.open("rb"), as_attachment=True, filename=path.name, content_type="text/plain; charset=utf-8")
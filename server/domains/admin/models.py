@@ -7,6 +7,9 @@ class Team(TimestampedModel):
     name = models.CharField(max_length=120, unique=True)
     description = models.CharField(max_length=255, blank=True, default="")
     join_code = models.CharField(max_length=6, unique=True)
+    note_count = models.PositiveIntegerField(default=0)
+    file_count = models.PositiveIntegerField(default=0)
+    last_activity_at = models.DateTimeField(null=True, blank=True)
 
     class Meta:
         db_table = "workflow_app_company"
@@ -20,6 +23,7 @@ class SuperAdminAccount(TimestampedModel):
     organization = models.CharField(max_length=255, default="ProjectNote")
     major = models.CharField(max_length=255, default="관리")
     is_active = models.BooleanField(default=True)
+    seed_digest = models.CharField(max_length=64, blank=True, default="")
 
 
 class UserAccount(TimestampedModel):
@@ -37,3 +41,8 @@ class UserAccount(TimestampedModel):
     is_approved = models.BooleanField(default=False)
     requested_team_name = models.CharField(max_length=120, blank=True, default="")
     requested_team_description = models.CharField(max_length=255, blank=True, default="")
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["team", "is_approved"], name="useraccount_team_approved_idx"),
+        ]
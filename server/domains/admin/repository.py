@@ -1,12 +1,24 @@
+import json
 import random
 import string
 
+from django.conf import settings
 from django.contrib.auth.hashers import check_password, make_password
+from django.core.cache import caches
 from django.db import connection
 from django.db.models import Q
+from django.utils import timezone
+from django.utils.crypto import salted_hmac
 
 from .models import SuperAdminAccount, Team, UserAccount
 
+TABLE_COUNTS_CACHE_KEY = "projectnote:admin:managed_table_counts"
+SUPER_ADMIN_SEED_CACHE_KEY = "projectnote:admin:super_admin_seed"
+
+
+def _shared_cache():
+    return caches["shared"]
+
 
 class AdminRepository:
     MANAGED_TABLES = [
@@ -86,6 +98,46 @@ class AdminRepository:
         }
 
 
+    def sync_super_admin_seed(self, users: dict[str, dict], force: bool = False) -> int:
+        """Upsert seed accounts whose entry changed since the last sync; returns the number written.
+
+        Each account keeps a keyed digest of its seed entry, so unchanged entries are skipped
+        without hashing their passwords again.
+        """
+        digests = {username: self._seed_digest(username, user) for username, user in users.items()}
+        stored = dict(
+            SuperAdminAccount.objects.filter(username__in=list(users)).values_list("username", "seed_digest")
+        )
+        written = 0
+        for username, user in users.items():
+            if not force and stored.get(username) == digests[username]:
+                continue
+            raw_or_hashed_password = str(user.get("password", ""))
+            SuperAdminAccount.objects.update_or_create(
+                username=username,
+                defaults={
+                    "display_name": user.get("name", username),
+                    "email": user.get("email", f"{username}@projectnote.local"),
+                    "password": (
+                        raw_or_hashed_password
+                        if raw_or_hashed_password.startswith("pbkdf2_")
+                        else make_password(raw_or_hashed_password)
+                    ),
+                    "organization": user.get("organization", "ProjectNote"),
+                    "major": user.get("major", "관리"),
+                    "is_active": True,
+                    "seed_digest": digests[username],
+                },
+            )
+            written += 1
+        return written
+
+    @staticmethod
+    def _seed_digest(username: str, user: dict) -> str:
+        # Keyed with SECRET_KEY so a plaintext seed password cannot be recovered from the digest.
+        payload = json.dumps({"username": username, **user}, sort_keys=True, ensure_ascii=False)
+        return salted_hmac("projectnote.super_admin_seed", payload, algorithm="sha256").hexdigest()
+
     @staticmethod
     def _verify_password(account: UserAccount | SuperAdminAccount, raw_password: str) -> bool:
         if check_password(raw_password, account.password):
@@ -320,26 +372,83 @@ class AdminRepository:
         if owner.team_id != team.id:
             owner.team = team
 
-        UserAccount.objects.filter(team_id=team.id, role=UserAccount.Role.OWNER).exclude(id=owner.id).update(role=UserAccount.Role.ADMIN)
+        for previous_owner in UserAccount.objects.filter(team_id=team.id, role=UserAccount.Role.OWNER).exclude(id=owner.id):
+            previous_owner.role = UserAccount.Role.ADMIN
+            previous_owner.save(update_fields=["role", "updated_at"])
         owner.role = UserAccount.Role.OWNER
         owner.is_approved = True
         owner.save(update_fields=["team", "role", "is_approved", "updated_at"])
         return {"team_id": team.id, "owner_user_id": owner.id}
 
     def list_managed_tables(self) -> list[dict]:
-        rows = []
+        counts = _shared_cache().get(TABLE_COUNTS_CACHE_KEY)
+        if counts is None:
+            counts = self._estimate_table_counts()
+            _shared_cache().set(TABLE_COUNTS_CACHE_KEY, counts, settings.ADMIN_TABLE_COUNTS_CACHE_TIMEOUT)
+        return [{"table": table_name, **counts[table_name]} for table_name in self.MANAGED_TABLES if table_name in counts]
+
+    @staticmethod
+    def analyze_tables(limit: int | None = None) -> None:
+        """Refresh sqlite_stat1, so cold table lists read row estimates instead of COUNT(*).
+
+        `limit` caps the rows read per index (PRAGMA analysis_limit, ADMIN_ANALYZE_LIMIT by default)
+        so a request never holds the database for a full scan; 0 analyzes every row.
+        """
+        if limit is None:
+            limit = settings.ADMIN_ANALYZE_LIMIT
+        with connection.cursor() as cursor:
+            cursor.execute(f"PRAGMA analysis_limit = {int(limit)}")
+            try:
+                cursor.execute("ANALYZE")
+            finally:
+                cursor.execute("PRAGMA analysis_limit = 0")
+        _shared_cache().delete(TABLE_COUNTS_CACHE_KEY)
+
+    def recount_managed_tables(self) -> list[dict]:
+        self.analyze_tables()
+        counts = {}
+        with connection.cursor() as cursor:
+            for table_name in self._existing_managed_tables(cursor):
+                counts[table_name] = self._exact_table_count(cursor, table_name)
+        _shared_cache().set(TABLE_COUNTS_CACHE_KEY, counts, settings.ADMIN_TABLE_COUNTS_CACHE_TIMEOUT)
+        return [{"table": table_name, **counts[table_name]} for table_name in self.MANAGED_TABLES if table_name in counts]
+
+    def _estimate_table_counts(self) -> dict[str, dict]:
+        """Prefer sqlite_stat1 row estimates (written by ANALYZE) and count exactly only when missing."""
+        counts = {}
         with connection.cursor() as cursor:
-            for table_name in self.MANAGED_TABLES:
-                cursor.execute(
-                    "SELECT name FROM sqlite_master WHERE type='table' AND name=%s",
-                    [table_name],
-                )
-                if not cursor.fetchone():
-                    continue
-                cursor.execute(f'SELECT COUNT(*) FROM "{table_name}"')
-                count = cursor.fetchone()[0]
-                rows.append({"table": table_name, "rows": count})
-        return rows
+            existing = self._existing_managed_tables(cursor)
+            estimates = self._sqlite_stat_row_estimates(cursor)
+            for table_name in existing:
+                if table_name in estimates:
+                    counts[table_name] = {"rows": estimates[table_name], "approximate": True, "counted_at": timezone.now().isoformat()}
+                else:
+                    counts[table_name] = self._exact_table_count(cursor, table_name)
+        return counts
+
+    def _existing_managed_tables(self, cursor) -> list[str]:
+        placeholders = ", ".join(["%s"] * len(self.MANAGED_TABLES))
+        cursor.execute(f"SELECT name FROM sqlite_master WHERE type='table' AND name IN ({placeholders})", self.MANAGED_TABLES)
+        existing = {row[0] for row in cursor.fetchall()}
+        return [table_name for table_name in self.MANAGED_TABLES if table_name in existing]
+
+    @staticmethod
+    def _sqlite_stat_row_estimates(cursor) -> dict[str, int]:
+        cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='sqlite_stat1'")
+        if not cursor.fetchone():
+            return {}
+        cursor.execute("SELECT tbl, stat FROM sqlite_stat1")
+        estimates: dict[str, int] = {}
+        for table_name, stat in cursor.fetchall():
+            head = str(stat or "").split(" ", 1)[0]
+            if head.isdigit():
+                estimates[table_name] = max(estimates.get(table_name, 0), int(head))
+        return estimates
+
+    @staticmethod
+    def _exact_table_count(cursor, table_name: str) -> dict:
+        cursor.execute(f'SELECT COUNT(*) FROM "{table_name}"')
+        return {"rows": cursor.fetchone()[0], "approximate": False, "counted_at": timezone.now().isoformat()}
 
     def truncate_table(self, table_name: str) -> None:
         if table_name not in self.MANAGED_TABLES:
@@ -353,6 +462,15 @@ class AdminRepository:
             if not cursor.fetchone():
                 raise ValueError("테이블이 존재하지 않습니다.")
             cursor.execute(f'DELETE FROM "{table_name}"')
+            # Drop the table's stale sqlite_stat1 estimate along with its rows.
+            cursor.execute(f'ANALYZE "{table_name}"')
+        counts = _shared_cache().get(TABLE_COUNTS_CACHE_KEY)
+        if counts is not None:
+            counts[table_name] = {"rows": 0, "approximate": False, "counted_at": timezone.now().isoformat()}
+            _shared_cache().set(TABLE_COUNTS_CACHE_KEY, counts, settings.ADMIN_TABLE_COUNTS_CACHE_TIMEOUT)
+        if table_name == SuperAdminAccount._meta.db_table:
+            _shared_cache().delete(SUPER_ADMIN_SEED_CACHE_KEY)
+
     @staticmethod
     def _role_label(role: str) -> str:
         if role == UserAccount.Role.OWNER:
@@ -1,7 +1,9 @@
+import hmac
 from datetime import datetime, timezone
 
+from django.conf import settings
 from django.contrib.auth import get_user_model, login, logout
-from django.http import JsonResponse
+from django.http import HttpResponse, HttpResponseForbidden, JsonResponse
 from django.shortcuts import redirect, render
 from django.views.decorators.csrf import ensure_csrf_cookie
 from django.views.decorators.http import require_GET, require_http_methods
@@ -9,10 +11,12 @@ from django.views.decorators.http import require_GET, require_http_methods
 
 User = get_user_model()
 
+from server.application import metrics as app_metrics
 from server.application.web_support import (
     authenticate_login_user,
     authenticate_super_admin,
     admin_repository,
+    clear_request_user_profile,
     effective_user_profile,
     save_login_session,
 )
@@ -23,19 +27,30 @@ def health(_request):
     return JsonResponse({"status": "ok"})
 
 
+@require_GET
+def metrics(request):
+    # Behind a reverse proxy on the same host every request arrives from 127.0.0.1, so the IP
+    # allowlist alone passes everything; METRICS_TOKEN adds a bearer token check on top.
+    if request.META.get("REMOTE_ADDR") not in settings.METRICS_ALLOWED_IPS:
+        return HttpResponseForbidden()
+    token = settings.METRICS_TOKEN
+    if token and not hmac.compare_digest(request.META.get("HTTP_AUTHORIZATION", ""), f"Bearer {token}"):
+        return HttpResponseForbidden()
+    return HttpResponse(app_metrics.render_prometheus(), content_type="text/plain; version=0.0.4; charset=utf-8")
+
 
 
-def _sync_and_login_django_user(request, username: str, password: str, email: str, is_super_admin: bool = False) -> None:
+
+def _sync_and_login_django_user(request, username: str, email: str, is_super_admin: bool = False) -> None:
+    # The password was already verified against UserAccount/SuperAdminAccount. The shadow Django
+    # user only carries the auth session, so it gets an unusable password instead of a second hash.
     django_user, created = User.objects.get_or_create(
         username=username,
         defaults={"email": email or f"{username}@projectnote.local"},
     )
     should_save = False
     if created:
-        django_user.set_password(password)
-        should_save = True
-    elif password and not django_user.check_password(password):
-        django_user.set_password(password)
+        django_user.set_unusable_password()
         should_save = True
 
     if django_user.is_staff != bool(is_super_admin):
@@ -100,7 +115,7 @@ def login_page(request):
         )
 
     save_login_session(request, username, user)
-    _sync_and_login_django_user(request, username, password, user.get("email", ""), bool(user.get("is_super_admin", False)))
+    _sync_and_login_django_user(request, username, user.get("email", ""), bool(user.get("is_super_admin", False)))
     if next_url.startswith("/"):
         return redirect(next_url)
     if user.get("is_super_admin"):
@@ -129,7 +144,7 @@ def admin_login_page(request):
         )
 
     save_login_session(request, username, user)
-    _sync_and_login_django_user(request, username, password, user.get("email", ""), bool(user.get("is_super_admin", False)))
+    _sync_and_login_django_user(request, username, user.get("email", ""), bool(user.get("is_super_admin", False)))
     if next_url.startswith("/frontend/admin"):
         return redirect(next_url)
     return redirect("/frontend/admin/dashboard")
@@ -147,6 +162,7 @@ def signup_page(request):
 def logout_page(request):
     logout(request)
     request.session.pop("user_profile", None)
+    clear_request_user_profile(request)
     return redirect("/login")
 
 
@@ -1,4 +1,5 @@
-from .entities import CreateProjectCommand, InvitedMemberCommand
+from .entities import CreateProjectCommand, InvitedMemberCommand, ProjectAccess
+from .permissions import ProjectPermissionService
 from .repository import ProjectRepository
 from .schemas import CreateProjectPayload, InvitedMemberPayload
 from .service import ProjectService
@@ -6,6 +7,8 @@ from .service import ProjectService
 __all__ = [
     "CreateProjectCommand",
     "InvitedMemberCommand",
+    "ProjectAccess",
+    "ProjectPermissionService",
     "ProjectRepository",
     "CreateProjectPayload",
     "InvitedMemberPayload",
@@ -1,5 +1,6 @@
 import base64
 import json
+import time
 import uuid
 from datetime import datetime, timezone
 from io import BytesIO
@@ -7,17 +8,19 @@ from pathlib import Path
 
 from django.conf import settings
 from django.db import OperationalError, ProgrammingError
-from django.http import FileResponse, Http404, JsonResponse
+from django.http import Http404, JsonResponse
 from django.shortcuts import render
 from django.views.decorators.csrf import ensure_csrf_cookie
 from django.views.decorators.http import require_GET, require_http_methods
-from pypdf import PdfReader, PdfWriter
-from reportlab.lib.pagesizes import A4
-from reportlab.lib.utils import ImageReader
-from reportlab.pdfgen import canvas
-from reportlab.pdfbase import pdfmetrics
-from reportlab.pdfbase.cidfonts import UnicodeCIDFont
 
+from .cover_assets import (
+    COVER_ASSET_EXTENSIONS,
+    cover_asset_path,
+    cover_image_url,
+    cover_preview_path,
+    read_cover_asset,
+    store_cover_data_url,
+)
 from .models import Project, ProjectMember, ProjectNoteCover
 from server.domains.admin.models import UserAccount
 from server.domains.research_notes.models import ResearchNote, ResearchNoteFile, ResearchNoteFolder
@@ -26,7 +29,10 @@ from server.domains.research_notes.api import (
     _read_research_note_pdf_cache,
     _write_research_note_pdf_cache,
 )
+from server.application import metrics, pdf_toolkit
+from server.application.instrumentation import timing_span
 from server.application.web_support import (
+    deferred,
     json_uuid_validation_error,
     login_required_page,
     page_context,
@@ -37,9 +43,31 @@ from server.application.web_support import (
     research_note_repository,
     signature_repository,
     dashboard_counts,
+    StreamingFileResponse,
 )
 
 
+def _project_notes(project_id: str) -> list[dict]:
+    note_ids = project_repository.project_note_ids(project_id)
+    return [note for note in research_note_repository.list_research_notes() if note["id"] in note_ids]
+
+
+def _project_file_rows(project_notes: list[dict]) -> list[dict]:
+    file_rows = []
+    for note in project_notes:
+        for file in research_note_repository.list_note_files(note["id"]):
+            file_rows.append({
+                "note_title": note["title"],
+                "name": file["name"],
+                "format": file["format"],
+                "created": file["created"],
+                "author": file["author"],
+                "note_id": note["id"],
+                "file_id": file["id"],
+            })
+    return file_rows
+
+
 def _manager_options_for_team(team_id: int | None) -> list[dict]:
     users = UserAccount.objects.filter(is_approved=True, role__in=[UserAccount.Role.OWNER, UserAccount.Role.ADMIN])
     if team_id is not None:
@@ -63,7 +91,10 @@ def _cover_to_dict(cover: ProjectNoteCover, project: Project, manager_display: s
         "show_org": cover.show_org,
         "show_manager": cover.show_manager,
         "show_period": cover.show_period,
-        "cover_image_data_url": cover.cover_image_data_url or "",
+        "cover_image_hash": cover.cover_image_hash,
+        "cover_image_mime": cover.cover_image_mime,
+        "cover_image_url": cover_image_url(str(project.id), cover.cover_image_hash),
+        "cover_image_preview_url": cover_image_url(str(project.id), cover.cover_image_hash, preview=True),
     }
 
 
@@ -82,13 +113,16 @@ def _default_cover_data(project: dict, manager_display: str) -> dict:
         "show_org": True,
         "show_manager": True,
         "show_period": True,
-        "cover_image_data_url": "",
+        "cover_image_hash": "",
+        "cover_image_mime": "",
+        "cover_image_url": "",
+        "cover_image_preview_url": "",
     }
 
 
 def _load_cover_data(project_obj: Project, project: dict, manager_display: str) -> dict:
     try:
-        cover, _ = ProjectNoteCover.objects.get_or_create(
+        cover, _ = ProjectNoteCover.objects.defer("cover_image_data_url").get_or_create(
             project=project_obj,
             defaults={
                 "title": project_obj.name,
@@ -107,62 +141,32 @@ def _load_cover_data(project_obj: Project, project: dict, manager_display: str)
 
 
 
-def _setup_korean_font() -> str | None:
-    for font_name in ("HYGothic-Medium", "HYSMyeongJo-Medium"):
-        try:
-            pdfmetrics.getFont(font_name)
-            return font_name
-        except KeyError:
-            try:
-                pdfmetrics.registerFont(UnicodeCIDFont(font_name))
-                return font_name
-            except Exception:
-                continue
-    return None
-
-
-KOREAN_PDF_FONT = _setup_korean_font()
-
-
-def _set_pdf_font(pdf, size: int, bold: bool = False) -> None:
-    if KOREAN_PDF_FONT:
-        pdf.setFont(KOREAN_PDF_FONT, size)
-        return
-    pdf.setFont("Helvetica-Bold" if bold else "Helvetica", size)
-
-def _decode_data_url(data_url: str):
-    raw = str(data_url or "")
-    if not raw.startswith("data:") or "," not in raw:
-        return "", b""
-    header, encoded = raw.split(",", 1)
-    mime = header[5:].split(";", 1)[0].lower()
-    try:
-        return mime, base64.b64decode(encoded)
-    except Exception:
-        return "", b""
-
-
 def _project_cover_pdf_cache_path(project_id: str) -> Path:
     return Path(settings.RESEARCH_NOTES_STORAGE_ROOT) / "_pdf_cache" / "project_covers" / f"{project_id}.pdf"
 
 
 def _read_project_cover_pdf_cache(project_id: str) -> bytes | None:
     cache_path = _project_cover_pdf_cache_path(project_id)
-    if cache_path.exists() and cache_path.is_file():
-        try:
-            return cache_path.read_bytes()
-        except Exception:
-            return None
+    with timing_span("io"):
+        if cache_path.exists() and cache_path.is_file():
+            try:
+                cached = cache_path.read_bytes()
+                metrics.PDF_CACHE_REQUESTS.inc(cache="project_cover", result="hit")
+                return cached
+            except Exception:
+                pass
+    metrics.PDF_CACHE_REQUESTS.inc(cache="project_cover", result="miss")
     return None
 
 
 def _write_project_cover_pdf_cache(project_id: str, pdf_bytes: bytes) -> None:
     cache_path = _project_cover_pdf_cache_path(project_id)
-    try:
-        cache_path.parent.mkdir(parents=True, exist_ok=True)
-        cache_path.write_bytes(pdf_bytes)
-    except Exception:
-        return
+    with timing_span("io"):
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            cache_path.write_bytes(pdf_bytes)
+        except Exception:
+            return
 
 
 def _invalidate_project_cover_pdf_cache(project_id: str) -> None:
@@ -175,32 +179,41 @@ def _invalidate_project_cover_pdf_cache(project_id: str) -> None:
 
 
 def _build_project_cover_pdf_bytes(profile: dict, project_id: str, cover_data: dict) -> bytes:
-    cover_image_data_url = str(cover_data.get("cover_image_data_url") or "")
-    cover_mime, cover_payload = _decode_data_url(cover_image_data_url)
+    cover_mime = str(cover_data.get("cover_image_mime") or "")
+    with timing_span("io"):
+        cover_payload = read_cover_asset(project_id, str(cover_data.get("cover_image_hash") or ""), cover_mime) or b""
 
     if cover_mime == "application/pdf" and cover_payload:
         return cover_payload
 
+    started = time.perf_counter()
+    with timing_span("render"):
+        pdf_bytes = _render_project_cover_pdf(profile, cover_data, cover_mime, cover_payload)
+    metrics.PDF_RENDER_SECONDS.observe(time.perf_counter() - started, format="cover")
+    return pdf_bytes
+
+
+def _render_project_cover_pdf(profile: dict, cover_data: dict, cover_mime: str, cover_payload: bytes) -> bytes:
     cover_buffer = BytesIO()
-    c = canvas.Canvas(cover_buffer, pagesize=A4)
-    w, h = A4
+    c = pdf_toolkit.canvas.Canvas(cover_buffer, pagesize=pdf_toolkit.A4)
+    w, h = pdf_toolkit.A4
 
     drew_cover_image = False
     if cover_mime.startswith("image/") and cover_payload:
         try:
-            img_reader = ImageReader(BytesIO(cover_payload))
+            img_reader = pdf_toolkit.ImageReader(BytesIO(cover_payload))
             c.drawImage(img_reader, 0, 0, width=w, height=h, preserveAspectRatio=False)
             drew_cover_image = True
         except Exception:
             drew_cover_image = False
 
     if not drew_cover_image:
-        _set_pdf_font(c, 16, bold=True)
+        pdf_toolkit.set_pdf_font(c, 16, bold=True)
         c.drawCentredString(w / 2, h - 80, "Electronic Lab Notebook")
-        _set_pdf_font(c, 26, bold=True)
+        pdf_toolkit.set_pdf_font(c, 26, bold=True)
         c.drawCentredString(w / 2, h - 130, "연구노트")
         if cover_data.get("show_title"):
-            _set_pdf_font(c, 22, bold=True)
+            pdf_toolkit.set_pdf_font(c, 22, bold=True)
             c.drawCentredString(w / 2, h - 170, str(cover_data.get("title") or ""))
 
         lines = []
@@ -219,14 +232,14 @@ def _build_project_cover_pdf_bytes(profile: dict, project_id: str, cover_data: d
             lines.append(("기간", period))
 
         y = h - 240
-        _set_pdf_font(c, 12)
+        pdf_toolkit.set_pdf_font(c, 12)
         for label, value in lines:
             c.drawString(70, y, f"{label}:")
             c.drawString(150, y, value)
             y -= 24
 
         footer_company = str((profile.get("team") or profile.get("organization") or "미지정"))
-        _set_pdf_font(c, 11)
+        pdf_toolkit.set_pdf_font(c, 11)
         c.drawCentredString(w / 2, 60, f"ProjectNote - {footer_company}")
 
     c.showPage()
@@ -245,20 +258,22 @@ def _get_or_build_project_cover_pdf_bytes(profile: dict, project_id: str, cover_
 
 
 @require_GET
-def projects(request):
+async def projects(request):
     org_id = request.GET.get("org_id")
     if org_id:
         try:
             uuid.UUID(org_id)
         except ValueError:
             return json_uuid_validation_error("org_id", org_id)
-    return JsonResponse(project_repository.list_projects(), safe=False)
+    fields = project_repository.parse_project_fields(request.GET.get("fields"))
+    return JsonResponse(await project_repository.alist_projects(fields), safe=False)
 
 
 @require_http_methods(["GET", "POST"])
 def project_management_api(request):
     if request.method == "GET":
-        return JsonResponse(project_repository.list_projects(), safe=False)
+        fields = project_repository.parse_project_fields(request.GET.get("fields"))
+        return JsonResponse(project_repository.list_projects(fields), safe=False)
     payload = request.POST.copy()
     team_id = request.session.get("user_profile", {}).get("team_id")
     if team_id:
@@ -305,19 +320,17 @@ def project_detail_page(request, project_id: str):
     if not project_repository.can_view_project(project_id, profile):
         raise Http404("Project not found")
     try:
-        project_obj = Project.objects.get(id=project_id)
+        project_obj = Project.objects.select_related("company").get(id=project_id)
         project = project_repository.project_to_dict(project_obj)
     except Project.DoesNotExist as exc:
         raise Http404("Project not found") from exc
 
-    note_ids = project_repository.project_note_ids(project_id)
-    all_notes = research_note_repository.list_research_notes()
-    project_notes = [note for note in all_notes if note["id"] in note_ids]
-    selected_note = project_notes[0] if project_notes else None
-    selected_note_files = research_note_repository.list_note_files(selected_note["id"]) if selected_note else []
+    # Note lists, researcher groups and cover data are deferred: the template only reads them
+    # inside {% cache %} blocks keyed by project.content_version.
+    project_notes = deferred(_project_notes, project_id)
+    selected_note = deferred(lambda: project_notes[0] if project_notes else None)
     manager_options = _manager_options_for_team(profile.get("team_id"))
     manager_display = next((item["display_name"] for item in manager_options if item["username"] == project.get("manager")), project.get("manager", "-"))
-    cover_data = _load_cover_data(project_obj, project, manager_display)
     return render(
         request,
         "workflow/project_detail.html",
@@ -326,12 +339,14 @@ def project_detail_page(request, project_id: str):
             {
                 "project": project,
                 "project_notes": project_notes,
-                "researcher_groups": project_repository.project_researcher_groups(project_id),
+                "researcher_groups": deferred(project_repository.project_researcher_groups, project_id),
                 "selected_note": selected_note,
-                "selected_note_files": selected_note_files,
+                "selected_note_files": deferred(
+                    lambda: research_note_repository.list_note_files(selected_note["id"]) if selected_note else []
+                ),
                 "manager_options": manager_options,
                 "manager_display": manager_display,
-                "cover_data": cover_data,
+                "cover_data": deferred(_load_cover_data, project_obj, project, manager_display),
             },
         ),
     )
@@ -347,7 +362,7 @@ def project_researchers_page(request, project_id: str):
     if not project_repository.can_view_project(project_id, profile):
         raise Http404("Project not found")
     try:
-        project = project_repository.project_to_dict(Project.objects.get(id=project_id))
+        project = project_repository.project_to_dict(Project.objects.select_related("company").get(id=project_id))
     except Project.DoesNotExist as exc:
         raise Http404("Project not found") from exc
 
@@ -392,26 +407,12 @@ def project_research_notes_page(request, project_id: str):
     if not project_repository.can_view_project(project_id, profile):
         raise Http404("Project not found")
     try:
-        project = project_repository.project_to_dict(Project.objects.get(id=project_id))
+        project = project_repository.project_to_dict(Project.objects.select_related("company").get(id=project_id))
     except Project.DoesNotExist as exc:
         raise Http404("Project not found") from exc
 
-    note_ids = project_repository.project_note_ids(project_id)
-    all_notes = research_note_repository.list_research_notes()
-    project_notes = [note for note in all_notes if note["id"] in note_ids]
-
-    file_rows = []
-    for note in project_notes:
-        for file in research_note_repository.list_note_files(note["id"]):
-            file_rows.append({
-                "note_title": note["title"],
-                "name": file["name"],
-                "format": file["format"],
-                "created": file["created"],
-                "author": file["author"],
-                "note_id": note["id"],
-                "file_id": file["id"],
-            })
+    project_notes = deferred(_project_notes, project_id)
+    file_rows = deferred(_project_file_rows, project_notes)
 
     author_options = []
     seen_authors = set()
@@ -435,8 +436,8 @@ def project_research_notes_page(request, project_id: str):
                 "project": project,
                 "project_notes": project_notes,
                 "project_files": file_rows,
-                "note_count": len(project_notes),
-                "file_count": len(file_rows),
+                "note_count": deferred(len, project_notes),
+                "file_count": deferred(len, file_rows),
                 "author_options": author_options,
                 "default_author": current_author,
             },
@@ -454,7 +455,7 @@ def project_research_notes_print_page(request, project_id: str):
         raise Http404("Project not found")
 
     try:
-        project_obj = Project.objects.get(id=project_id)
+        project_obj = Project.objects.select_related("company").get(id=project_id)
         project = project_repository.project_to_dict(project_obj)
     except Project.DoesNotExist as exc:
         raise Http404("Project not found") from exc
@@ -520,7 +521,7 @@ def project_research_notes_export_pdf_api(request, project_id: str):
     if not project_repository.can_view_project(project_id, profile):
         return JsonResponse({"detail": "권한이 없습니다."}, status=403)
 
-    project_obj = Project.objects.filter(id=project_id).first()
+    project_obj = Project.objects.select_related("company").filter(id=project_id).first()
     if not project_obj:
         return JsonResponse({"detail": "프로젝트를 찾을 수 없습니다."}, status=404)
 
@@ -534,7 +535,8 @@ def project_research_notes_export_pdf_api(request, project_id: str):
         if not isinstance(page_images, list) or not page_images:
             return JsonResponse({"detail": "내보낼 페이지 이미지가 없습니다."}, status=400)
 
-        writer = PdfWriter()
+        writer = pdf_toolkit.PdfWriter()
+        merged_images = 0
 
         for image_data in page_images:
             raw = str(image_data or "")
@@ -542,28 +544,31 @@ def project_research_notes_export_pdf_api(request, project_id: str):
                 continue
             try:
                 encoded = raw.split(",", 1)[1]
-                reader = ImageReader(BytesIO(base64.b64decode(encoded)))
+                reader = pdf_toolkit.ImageReader(BytesIO(base64.b64decode(encoded)))
             except Exception:
                 continue
 
             page_buffer = BytesIO()
-            pdf = canvas.Canvas(page_buffer, pagesize=A4)
-            pw, ph = A4
+            pdf = pdf_toolkit.canvas.Canvas(page_buffer, pagesize=pdf_toolkit.A4)
+            pw, ph = pdf_toolkit.A4
             # 화면 그대로 A4로 맞춰 삽입
             pdf.drawImage(reader, 0, 0, width=pw, height=ph, preserveAspectRatio=False)
             pdf.showPage()
             pdf.save()
             page_buffer.seek(0)
-            writer.append(PdfReader(page_buffer, strict=False))
+            writer.append(pdf_toolkit.PdfReader(page_buffer, strict=False))
+            merged_images += 1
 
-        if not writer.pages:
+        if not merged_images:
             return JsonResponse({"detail": "유효한 페이지 이미지가 없습니다."}, status=400)
 
         output = BytesIO()
         writer.write(output)
+        metrics.PDF_MERGE_BYTES.observe(output.getbuffer().nbytes, kind="viewer_snapshot")
+        metrics.PDF_MERGE_FILES.observe(merged_images, kind="viewer_snapshot")
         output.seek(0)
         filename = f"project_{project_id}_research_notes_viewer_snapshot.pdf"
-        return FileResponse(output, as_attachment=True, filename=filename, content_type="application/pdf")
+        return StreamingFileResponse(output, as_attachment=True, filename=filename, content_type="application/pdf")
 
     project = project_repository.project_to_dict(project_obj)
     manager_display = project.get("manager", "-")
@@ -573,8 +578,9 @@ def project_research_notes_export_pdf_api(request, project_id: str):
     cover_pdf_bytes = _get_or_build_project_cover_pdf_bytes(profile, project_id, cover_data)
 
     # 2) PDF 단순 병합 (표지 + 각 연구파일을 순서대로)
-    writer = PdfWriter()
-    writer.append(PdfReader(BytesIO(cover_pdf_bytes), strict=False))
+    writer = pdf_toolkit.PdfWriter()
+    with timing_span("merge"):
+        writer.append(pdf_toolkit.PdfReader(BytesIO(cover_pdf_bytes), strict=False))
 
     note_ids = project_repository.project_note_ids(project_id)
     all_notes = research_note_repository.list_research_notes()
@@ -607,16 +613,20 @@ def project_research_notes_export_pdf_api(request, project_id: str):
                 if file_pdf_bytes is None:
                     file_pdf_bytes = build_research_note_file_pdf(note_id, file_id)
                     _write_research_note_pdf_cache(note_id, file_id, file_pdf_bytes)
-                writer.append(PdfReader(BytesIO(file_pdf_bytes), strict=False))
+                with timing_span("merge"):
+                    writer.append(pdf_toolkit.PdfReader(BytesIO(file_pdf_bytes), strict=False))
                 merged_files += 1
             except Exception:
                 continue
 
     output = BytesIO()
-    writer.write(output)
+    with timing_span("merge"):
+        writer.write(output)
+    metrics.PDF_MERGE_BYTES.observe(output.getbuffer().nbytes, kind="project_export")
+    metrics.PDF_MERGE_FILES.observe(merged_files, kind="project_export")
     output.seek(0)
     filename = f"project_{project_id}_research_notes.pdf"
-    response = FileResponse(output, as_attachment=True, filename=filename, content_type="application/pdf")
+    response = StreamingFileResponse(output, as_attachment=True, filename=filename, content_type="application/pdf")
     response["X-Merged-File-Count"] = str(merged_files)
     response["X-Total-File-Count"] = str(total_files)
     return response
@@ -666,24 +676,24 @@ def project_upload_research_note_api(request, project_id: str):
     updated_text = _display_datetime(request.POST.get("updated_at"))
 
     storage_root = Path(settings.RESEARCH_NOTES_STORAGE_ROOT)
+    username = str(profile.get("username") or "anonymous").strip() or "anonymous"
     note = ResearchNote.objects.create(
         project=project,
         title=title,
         owner=owner_name,
+        owner_username=username,
         project_code=project.code,
         period=updated_text,
-        files=1,
-        members=1,
         summary=summary,
     )
 
-    username = str(profile.get("username") or "anonymous").strip() or "anonymous"
     note_folder = storage_root / username / str(note.id)
     note_folder.mkdir(parents=True, exist_ok=True)
     target_path = note_folder / safe_name
     with target_path.open("wb") as destination:
         for chunk in upload.chunks():
             destination.write(chunk)
+    metrics.UPLOAD_BYTES.inc(upload.size, endpoint="project_research_note")
 
     ResearchNoteFile.objects.create(
         note=note,
@@ -703,7 +713,7 @@ def project_cover_print_api(request, project_id: str):
     if not project_repository.can_view_project(project_id, profile):
         return JsonResponse({"detail": "권한이 없습니다."}, status=403)
 
-    project_obj = Project.objects.filter(id=project_id).first()
+    project_obj = Project.objects.select_related("company").filter(id=project_id).first()
     if not project_obj:
         return JsonResponse({"detail": "프로젝트를 찾을 수 없습니다."}, status=404)
 
@@ -712,7 +722,37 @@ def project_cover_print_api(request, project_id: str):
     cover_data = _load_cover_data(project_obj, project, manager_display)
 
     pdf_bytes = _get_or_build_project_cover_pdf_bytes(profile, project_id, cover_data)
-    return FileResponse(BytesIO(pdf_bytes), as_attachment=True, filename=f"project_{project_id}_cover.pdf", content_type="application/pdf")
+    return StreamingFileResponse(BytesIO(pdf_bytes), as_attachment=True, filename=f"project_{project_id}_cover.pdf", content_type="application/pdf")
+
+
+@require_GET
+def project_cover_image_api(request, project_id: str):
+    profile = effective_user_profile(request) or {}
+    if not project_repository.can_view_project(project_id, profile):
+        return JsonResponse({"detail": "권한이 없습니다."}, status=403)
+
+    cover = ProjectNoteCover.objects.filter(project_id=project_id).only("cover_image_hash", "cover_image_mime").first()
+    if not cover or not cover.cover_image_hash:
+        raise Http404("Cover image not found")
+
+    source = cover_asset_path(project_id, cover.cover_image_hash, cover.cover_image_mime)
+    content_type = cover.cover_image_mime or "application/octet-stream"
+    if request.GET.get("variant") == "preview":
+        preview = cover_preview_path(project_id, cover.cover_image_hash)
+        if preview.is_file():
+            source, content_type = preview, "image/png"
+    if not source.is_file():
+        raise Http404("Cover image not found")
+
+    response = StreamingFileResponse(source.open("rb"), content_type=content_type)
+    response["X-Content-Type-Options"] = "nosniff"
+    if content_type not in COVER_ASSET_EXTENSIONS:
+        # Covers stored before SVG uploads were refused are never rendered from this origin.
+        response["Content-Disposition"] = "attachment"
+        response["Content-Security-Policy"] = "sandbox"
+    if request.GET.get("v") == cover.cover_image_hash[:16]:
+        response["Cache-Control"] = "private, max-age=31536000, immutable"
+    return response
 
 
 @require_http_methods(["POST"])
@@ -745,7 +785,7 @@ def project_cover_update_api(request, project_id: str):
         return JsonResponse({"detail": "프로젝트를 찾을 수 없습니다."}, status=404)
 
     try:
-        cover, _ = ProjectNoteCover.objects.get_or_create(project=project)
+        cover, _ = ProjectNoteCover.objects.defer("cover_image_data_url").get_or_create(project=project)
     except (OperationalError, ProgrammingError):
         return JsonResponse({"detail": "DB 스키마가 최신이 아닙니다. python manage.py migrate 를 먼저 실행해주세요."}, status=409)
 
@@ -779,7 +819,16 @@ def project_cover_update_api(request, project_id: str):
     cover.show_org = _as_bool("show_org", True)
     cover.show_manager = _as_bool("show_manager", True)
     cover.show_period = _as_bool("show_period", True)
-    cover.cover_image_data_url = str(request.POST.get("cover_image_data_url", cover.cover_image_data_url or "")).strip()
+    if "cover_image_data_url" in request.POST:
+        image_data_url = str(request.POST.get("cover_image_data_url", "")).strip()
+        if image_data_url:
+            image_hash, image_mime = store_cover_data_url(project_id, image_data_url)
+            if not image_hash:
+                return JsonResponse({"detail": "유효한 표지 이미지가 아닙니다."}, status=400)
+        else:
+            image_hash, image_mime = "", ""
+        cover.cover_image_hash = image_hash
+        cover.cover_image_mime = image_mime
     cover.save()
     _invalidate_project_cover_pdf_cache(project_id)
     return JsonResponse({"message": "표지 설정이 저장되었습니다."}, status=200)
@@ -0,0 +1,101 @@
+import base64
+import hashlib
+import mimetypes
+from io import BytesIO
+from pathlib import Path
+
+from django.conf import settings
+
+COVER_PREVIEW_MAX_SIZE = (420, 594)
+# Raster images and PDF only: covers are served from the app origin, where an SVG's scripts
+# would run in the viewer's session.
+COVER_ASSET_EXTENSIONS = {
+    "image/png": "png",
+    "image/jpeg": "jpg",
+    "image/webp": "webp",
+    "image/gif": "gif",
+    "application/pdf": "pdf",
+}
+
+
+def decode_data_url(data_url: str) -> tuple[str, bytes]:
+    raw = str(data_url or "")
+    if not raw.startswith("data:") or "," not in raw:
+        return "", b""
+    header, encoded = raw.split(",", 1)
+    mime = header[5:].split(";", 1)[0].lower()
+    try:
+        return mime, base64.b64decode(encoded)
+    except Exception:
+        return "", b""
+
+
+def _cover_asset_extension(mime: str) -> str:
+    extension = COVER_ASSET_EXTENSIONS.get(mime)
+    if extension:
+        return extension
+    guessed = mimetypes.guess_extension(mime or "") or ".bin"
+    return guessed.lstrip(".")
+
+
+def cover_asset_dir(project_id: str) -> Path:
+    return Path(settings.RESEARCH_NOTES_STORAGE_ROOT) / "_cover_assets" / str(project_id)
+
+
+def cover_asset_path(project_id: str, image_hash: str, mime: str) -> Path:
+    return cover_asset_dir(project_id) / f"{image_hash}.{_cover_asset_extension(mime)}"
+
+
+def cover_preview_path(project_id: str, image_hash: str) -> Path:
+    return cover_asset_dir(project_id) / f"{image_hash}_preview.png"
+
+
+def _write_cover_preview(path: Path, payload: bytes) -> None:
+    try:
+        from PIL import Image
+
+        with Image.open(BytesIO(payload)) as image:
+            image.thumbnail(COVER_PREVIEW_MAX_SIZE)
+            if image.mode not in {"RGB", "RGBA", "L"}:
+                image = image.convert("RGBA")
+            image.save(path, format="PNG", optimize=True)
+    except Exception:
+        return
+
+
+def store_cover_asset(project_id: str, mime: str, payload: bytes) -> str:
+    """Write the original cover file and its preview under a content hash and return the hash."""
+    image_hash = hashlib.sha256(payload).hexdigest()
+    original = cover_asset_path(project_id, image_hash, mime)
+    original.parent.mkdir(parents=True, exist_ok=True)
+    if not original.exists():
+        original.write_bytes(payload)
+
+    preview = cover_preview_path(project_id, image_hash)
+    if mime.startswith("image/") and not preview.exists():
+        _write_cover_preview(preview, payload)
+    return image_hash
+
+
+def store_cover_data_url(project_id: str, data_url: str) -> tuple[str, str]:
+    mime, payload = decode_data_url(data_url)
+    if not payload or mime not in COVER_ASSET_EXTENSIONS:
+        return "", ""
+    return store_cover_asset(project_id, mime, payload), mime
+
+
+def read_cover_asset(project_id: str, image_hash: str, mime: str) -> bytes | None:
+    if not image_hash:
+        return None
+    path = cover_asset_path(project_id, image_hash, mime)
+    try:
+        return path.read_bytes() if path.is_file() else None
+    except Exception:
+        return None
+
+
+def cover_image_url(project_id: str, image_hash: str, preview: bool = False) -> str:
+    if not image_hash:
+        return ""
+    url = f"/api/v1/projects/{project_id}/cover/image?v={image_hash[:16]}"
+    return f"{url}&variant=preview" if preview else url
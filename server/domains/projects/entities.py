@@ -19,3 +19,12 @@ class CreateProjectCommand:
 class InvitedMemberCommand:
     user_id: int
     role: str
+
+
+@dataclass(frozen=True)
+class ProjectAccess:
+    user_id: int | None
+    role: str
+    team_id: int | None
+    member_project_ids: frozenset[str]
+    is_super_admin: bool = False
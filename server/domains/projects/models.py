@@ -21,6 +21,10 @@ class Project(TimestampedModel):
     description = models.TextField(blank=True, default="")
     start_date = models.DateField(null=True, blank=True)
     end_date = models.DateField(null=True, blank=True)
+    note_count = models.PositiveIntegerField(default=0)
+    file_count = models.PositiveIntegerField(default=0)
+    last_activity_at = models.DateTimeField(null=True, blank=True)
+    content_version = models.PositiveIntegerField(default=1)
 
 
 class ProjectMember(TimestampedModel):
@@ -51,3 +55,5 @@ class ProjectNoteCover(TimestampedModel):
     show_manager = models.BooleanField(default=True)
     show_period = models.BooleanField(default=True)
     cover_image_data_url = models.TextField(blank=True, default="")
+    cover_image_hash = models.CharField(max_length=64, blank=True, default="")
+    cover_image_mime = models.CharField(max_length=100, blank=True, default="")
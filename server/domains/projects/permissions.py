@@ -0,0 +1,122 @@
+import hashlib
+from collections.abc import Iterable
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.exceptions import ValidationError
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from server.domains.admin.models import UserAccount
+
+from .entities import ProjectAccess
+from .models import Project, ProjectMember
+
+MANAGER_ROLES = {UserAccount.Role.OWNER, UserAccount.Role.ADMIN}
+SUPER_ADMIN_ACCESS = ProjectAccess(user_id=None, role="", team_id=None, member_project_ids=frozenset(), is_super_admin=True)
+
+
+def _access_cache_key(username: str) -> str:
+    return f"projectnote:project_access:{hashlib.sha1(username.encode('utf-8')).hexdigest()}"
+
+
+def _access_cache():
+    return caches["project_access"]
+
+
+class ProjectPermissionService:
+    """Answers project visibility checks from a cached per-user role/team/membership snapshot."""
+
+    def access_for(self, profile: dict | None) -> ProjectAccess | None:
+        if not profile:
+            return None
+        if profile.get("is_super_admin"):
+            return SUPER_ADMIN_ACCESS
+        username = str(profile.get("username", "")).strip()
+        if not username:
+            return None
+
+        key = _access_cache_key(username)
+        access = _access_cache().get(key)
+        if access is None:
+            access = self._load_access(username)
+            if access is None:
+                return None
+            _access_cache().set(key, access, getattr(settings, "PROJECT_ACCESS_CACHE_TIMEOUT", 60))
+        return access
+
+    @staticmethod
+    def _load_access(username: str) -> ProjectAccess | None:
+        user = UserAccount.objects.filter(username=username).values("id", "role", "team_id").first()
+        if not user:
+            return None
+        member_project_ids = frozenset(
+            str(project_id)
+            for project_id in ProjectMember.objects.filter(user_id=user["id"]).values_list("project_id", flat=True)
+        )
+        return ProjectAccess(
+            user_id=user["id"],
+            role=user["role"],
+            team_id=user["team_id"],
+            member_project_ids=member_project_ids,
+        )
+
+    @staticmethod
+    def is_manager(access: ProjectAccess) -> bool:
+        return access.is_super_admin or access.role in MANAGER_ROLES
+
+    def can_view(self, project_id: str, profile: dict | None) -> bool:
+        return str(project_id) in self.viewable_project_ids([project_id], profile)
+
+    def viewable_project_ids(self, project_ids: Iterable[str], profile: dict | None) -> set[str]:
+        access = self.access_for(profile)
+        requested = {str(project_id) for project_id in project_ids}
+        if access is None:
+            return set()
+        if self.is_manager(access):
+            return requested
+        return requested & access.member_project_ids
+
+    def can_manage_members(self, project_id: str, profile: dict | None) -> bool:
+        return str(project_id) in self.manageable_project_ids([project_id], profile)
+
+    def manageable_project_ids(self, project_ids: Iterable[str], profile: dict | None) -> set[str]:
+        access = self.access_for(profile)
+        if access is None or not self.is_manager(access):
+            return set()
+        requested = {str(project_id) for project_id in project_ids}
+        if access.is_super_admin:
+            return requested
+
+        try:
+            company_ids = dict(Project.objects.filter(id__in=requested).values_list("id", "company_id"))
+        except ValidationError:
+            return set()
+        return {
+            str(project_id)
+            for project_id, company_id in company_ids.items()
+            if not (access.team_id and company_id) or access.team_id == company_id
+        }
+
+    @staticmethod
+    def invalidate(username: str) -> None:
+        if username:
+            _access_cache().delete(_access_cache_key(username))
+
+
+@receiver(post_save, sender=UserAccount)
+@receiver(post_delete, sender=UserAccount)
+def _invalidate_user_access(sender, instance: UserAccount, **kwargs) -> None:
+    ProjectPermissionService.invalidate(instance.username)
+
+
+@receiver(post_save, sender=ProjectMember)
+@receiver(post_delete, sender=ProjectMember)
+def _invalidate_member_access(sender, instance: ProjectMember, **kwargs) -> None:
+    if not instance.user_id:
+        return
+    if ProjectMember.user.is_cached(instance):
+        username = instance.user.username
+    else:
+        username = UserAccount.objects.filter(id=instance.user_id).values_list("username", flat=True).first()
+    ProjectPermissionService.invalidate(username or "")
@@ -1,76 +1,107 @@
 from collections import defaultdict
 from datetime import datetime
 
+from django.db.models.functions import Coalesce
+
 from server.domains.research_notes.models import ResearchNote
 from server.domains.admin.models import Team, UserAccount
 
 from .models import Project, ProjectMember
 
 from .entities import CreateProjectCommand, InvitedMemberCommand
+from .permissions import ProjectPermissionService
+
+PROJECT_FIELDS = (
+    "id",
+    "name",
+    "status",
+    "manager",
+    "business_name",
+    "organization",
+    "company_id",
+    "company_name",
+    "code",
+    "description",
+    "start_date",
+    "end_date",
+    "note_count",
+    "file_count",
+    "last_activity_at",
+)
 
 
 class ProjectRepository:
-    def list_projects(self) -> list[dict]:
-        return [self.project_to_dict(project) for project in Project.objects.order_by("-created_at")]
+    def __init__(self, permissions: ProjectPermissionService | None = None) -> None:
+        self.permissions = permissions or ProjectPermissionService()
 
-    def visible_projects_for_user(self, profile: dict | None) -> list[dict]:
-        if not profile:
-            return []
+    def list_projects(self, fields: list[str] | None = None) -> list[dict]:
+        return self.project_rows(Project.objects.order_by("-created_at"), fields)
 
-        if profile.get("is_super_admin"):
-            return self.list_projects()
+    async def alist_projects(self, fields: list[str] | None = None) -> list[dict]:
+        return [self._project_row(row) async for row in self._project_values(Project.objects.order_by("-created_at"), fields)]
 
-        username = str(profile.get("username", "")).strip()
-        if not username:
+    def visible_projects_for_user(self, profile: dict | None, fields: list[str] | None = None) -> list[dict]:
+        access = self.permissions.access_for(profile)
+        if access is None:
             return []
 
-        user = UserAccount.objects.filter(username=username).first()
-        if not user:
-            return []
+        if access.is_super_admin:
+            return self.list_projects(fields)
 
-        if user.role in {UserAccount.Role.OWNER, UserAccount.Role.ADMIN}:
-            if user.team_id:
-                projects = Project.objects.filter(company_id=user.team_id).order_by("-created_at")
+        if self.permissions.is_manager(access):
+            if access.team_id:
+                projects = Project.objects.filter(company_id=access.team_id).order_by("-created_at")
             else:
                 projects = Project.objects.order_by("-created_at")
-            return [self.project_to_dict(project) for project in projects]
+            return self.project_rows(projects, fields)
+
+        if not access.member_project_ids:
+            return []
+        projects = Project.objects.filter(id__in=access.member_project_ids).order_by("-created_at")
+        return self.project_rows(projects, fields)
+
+    def search_scope(self, profile: dict | None) -> dict:
+        """Search filter matching visible_projects_for_user(): no filter for the super admin and
+        teamless managers, a team id for team managers, explicit project ids only for members."""
+        access = self.permissions.access_for(profile)
+        if access is None:
+            return {"project_ids": []}
+        if self.permissions.is_manager(access):
+            return {"team_id": access.team_id} if access.team_id else {}
+        return {"project_ids": sorted(access.member_project_ids)}
+
+    @staticmethod
+    def parse_project_fields(raw: str | None) -> list[str] | None:
+        requested = [field.strip() for field in str(raw or "").split(",") if field.strip()]
+        fields = [field for field in PROJECT_FIELDS if field in requested]
+        return fields or None
+
+    @classmethod
+    def project_rows(cls, queryset, fields: list[str] | None = None) -> list[dict]:
+        """Serialize projects from a values() projection; company name is joined in SQL."""
+        return [cls._project_row(row) for row in cls._project_values(queryset, fields)]
 
-        project_ids = ProjectMember.objects.filter(user_id=user.id).values_list("project_id", flat=True)
-        projects = Project.objects.filter(id__in=project_ids).order_by("-created_at")
-        return [self.project_to_dict(project) for project in projects]
+    @staticmethod
+    def _project_values(queryset, fields: list[str] | None = None):
+        fields = list(fields or PROJECT_FIELDS)
+        if "company_name" in fields:
+            queryset = queryset.annotate(company_name=Coalesce("company__name", "organization"))
+        return queryset.values(*fields)
+
+    @staticmethod
+    def _project_row(row: dict) -> dict:
+        if "id" in row:
+            row["id"] = str(row["id"])
+        for date_field in ("start_date", "end_date", "last_activity_at"):
+            if date_field in row:
+                row[date_field] = row[date_field].isoformat() if row[date_field] else ""
+        return row
 
     def can_view_project(self, project_id: str, profile: dict | None) -> bool:
-        if not profile:
-            return False
-        if profile.get("is_super_admin"):
-            return True
-        username = str(profile.get("username", "")).strip()
-        if not username:
-            return False
-        user = UserAccount.objects.filter(username=username).first()
-        if not user:
-            return False
-        if user.role in {UserAccount.Role.OWNER, UserAccount.Role.ADMIN}:
-            return True
-        return ProjectMember.objects.filter(project_id=project_id, user_id=user.id).exists()
+        return self.permissions.can_view(project_id, profile)
 
     def can_manage_project_members(self, project_id: str, profile: dict | None) -> bool:
-        if not profile:
-            return False
-        if profile.get("is_super_admin"):
-            return True
-        username = str(profile.get("username", "")).strip()
-        if not username:
-            return False
-        user = UserAccount.objects.select_related("team").filter(username=username).first()
-        if not user or user.role not in {UserAccount.Role.OWNER, UserAccount.Role.ADMIN}:
-            return False
-        project = Project.objects.filter(id=project_id).first()
-        if not project:
-            return False
-        if user.team_id and project.company_id:
-            return user.team_id == project.company_id
-        return True
+        return self.permissions.can_manage_members(project_id, profile)
 
     def get_project(self, project_id: str) -> Project:
         return Project.objects.get(id=project_id)
@@ -162,7 +193,14 @@ class ProjectRepository:
         if status in {choice for choice, _ in Project.Status.choices}:
             project.status = status
 
-        project.save()
+        # Only the edited columns: note_count/file_count/last_activity_at/content_version are bumped
+        # in SQL by the stats signals, and saving the loaded copy would roll back concurrent bumps.
+        project.save(
+            update_fields=[
+                "name", "manager", "business_name", "organization", "code", "description",
+                "start_date", "end_date", "status", "updated_at",
+            ]
+        )
         return self.project_to_dict(project)
 
     def project_note_ids(self, project_id: str) -> list[str]:
@@ -214,4 +252,8 @@ class ProjectRepository:
             "description": project.description,
             "start_date": project.start_date.isoformat() if project.start_date else "",
             "end_date": project.end_date.isoformat() if project.end_date else "",
+            "note_count": project.note_count,
+            "file_count": project.file_count,
+            "last_activity_at": project.last_activity_at.isoformat() if project.last_activity_at else "",
+            "content_version": project.content_version,
         }
@@ -1,3 +1,5 @@
 from .repository import ResearchNoteRepository
+from .search import ResearchNoteSearchIndex
+from .text_extraction import ResearchNoteTextExtractor
 
-__all__ = ["ResearchNoteRepository"]
+__all__ = ["ResearchNoteRepository", "ResearchNoteSearchIndex", "ResearchNoteTextExtractor"]
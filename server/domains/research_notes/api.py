@@ -1,48 +1,32 @@
 import base64
 import mimetypes
+import time
 from datetime import datetime
 from io import BytesIO
 from pathlib import Path
 
+from asgiref.sync import sync_to_async
 from django.conf import settings
-from django.http import FileResponse, Http404, JsonResponse
+from django.http import Http404, JsonResponse
 from django.shortcuts import render
 from django.views.decorators.csrf import ensure_csrf_cookie
 from django.views.decorators.http import require_GET, require_http_methods
-from pypdf import PageObject, PdfReader, PdfWriter, Transformation
-from reportlab.lib.pagesizes import A4
-from reportlab.lib.utils import ImageReader
-from reportlab.pdfbase import pdfmetrics
-from reportlab.pdfbase.cidfonts import UnicodeCIDFont
-from reportlab.pdfgen import canvas
 
 from .models import ResearchNote
 from server.domains.admin.models import UserAccount
-from server.application.web_support import login_required_page, page_context, research_note_repository, signature_repository
-
-
-def _setup_korean_font() -> str | None:
-    for font_name in ("HYGothic-Medium", "HYSMyeongJo-Medium"):
-        try:
-            pdfmetrics.getFont(font_name)
-            return font_name
-        except KeyError:
-            try:
-                pdfmetrics.registerFont(UnicodeCIDFont(font_name))
-                return font_name
-            except Exception:
-                continue
-    return None
-
-
-KOREAN_PDF_FONT = _setup_korean_font()
-
-
-def _set_pdf_font(pdf, size: int, bold: bool = False) -> None:
-    if KOREAN_PDF_FONT:
-        pdf.setFont(KOREAN_PDF_FONT, size)
-        return
-    pdf.setFont("Helvetica-Bold" if bold else "Helvetica", size)
+from server.application import metrics, pdf_toolkit
+from server.application.instrumentation import timing_span
+from server.application.web_support import (
+    deferred,
+    effective_user_profile,
+    login_required_page,
+    page_context,
+    project_repository,
+    research_note_repository,
+    research_note_search_index,
+    signature_repository,
+    StreamingFileResponse,
+)
 
 
 def _research_note_pdf_cache_path(note_id: str, file_id: str) -> Path:
@@ -51,21 +35,35 @@ def _research_note_pdf_cache_path(note_id: str, file_id: str) -> Path:
 
 def _read_research_note_pdf_cache(note_id: str, file_id: str) -> bytes | None:
     cache_path = _research_note_pdf_cache_path(note_id, file_id)
-    if cache_path.exists() and cache_path.is_file():
-        try:
-            return cache_path.read_bytes()
-        except Exception:
-            return None
+    with timing_span("io"):
+        if cache_path.exists() and cache_path.is_file():
+            try:
+                cached = cache_path.read_bytes()
+                metrics.PDF_CACHE_REQUESTS.inc(cache="note_file", result="hit")
+                return cached
+            except Exception:
+                pass
+    metrics.PDF_CACHE_REQUESTS.inc(cache="note_file", result="miss")
+    return None
+
+
+def _research_note_pdf_cache_file(note_id: str, file_id: str) -> Path | None:
+    cache_path = _research_note_pdf_cache_path(note_id, file_id)
+    if cache_path.is_file():
+        metrics.PDF_CACHE_REQUESTS.inc(cache="note_file", result="hit")
+        return cache_path
+    metrics.PDF_CACHE_REQUESTS.inc(cache="note_file", result="miss")
     return None
 
 
 def _write_research_note_pdf_cache(note_id: str, file_id: str, pdf_bytes: bytes) -> None:
     cache_path = _research_note_pdf_cache_path(note_id, file_id)
-    try:
-        cache_path.parent.mkdir(parents=True, exist_ok=True)
-        cache_path.write_bytes(pdf_bytes)
-    except Exception:
-        return
+    with timing_span("io"):
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            cache_path.write_bytes(pdf_bytes)
+        except Exception:
+            return
 
 
 def _invalidate_research_note_pdf_cache(note_id: str, file_id: str) -> None:
@@ -78,8 +76,45 @@ def _invalidate_research_note_pdf_cache(note_id: str, file_id: str) -> None:
 
 
 @require_GET
-def research_notes_api(_request):
-    return JsonResponse(research_note_repository.list_research_notes(), safe=False)
+async def research_notes_api(_request):
+    return JsonResponse(await research_note_repository.alist_research_notes(), safe=False)
+
+
+def _search_request_args(request) -> tuple[dict, JsonResponse | None]:
+    profile = effective_user_profile(request)
+    access = project_repository.permissions.access_for(profile)
+    if access is None:
+        return {}, JsonResponse({"detail": "로그인이 필요합니다."}, status=401)
+
+    try:
+        page = int(request.GET.get("page", "1"))
+        page_size = int(request.GET.get("page_size", "20"))
+    except ValueError:
+        return {}, JsonResponse({"detail": "page와 page_size는 숫자여야 합니다."}, status=400)
+
+    return {
+        "query": request.GET.get("q", "").strip(),
+        **project_repository.search_scope(profile),
+        "owner_username": str((profile or {}).get("username", "")).strip(),
+        "page": page,
+        "page_size": page_size,
+    }, None
+
+
+@require_GET
+def research_note_search_api(request):
+    search_args, error = _search_request_args(request)
+    if error:
+        return error
+    return JsonResponse(research_note_search_index.search(**search_args))
+
+
+@require_GET
+def research_note_page_search_api(request):
+    search_args, error = _search_request_args(request)
+    if error:
+        return error
+    return JsonResponse(research_note_search_index.search_pages(**search_args))
 
 
 @require_GET
@@ -121,8 +156,8 @@ def research_note_detail_page(request, note_id: str):
             request,
             {
                 "note": note,
-                "files": research_note_repository.list_note_files(note_id),
-                "folders": research_note_repository.list_note_folders(note_id),
+                "files": deferred(research_note_repository.list_note_files, note_id),
+                "folders": deferred(research_note_repository.list_note_folders, note_id),
             },
         ),
     )
@@ -215,6 +250,8 @@ def research_note_viewer_page(request, note_id: str):
     except ResearchNote.DoesNotExist as exc:
         raise Http404("Research note not found") from exc
 
+    page_raw = request.GET.get("page", "")
+    context_data["selected_page"] = int(page_raw) if page_raw.isdigit() and int(page_raw) > 0 else 1
     return render(request, "research_notes/viewer.html", page_context(request, context_data))
 
 
@@ -233,32 +270,28 @@ def research_note_printable_page(request, note_id: str):
 @require_GET
 @ensure_csrf_cookie
 @login_required_page
-def research_note_file_content_page(request, note_id: str, file_id: str):
+async def research_note_file_content_page(request, note_id: str, file_id: str):
     try:
-        note_file = research_note_repository.get_note_file(note_id, file_id)
+        note_file = await research_note_repository.aget_note_file(note_id, file_id)
     except Exception as exc:
         raise Http404("Research note file not found") from exc
 
     safe_name = Path(note_file["name"]).name
-    candidates = [Path(folder) / safe_name for folder in research_note_repository.list_note_folders(note_id)]
-    if not candidates:
-        storage_root = Path(settings.RESEARCH_NOTES_STORAGE_ROOT)
-        candidates = list(storage_root.glob(f"*/{note_id}/{safe_name}"))
-
-    source = next((c for c in candidates if c.exists() and c.is_file()), None)
+    source = await research_note_repository.aresolve_note_file_path(note_id, safe_name)
     if not source:
         raise Http404("Research note file content not found")
 
     content_type = mimetypes.guess_type(safe_name)[0] or "application/octet-stream"
     as_attachment = request.GET.get("download") == "1"
-    return FileResponse(source.open("rb"), as_attachment=as_attachment, filename=safe_name, content_type=content_type)
+    handle = await sync_to_async(source.open, thread_sensitive=False)("rb")
+    return StreamingFileResponse(handle, as_attachment=as_attachment, filename=safe_name, content_type=content_type)
 
 
 @require_GET
 @ensure_csrf_cookie
 @login_required_page
-def research_note_viewer_export_pdf_api(request, note_id: str):
-    files = research_note_repository.list_note_files(note_id)
+async def research_note_viewer_export_pdf_api(request, note_id: str):
+    files = await research_note_repository.alist_note_files(note_id)
     if not files:
         raise Http404("Research note file not found")
 
@@ -270,20 +303,26 @@ def research_note_viewer_export_pdf_api(request, note_id: str):
             selected_file = matched
 
     file_id = str(selected_file["id"])
-    pdf_bytes = _read_research_note_pdf_cache(note_id, file_id)
-
-    if pdf_bytes is None:
+    filename = f"research_note_{note_id}_{Path(str(selected_file.get('name') or 'research_note')).stem}.pdf"
+    cache_path = await sync_to_async(_research_note_pdf_cache_file, thread_sensitive=False)(note_id, file_id)
+    if cache_path is not None:
         try:
-            pdf_bytes = build_research_note_file_pdf(note_id, file_id)
-        except ResearchNote.DoesNotExist as exc:
-            raise Http404("Research note not found") from exc
-        _write_research_note_pdf_cache(note_id, file_id, pdf_bytes)
+            handle = await sync_to_async(cache_path.open, thread_sensitive=False)("rb")
+        except OSError:
+            pass
+        else:
+            return StreamingFileResponse(handle, as_attachment=True, filename=filename, content_type="application/pdf")
 
-    filename = f"research_note_{note_id}_{Path(str(selected_file.get('name') or 'research_note')).stem}.pdf"
-    return FileResponse(BytesIO(pdf_bytes), as_attachment=True, filename=filename, content_type="application/pdf")
+    try:
+        pdf_bytes = await sync_to_async(build_research_note_file_pdf)(note_id, file_id)
+    except ResearchNote.DoesNotExist as exc:
+        raise Http404("Research note not found") from exc
+    await sync_to_async(_write_research_note_pdf_cache, thread_sensitive=False)(note_id, file_id, pdf_bytes)
+    return StreamingFileResponse(BytesIO(pdf_bytes), as_attachment=True, filename=filename, content_type="application/pdf")
 
 
 def build_research_note_file_pdf(note_id: str, file_id: str) -> bytes:
+    started = time.perf_counter()
     try:
         note = research_note_repository.get_research_note(note_id)
     except ResearchNote.DoesNotExist as exc:
@@ -296,12 +335,7 @@ def build_research_note_file_pdf(note_id: str, file_id: str) -> bytes:
     selected_file = next((item for item in files if item["id"] == file_id), files[0])
 
     safe_name = Path(selected_file["name"]).name
-    candidates = [Path(folder) / safe_name for folder in research_note_repository.list_note_folders(note_id)]
-    if not candidates:
-        storage_root = Path(settings.RESEARCH_NOTES_STORAGE_ROOT)
-        candidates = list(storage_root.glob(f"*/{note_id}/{safe_name}"))
-
-    source = next((c for c in candidates if c.exists() and c.is_file()), None)
+    source = research_note_repository.resolve_note_file_path(note_id, safe_name)
     if not source:
         raise Http404("Research note file content not found")
 
@@ -316,18 +350,20 @@ def build_research_note_file_pdf(note_id: str, file_id: str) -> bytes:
 
     manager_name = manager_user.display_name if manager_user else manager_raw
     reviewer_date = datetime.now().strftime("%Y.%m.%d / %I:%M %p")
-    author_signature_data_url = signature_repository.read_signature(author_user.username).get("signature_data_url", "") if author_user else ""
-    manager_signature_data_url = signature_repository.read_signature(manager_user.username).get("signature_data_url", "") if manager_user else ""
+    with timing_span("signature"):
+        author_signature_data_url = signature_repository.read_signature(author_user.username).get("signature_data_url", "") if author_user else ""
+        manager_signature_data_url = signature_repository.read_signature(manager_user.username).get("signature_data_url", "") if manager_user else ""
 
     def _image_reader_from_data_url(data_url: str):
         raw = str(data_url or "")
         if not raw.startswith("data:image") or "," not in raw:
             return None
-        try:
-            encoded = raw.split(",", 1)[1]
-            return ImageReader(BytesIO(base64.b64decode(encoded)))
-        except Exception:
-            return None
+        with timing_span("signature"):
+            try:
+                encoded = raw.split(",", 1)[1]
+                return pdf_toolkit.ImageReader(BytesIO(base64.b64decode(encoded)))
+            except Exception:
+                return None
 
     def _draw_signature_panel(pdf, left: float, bottom: float, width: float, *, compact: bool = False):
         col = width / 4
@@ -340,59 +376,60 @@ def build_research_note_file_pdf(note_id: str, file_id: str) -> bytes:
             x = left + idx * col
             pdf.line(x, bottom + box_h / 2, x + col, bottom + box_h / 2)
 
-        _set_pdf_font(pdf, 7 if compact else 8)
+        pdf_toolkit.set_pdf_font(pdf, 7 if compact else 8)
         pdf.drawString(left + 4, bottom + box_h - 10, "작성자")
         pdf.drawString(left + 4, bottom + (box_h / 2) - 10, "작성 일자")
-        _set_pdf_font(pdf, 9 if compact else 10)
+        pdf_toolkit.set_pdf_font(pdf, 9 if compact else 10)
         pdf.drawCentredString(left + col / 2, bottom + (box_h / 2) + 4, author_name)
         pdf.drawCentredString(left + col / 2, bottom + 8, created_text)
 
         x2 = left + col
-        _set_pdf_font(pdf, 7 if compact else 8)
+        pdf_toolkit.set_pdf_font(pdf, 7 if compact else 8)
         pdf.drawString(x2 + 4, bottom + box_h - 10, "사인")
         author_reader = _image_reader_from_data_url(author_signature_data_url)
         if author_reader:
             pdf.drawImage(author_reader, x2 + 10, bottom + 6, width=col - 20, height=(box_h - 20), preserveAspectRatio=True, anchor='c')
         else:
-            _set_pdf_font(pdf, 8 if compact else 9)
+            pdf_toolkit.set_pdf_font(pdf, 8 if compact else 9)
             pdf.drawCentredString(x2 + col / 2, bottom + (box_h / 2) - 2, "사인 없음")
 
         x3 = left + (col * 2)
-        _set_pdf_font(pdf, 7 if compact else 8)
+        pdf_toolkit.set_pdf_font(pdf, 7 if compact else 8)
         pdf.drawString(x3 + 4, bottom + box_h - 10, "점검자")
         pdf.drawString(x3 + 4, bottom + (box_h / 2) - 10, "점검 일자")
-        _set_pdf_font(pdf, 9 if compact else 10)
+        pdf_toolkit.set_pdf_font(pdf, 9 if compact else 10)
         pdf.drawCentredString(x3 + col / 2, bottom + (box_h / 2) + 4, manager_name or "-")
         pdf.drawCentredString(x3 + col / 2, bottom + 8, reviewer_date)
 
         x4 = left + (col * 3)
-        _set_pdf_font(pdf, 7 if compact else 8)
+        pdf_toolkit.set_pdf_font(pdf, 7 if compact else 8)
         pdf.drawString(x4 + 4, bottom + box_h - 10, "점검자 사인")
         manager_reader = _image_reader_from_data_url(manager_signature_data_url)
         if manager_reader:
             pdf.drawImage(manager_reader, x4 + 10, bottom + 6, width=col - 20, height=(box_h - 20), preserveAspectRatio=True, anchor='c')
         else:
-            _set_pdf_font(pdf, 8 if compact else 9)
+            pdf_toolkit.set_pdf_font(pdf, 8 if compact else 9)
             pdf.drawCentredString(x4 + col / 2, bottom + (box_h / 2) - 2, "사인 없음")
 
     def _overlay_signature_on_pdf_page(page):
         pw = float(page.mediabox.width)
         ph = float(page.mediabox.height)
         overlay_buffer = BytesIO()
-        pdf = canvas.Canvas(overlay_buffer, pagesize=(pw, ph))
-        _draw_signature_panel(pdf, left=24, bottom=32, width=pw - 48, compact=True)
-        pdf.save()
+        with timing_span("render"):
+            pdf = pdf_toolkit.canvas.Canvas(overlay_buffer, pagesize=(pw, ph))
+            _draw_signature_panel(pdf, left=24, bottom=32, width=pw - 48, compact=True)
+            pdf.save()
         overlay_buffer.seek(0)
-        overlay = PdfReader(overlay_buffer, strict=False)
+        overlay = pdf_toolkit.PdfReader(overlay_buffer, strict=False)
         page.merge_page(overlay.pages[0])
 
-    writer = PdfWriter()
+    writer = pdf_toolkit.PdfWriter()
     fmt = str(selected_file.get("format", "")).lower()
 
-    pw, ph = A4
+    pw, ph = pdf_toolkit.A4
     if fmt == "pdf":
-        with source.open("rb") as src:
-            reader = PdfReader(src, strict=False)
+        with timing_span("merge"), source.open("rb") as src:
+            reader = pdf_toolkit.PdfReader(src, strict=False)
             if getattr(reader, "is_encrypted", False):
                 try:
                     reader.decrypt("")
@@ -409,58 +446,62 @@ def build_research_note_file_pdf(note_id: str, file_id: str) -> bytes:
                 tx = (pw - (src_w * scale)) / 2
                 ty = (ph - (src_h * scale)) / 2
 
-                rebuilt = PageObject.create_blank_page(width=pw, height=ph)
-                rebuilt.merge_transformed_page(page, Transformation().scale(scale, scale).translate(tx, ty))
+                rebuilt = pdf_toolkit.PageObject.create_blank_page(width=pw, height=ph)
+                rebuilt.merge_transformed_page(page, pdf_toolkit.Transformation().scale(scale, scale).translate(tx, ty))
 
                 if idx == len(reader.pages) - 1:
                     _overlay_signature_on_pdf_page(rebuilt)
                 writer.add_page(rebuilt)
     else:
-        page_buffer = BytesIO()
-        pdf = canvas.Canvas(page_buffer, pagesize=A4)
+        with timing_span("render"):
+            page_buffer = BytesIO()
+            pdf = pdf_toolkit.canvas.Canvas(page_buffer, pagesize=pdf_toolkit.A4)
 
-        image_exts = {"png", "jpg", "jpeg", "webp", "svg", "heic", "heif"}
-        if fmt in image_exts:
-            try:
-                # 이미지 기반 연구노트는 A4 전체를 채우도록 렌더링
-                pdf.drawImage(str(source), 0, 0, width=pw, height=ph, preserveAspectRatio=False)
-            except Exception:
-                _set_pdf_font(pdf, 10)
-                pdf.drawString(40, ph - 40, "이미지를 불러오지 못했습니다. 원본파일을 확인해주세요.")
-            _draw_signature_panel(pdf, left=24, bottom=32, width=pw - 48, compact=True)
-        else:
-            sheet_left = 34
-            sheet_bottom = 42
-            sheet_width = pw - 68
-            sheet_height = ph - 84
-            pdf.roundRect(sheet_left, sheet_bottom, sheet_width, sheet_height, 8, stroke=1, fill=0)
-
-            header_top = sheet_bottom + sheet_height - 28
-            _set_pdf_font(pdf, 13, bold=True)
-            pdf.drawString(sheet_left + 16, header_top, str(note.get("title") or "연구노트"))
-            pdf.line(sheet_left + 16, header_top - 6, sheet_left + sheet_width - 16, header_top - 6)
-
-            content_left = sheet_left + 16
-            content_bottom = sheet_bottom + 92
-            content_width = sheet_width - 32
-            content_height = sheet_height - 160
-            pdf.roundRect(content_left, content_bottom, content_width, content_height, 4, stroke=1, fill=0)
-
-            _set_pdf_font(pdf, 11)
-            pdf.drawString(content_left + 12, content_bottom + content_height - 24, f"파일명: {selected_file.get('name', '-')}")
-            _set_pdf_font(pdf, 10)
-            pdf.drawString(content_left + 12, content_bottom + content_height - 42, f"형식: {fmt.upper() if fmt else '-'}")
-            pdf.drawString(content_left + 12, content_bottom + content_height - 60, "해당 파일 형식은 미리보기를 지원하지 않습니다.")
-
-            _draw_signature_panel(pdf, left=content_left, bottom=sheet_bottom + 24, width=content_width)
-
-        pdf.showPage()
-        pdf.save()
+            image_exts = {"png", "jpg", "jpeg", "webp", "svg", "heic", "heif"}
+            if fmt in image_exts:
+                try:
+                    # 이미지 기반 연구노트는 A4 전체를 채우도록 렌더링
+                    pdf.drawImage(str(source), 0, 0, width=pw, height=ph, preserveAspectRatio=False)
+                except Exception:
+                    pdf_toolkit.set_pdf_font(pdf, 10)
+                    pdf.drawString(40, ph - 40, "이미지를 불러오지 못했습니다. 원본파일을 확인해주세요.")
+                _draw_signature_panel(pdf, left=24, bottom=32, width=pw - 48, compact=True)
+            else:
+                sheet_left = 34
+                sheet_bottom = 42
+                sheet_width = pw - 68
+                sheet_height = ph - 84
+                pdf.roundRect(sheet_left, sheet_bottom, sheet_width, sheet_height, 8, stroke=1, fill=0)
+
+                header_top = sheet_bottom + sheet_height - 28
+                pdf_toolkit.set_pdf_font(pdf, 13, bold=True)
+                pdf.drawString(sheet_left + 16, header_top, str(note.get("title") or "연구노트"))
+                pdf.line(sheet_left + 16, header_top - 6, sheet_left + sheet_width - 16, header_top - 6)
+
+                content_left = sheet_left + 16
+                content_bottom = sheet_bottom + 92
+                content_width = sheet_width - 32
+                content_height = sheet_height - 160
+                pdf.roundRect(content_left, content_bottom, content_width, content_height, 4, stroke=1, fill=0)
+
+                pdf_toolkit.set_pdf_font(pdf, 11)
+                pdf.drawString(content_left + 12, content_bottom + content_height - 24, f"파일명: {selected_file.get('name', '-')}")
+                pdf_toolkit.set_pdf_font(pdf, 10)
+                pdf.drawString(content_left + 12, content_bottom + content_height - 42, f"형식: {fmt.upper() if fmt else '-'}")
+                pdf.drawString(content_left + 12, content_bottom + content_height - 60, "해당 파일 형식은 미리보기를 지원하지 않습니다.")
+
+                _draw_signature_panel(pdf, left=content_left, bottom=sheet_bottom + 24, width=content_width)
+
+            pdf.showPage()
+            pdf.save()
         page_buffer.seek(0)
-        writer.append(PdfReader(page_buffer, strict=False))
+        with timing_span("merge"):
+            writer.append(pdf_toolkit.PdfReader(page_buffer, strict=False))
 
     output = BytesIO()
-    writer.write(output)
+    with timing_span("merge"):
+        writer.write(output)
+    metrics.PDF_RENDER_SECONDS.observe(time.perf_counter() - started, format=fmt or "unknown")
     return output.getvalue()
 
 
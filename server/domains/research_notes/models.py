@@ -10,12 +10,14 @@ class ResearchNote(TimestampedModel):
     project = models.ForeignKey("workflow_app.Project", on_delete=models.CASCADE, related_name="notes", null=True, blank=True)
     title = models.CharField(max_length=255)
     owner = models.CharField(max_length=100)
+    owner_username = models.CharField(max_length=150, blank=True, default="", db_index=True)
     project_code = models.CharField(max_length=100, blank=True, default="")
     period = models.CharField(max_length=100, blank=True, default="")
     files = models.PositiveIntegerField(default=0)
     members = models.PositiveIntegerField(default=0)
     summary = models.TextField(blank=True, default="")
     last_updated_at = models.DateTimeField(auto_now=True)
+    content_version = models.PositiveIntegerField(default=1)
 
 
 class ResearchNoteFile(TimestampedModel):
@@ -29,3 +31,29 @@ class ResearchNoteFile(TimestampedModel):
 class ResearchNoteFolder(TimestampedModel):
     note = models.ForeignKey(ResearchNote, on_delete=models.CASCADE, related_name="folders")
     name = models.CharField(max_length=255)
+
+
+class ResearchNoteFileExtraction(TimestampedModel):
+    class Status(models.TextChoices):
+        PENDING = "pending", "pending"
+        DONE = "done", "done"
+        FAILED = "failed", "failed"
+
+    file = models.OneToOneField(ResearchNoteFile, on_delete=models.CASCADE, related_name="text_extraction")
+    status = models.CharField(max_length=20, choices=Status.choices, default=Status.PENDING)
+    next_page = models.PositiveIntegerField(default=0)
+    page_count = models.PositiveIntegerField(null=True, blank=True)
+    error = models.CharField(max_length=255, blank=True, default="")
+
+
+class ResearchNoteFilePage(TimestampedModel):
+    """Extracted text of one PDF page; the id is also its rowid in the research_note_page_search FTS table."""
+
+    file = models.ForeignKey(ResearchNoteFile, on_delete=models.CASCADE, related_name="pages")
+    page_number = models.PositiveIntegerField()
+    text = models.TextField(blank=True, default="")
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["file", "page_number"], name="unique_research_note_file_page"),
+        ]
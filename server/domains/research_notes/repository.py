@@ -1,3 +1,8 @@
+from pathlib import Path
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+
 from .models import ResearchNote, ResearchNoteFile, ResearchNoteFolder
 
 
@@ -5,6 +10,9 @@ class ResearchNoteRepository:
     def list_research_notes(self) -> list[dict]:
         return [self.note_to_dict(note) for note in ResearchNote.objects.order_by("-updated_at")]
 
+    async def alist_research_notes(self) -> list[dict]:
+        return [self.note_to_dict(note) async for note in ResearchNote.objects.order_by("-updated_at")]
+
     def get_research_note(self, note_id: str) -> dict:
         note = ResearchNote.objects.get(id=note_id)
         return self.note_to_dict(note)
@@ -19,17 +27,38 @@ class ResearchNoteRepository:
         return self.note_to_dict(note)
 
     def list_note_files(self, note_id: str) -> list[dict]:
-        return [
-            {"id": str(f.id), "name": f.name, "author": f.author, "format": f.format, "created": f.created}
-            for f in ResearchNoteFile.objects.filter(note_id=note_id).order_by("id")
-        ]
+        return [self._file_to_dict(f) for f in ResearchNoteFile.objects.filter(note_id=note_id).order_by("id")]
+
+    async def alist_note_files(self, note_id: str) -> list[dict]:
+        return [self._file_to_dict(f) async for f in ResearchNoteFile.objects.filter(note_id=note_id).order_by("id")]
 
     def list_note_folders(self, note_id: str) -> list[str]:
         return list(ResearchNoteFolder.objects.filter(note_id=note_id).order_by("id").values_list("name", flat=True))
 
+    async def alist_note_folders(self, note_id: str) -> list[str]:
+        return [name async for name in ResearchNoteFolder.objects.filter(note_id=note_id).order_by("id").values_list("name", flat=True)]
+
+    def resolve_note_file_path(self, note_id: str, file_name: str) -> Path | None:
+        return self._existing_note_file(note_id, file_name, self.list_note_folders(note_id))
+
+    async def aresolve_note_file_path(self, note_id: str, file_name: str) -> Path | None:
+        folders = await self.alist_note_folders(note_id)
+        return await sync_to_async(self._existing_note_file, thread_sensitive=False)(note_id, file_name, folders)
+
+    @staticmethod
+    def _existing_note_file(note_id: str, file_name: str, folders: list[str]) -> Path | None:
+        safe_name = Path(file_name).name
+        candidates = [Path(folder) / safe_name for folder in folders]
+        if not candidates:
+            storage_root = Path(settings.RESEARCH_NOTES_STORAGE_ROOT)
+            candidates = list(storage_root.glob(f"*/{note_id}/{safe_name}"))
+        return next((candidate for candidate in candidates if candidate.exists() and candidate.is_file()), None)
+
     def get_note_file(self, note_id: str, file_id: str) -> dict:
-        file = ResearchNoteFile.objects.get(id=file_id, note_id=note_id)
-        return {"id": str(file.id), "name": file.name, "author": file.author, "format": file.format, "created": file.created}
+        return self._file_to_dict(ResearchNoteFile.objects.get(id=file_id, note_id=note_id))
+
+    async def aget_note_file(self, note_id: str, file_id: str) -> dict:
+        return self._file_to_dict(await ResearchNoteFile.objects.aget(id=file_id, note_id=note_id))
 
     def update_note_file(self, note_id: str, file_id: str, author: str | None, created: str | None) -> dict:
         file = ResearchNoteFile.objects.get(id=file_id, note_id=note_id)
@@ -38,6 +67,10 @@ class ResearchNoteRepository:
         if created is not None:
             file.created = created.strip() or file.created
         file.save(update_fields=["author", "created", "updated_at"])
+        return self._file_to_dict(file)
+
+    @staticmethod
+    def _file_to_dict(file: ResearchNoteFile) -> dict:
         return {"id": str(file.id), "name": file.name, "author": file.author, "format": file.format, "created": file.created}
 
     @staticmethod
@@ -52,4 +85,5 @@ class ResearchNoteRepository:
             "members": note.members,
             "summary": note.summary,
             "last_updated_at": note.last_updated_at.isoformat() if note.last_updated_at else note.updated_at.isoformat(),
+            "content_version": note.content_version,
         }
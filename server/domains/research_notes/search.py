@@ -0,0 +1,279 @@
+import uuid
+from collections.abc import Iterable
+
+from django.db import connection
+
+SEARCH_TABLE = "research_note_search"
+SEARCH_IDS_TABLE = "research_note_search_ids"
+PAGE_SEARCH_TABLE = "research_note_page_search"
+# FTS columns in table order with their bm25() weights.
+SEARCH_COLUMN_WEIGHTS = {
+    "title": 10.0,
+    "summary": 4.0,
+    "owner": 2.0,
+    "project_code": 3.0,
+    "file_names": 5.0,
+    "file_authors": 1.0,
+}
+SEARCH_MAX_PAGE_SIZE = 100
+
+# Values for SEARCH_COLUMN_WEIGHTS, selected from a note aliased as "n".
+_DOCUMENT_VALUES_SQL = """
+    n.title, n.summary, n.owner, n.project_code,
+    (SELECT group_concat(f.name, ' ') FROM workflow_app_researchnotefile f WHERE f.note_id = n.id),
+    (SELECT group_concat(f.author, ' ') FROM workflow_app_researchnotefile f WHERE f.note_id = n.id)
+"""
+_INSERT_DOCUMENT_SQL = f"INSERT INTO {SEARCH_TABLE} (rowid, {', '.join(SEARCH_COLUMN_WEIGHTS)})"
+
+
+def _uuid_key(note_id) -> str:
+    # Django stores UUID primary keys as 32-character hex text on SQLite.
+    return uuid.UUID(str(note_id)).hex
+
+
+def build_match_query(raw: str) -> str:
+    """Turn free text into an FTS5 query where every whitespace-separated term must match as a prefix."""
+    terms = []
+    for term in str(raw or "").split():
+        cleaned = term.replace('"', "").strip()
+        if cleaned:
+            terms.append(f'"{cleaned}"*')
+    return " ".join(terms)
+
+
+def _note_scope_sql(project_ids: Iterable[str] | None, team_id: int | None, owner_username: str) -> tuple[str, list]:
+    """SQL condition on a note aliased as "n": notes in `project_ids` or in the projects of `team_id`,
+    plus project-less notes uploaded by `owner_username`.
+
+    A team is matched with a subquery rather than expanded into bound ids, which would cost a
+    parameter per project and overflow SQLite's variable limit on large teams.
+    """
+    keys = [_uuid_key(project_id) for project_id in project_ids or ()]
+    scope: list[str] = []
+    params: list = []
+    if team_id is not None:
+        scope.append("n.project_id IN (SELECT p.id FROM workflow_app_project p WHERE p.company_id = %s)")
+        params.append(team_id)
+    if owner_username:
+        scope.append("(n.project_id IS NULL AND n.owner_username = %s)")
+        params.append(owner_username)
+    if keys:
+        scope.append(f"n.project_id IN ({', '.join(['%s'] * len(keys))})")
+        params.extend(keys)
+    return " OR ".join(scope) or "0", params
+
+
+def _page_bounds(page: int, page_size: int) -> tuple[int, int]:
+    return max(int(page), 1), min(max(int(page_size), 1), SEARCH_MAX_PAGE_SIZE)
+
+
+class ResearchNoteSearchIndex:
+    """SQLite FTS5 indexes over note text and file names, and over extracted PDF page text.
+
+    ResearchNote has a UUID primary key, so each note gets a stable integer doc_id in
+    research_note_search_ids (an INTEGER PRIMARY KEY survives VACUUM) that is used as the FTS rowid.
+    Page rows use the ResearchNoteFilePage id directly.
+    """
+
+    def index_note(self, note_id) -> None:
+        key = _uuid_key(note_id)
+        with connection.cursor() as cursor:
+            cursor.execute(f"INSERT OR IGNORE INTO {SEARCH_IDS_TABLE} (note_id) VALUES (%s)", [key])
+            cursor.execute(f"SELECT doc_id FROM {SEARCH_IDS_TABLE} WHERE note_id = %s", [key])
+            doc_id = cursor.fetchone()[0]
+            cursor.execute(f"DELETE FROM {SEARCH_TABLE} WHERE rowid = %s", [doc_id])
+            cursor.execute(
+                f"{_INSERT_DOCUMENT_SQL} SELECT %s, {_DOCUMENT_VALUES_SQL} FROM workflow_app_researchnote n WHERE n.id = %s",
+                [doc_id, key],
+            )
+
+    def remove_note(self, note_id) -> None:
+        key = _uuid_key(note_id)
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"DELETE FROM {SEARCH_TABLE} WHERE rowid IN (SELECT doc_id FROM {SEARCH_IDS_TABLE} WHERE note_id = %s)",
+                [key],
+            )
+            cursor.execute(f"DELETE FROM {SEARCH_IDS_TABLE} WHERE note_id = %s", [key])
+
+    def rebuild(self) -> int:
+        """Re-index every note from scratch (after raw table deletes or restores)."""
+        with connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {SEARCH_TABLE}")
+            cursor.execute(f"DELETE FROM {SEARCH_IDS_TABLE}")
+            cursor.execute(f"INSERT INTO {SEARCH_IDS_TABLE} (note_id) SELECT id FROM workflow_app_researchnote")
+            cursor.execute(
+                f"{_INSERT_DOCUMENT_SQL} SELECT ids.doc_id, {_DOCUMENT_VALUES_SQL} "
+                f"FROM {SEARCH_IDS_TABLE} ids JOIN workflow_app_researchnote n ON n.id = ids.note_id"
+            )
+            cursor.execute(f"DELETE FROM {PAGE_SEARCH_TABLE}")
+            cursor.execute(
+                f"INSERT INTO {PAGE_SEARCH_TABLE} (rowid, text) "
+                f"SELECT id, text FROM workflow_app_researchnotefilepage WHERE text != ''"
+            )
+            cursor.execute(f"SELECT COUNT(*) FROM {SEARCH_IDS_TABLE}")
+            return cursor.fetchone()[0]
+
+    def index_page(self, page_id: int, text: str) -> None:
+        with connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {PAGE_SEARCH_TABLE} WHERE rowid = %s", [page_id])
+            if text.strip():
+                cursor.execute(f"INSERT INTO {PAGE_SEARCH_TABLE} (rowid, text) VALUES (%s, %s)", [page_id, text])
+
+    def remove_file_pages(self, file_id: int) -> None:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"DELETE FROM {PAGE_SEARCH_TABLE} WHERE rowid IN "
+                f"(SELECT id FROM workflow_app_researchnotefilepage WHERE file_id = %s)",
+                [file_id],
+            )
+
+    def search(
+        self,
+        query: str,
+        project_ids: Iterable[str] | None = None,
+        team_id: int | None = None,
+        owner_username: str = "",
+        page: int = 1,
+        page_size: int = 20,
+    ) -> dict:
+        """Ranked notes matching `query`.
+
+        Without `project_ids` or `team_id` every note is searched; otherwise results are limited to
+        notes in those projects (or that team's projects) plus project-less notes uploaded by
+        `owner_username`.
+
+        The unicode61 tokenizer matches whole tokens and token prefixes only, so a query cannot
+        hit the middle of a word; for Korean, "실험" finds "실험을" but "험" does not.
+        """
+        page, page_size = _page_bounds(page, page_size)
+        match = build_match_query(query)
+        empty = {"query": query, "page": page, "page_size": page_size, "total": 0, "has_next": False, "results": []}
+        if not match:
+            return empty
+
+        where = [f"{SEARCH_TABLE} MATCH %s"]
+        params: list = [match]
+        if project_ids is not None or team_id is not None:
+            scope_sql, scope_params = _note_scope_sql(project_ids, team_id, owner_username)
+            # The unary "+" keeps SQLite from driving the MATCH once per allowed rowid; the allowed set
+            # is built once and probed while walking the FTS matches.
+            where.append(
+                f"+rowid IN (SELECT ids.doc_id FROM {SEARCH_IDS_TABLE} ids "
+                f"JOIN workflow_app_researchnote n ON n.id = ids.note_id WHERE {scope_sql})"
+            )
+            params.extend(scope_params)
+        where_sql = " AND ".join(where)
+        weights = ", ".join(str(weight) for weight in SEARCH_COLUMN_WEIGHTS.values())
+
+        with connection.cursor() as cursor:
+            cursor.execute(f"SELECT COUNT(*) FROM {SEARCH_TABLE} WHERE {where_sql}", params)
+            total = cursor.fetchone()[0]
+            if not total:
+                return empty
+            cursor.execute(
+                f"SELECT rowid, bm25({SEARCH_TABLE}, {weights}) AS score FROM {SEARCH_TABLE} "
+                f"WHERE {where_sql} ORDER BY score LIMIT %s OFFSET %s",
+                [*params, page_size, (page - 1) * page_size],
+            )
+            scores = dict(cursor.fetchall())
+            if not scores:
+                return {**empty, "total": total}
+            cursor.execute(
+                f"SELECT ids.doc_id, n.id, n.project_id, n.title, n.owner, n.project_code, n.period, n.files, "
+                f"n.summary, n.last_updated_at FROM {SEARCH_IDS_TABLE} ids "
+                f"JOIN workflow_app_researchnote n ON n.id = ids.note_id "
+                f"WHERE ids.doc_id IN ({', '.join(['%s'] * len(scores))})",
+                list(scores),
+            )
+            notes = {row[0]: row[1:] for row in cursor.fetchall()}
+
+        results = []
+        for doc_id, score in scores.items():
+            if doc_id not in notes:
+                continue
+            note_id, project_id, title, owner, project_code, period, files, summary, last_updated_at = notes[doc_id]
+            results.append(
+                {
+                    "id": str(uuid.UUID(str(note_id))),
+                    "project_id": str(uuid.UUID(str(project_id))) if project_id else None,
+                    "title": title,
+                    "owner": owner,
+                    "project_code": project_code,
+                    "period": period,
+                    "files": files,
+                    "summary": summary,
+                    "last_updated_at": last_updated_at.isoformat() if hasattr(last_updated_at, "isoformat") else last_updated_at,
+                    "score": round(-score, 4),
+                }
+            )
+        return {**empty, "total": total, "has_next": page * page_size < total, "results": results}
+
+    def search_pages(
+        self,
+        query: str,
+        project_ids: Iterable[str] | None = None,
+        team_id: int | None = None,
+        owner_username: str = "",
+        page: int = 1,
+        page_size: int = 20,
+    ) -> dict:
+        """Ranked PDF pages whose extracted text matches `query`, scoped like search()."""
+        page, page_size = _page_bounds(page, page_size)
+        match = build_match_query(query)
+        empty = {"query": query, "page": page, "page_size": page_size, "total": 0, "has_next": False, "results": []}
+        if not match:
+            return empty
+
+        where = [f"{PAGE_SEARCH_TABLE} MATCH %s"]
+        params: list = [match]
+        if project_ids is not None or team_id is not None:
+            scope_sql, scope_params = _note_scope_sql(project_ids, team_id, owner_username)
+            where.append(
+                f"+rowid IN (SELECT p.id FROM workflow_app_researchnotefilepage p "
+                f"JOIN workflow_app_researchnotefile f ON f.id = p.file_id "
+                f"JOIN workflow_app_researchnote n ON n.id = f.note_id WHERE {scope_sql})"
+            )
+            params.extend(scope_params)
+        where_sql = " AND ".join(where)
+
+        with connection.cursor() as cursor:
+            cursor.execute(f"SELECT COUNT(*) FROM {PAGE_SEARCH_TABLE} WHERE {where_sql}", params)
+            total = cursor.fetchone()[0]
+            if not total:
+                return empty
+            cursor.execute(
+                f"SELECT rowid, bm25({PAGE_SEARCH_TABLE}) AS score, "
+                f"snippet({PAGE_SEARCH_TABLE}, 0, '', '', '…', 16) FROM {PAGE_SEARCH_TABLE} "
+                f"WHERE {where_sql} ORDER BY score LIMIT %s OFFSET %s",
+                [*params, page_size, (page - 1) * page_size],
+            )
+            hits = cursor.fetchall()
+            cursor.execute(
+                f"SELECT p.id, p.page_number, f.id, f.name, n.id, n.title FROM workflow_app_researchnotefilepage p "
+                f"JOIN workflow_app_researchnotefile f ON f.id = p.file_id "
+                f"JOIN workflow_app_researchnote n ON n.id = f.note_id "
+                f"WHERE p.id IN ({', '.join(['%s'] * len(hits))})",
+                [hit[0] for hit in hits],
+            )
+            pages = {row[0]: row[1:] for row in cursor.fetchall()}
+
+        results = []
+        for page_id, score, snippet in hits:
+            if page_id not in pages:
+                continue
+            page_number, file_id, file_name, note_id, note_title = pages[page_id]
+            note_id = str(uuid.UUID(str(note_id)))
+            results.append(
+                {
+                    "note_id": note_id,
+                    "note_title": note_title,
+                    "file_id": str(file_id),
+                    "file_name": file_name,
+                    "page_number": page_number,
+                    "snippet": snippet,
+                    "score": round(-score, 4),
+                    "viewer_url": f"/frontend/research-notes/{note_id}/viewer?file={file_id}&page={page_number}",
+                }
+            )
+        return {**empty, "total": total, "has_next": page * page_size < total, "results": results}
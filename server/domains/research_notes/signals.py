@@ -0,0 +1,36 @@
+from django.db.models.signals import post_delete, post_save, pre_delete
+from django.dispatch import receiver
+
+from .models import ResearchNote, ResearchNoteFile
+from .search import ResearchNoteSearchIndex
+from .text_extraction import ResearchNoteTextExtractor
+
+search_index = ResearchNoteSearchIndex()
+text_extractor = ResearchNoteTextExtractor(search_index=search_index)
+
+
+@receiver(post_save, sender=ResearchNote, dispatch_uid="search_note_saved")
+def _note_saved(sender, instance: ResearchNote, **kwargs) -> None:
+    search_index.index_note(instance.id)
+
+
+@receiver(post_delete, sender=ResearchNote, dispatch_uid="search_note_deleted")
+def _note_deleted(sender, instance: ResearchNote, **kwargs) -> None:
+    search_index.remove_note(instance.id)
+
+
+@receiver(post_save, sender=ResearchNoteFile, dispatch_uid="search_note_file_saved")
+def _note_file_saved(sender, instance: ResearchNoteFile, created: bool = False, **kwargs) -> None:
+    search_index.index_note(instance.note_id)
+    if created:
+        text_extractor.queue(instance)
+
+
+@receiver(pre_delete, sender=ResearchNoteFile, dispatch_uid="search_note_file_pages_deleted")
+def _note_file_deleting(sender, instance: ResearchNoteFile, **kwargs) -> None:
+    search_index.remove_file_pages(instance.id)
+
+
+@receiver(post_delete, sender=ResearchNoteFile, dispatch_uid="search_note_file_deleted")
+def _note_file_deleted(sender, instance: ResearchNoteFile, **kwargs) -> None:
+    search_index.index_note(instance.note_id)
@@ -0,0 +1,110 @@
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from server.application import pdf_toolkit
+from server.application.background import submit_background
+
+from .models import ResearchNoteFile, ResearchNoteFileExtraction, ResearchNoteFilePage
+from .repository import ResearchNoteRepository
+from .search import ResearchNoteSearchIndex
+
+EXTRACTABLE_FORMATS = {"pdf"}
+
+
+class ResearchNoteTextExtractor:
+    """Extracts PDF text page by page in background slices and feeds it to the page search index.
+
+    Each slice runs until RESEARCH_NOTE_TEXT_EXTRACTION_BUDGET seconds are spent, records the next
+    page to read and re-queues itself, so large documents never hold a worker for long and an
+    interrupted extraction resumes where it stopped.
+    """
+
+    def __init__(self, repository: ResearchNoteRepository | None = None, search_index: ResearchNoteSearchIndex | None = None) -> None:
+        self.repository = repository or ResearchNoteRepository()
+        self.search_index = search_index or ResearchNoteSearchIndex()
+
+    def queue(self, note_file: ResearchNoteFile) -> None:
+        if str(note_file.format).lower() not in EXTRACTABLE_FORMATS:
+            return
+        ResearchNoteFileExtraction.objects.get_or_create(file=note_file)
+        if not getattr(settings, "RESEARCH_NOTE_TEXT_EXTRACTION_IN_WEB", True):
+            return  # the resume_text_extraction --watch process picks the pending row up
+        file_id = note_file.id
+        transaction.on_commit(lambda: submit_background(self.run, file_id))
+
+    def resume_pending(self, inline: bool = False, stale_seconds: float | None = None) -> int:
+        """Re-queue every unfinished extraction (after a restart or a migration backfill).
+
+        `inline=True` finishes each one in the calling process without a time budget, for
+        `manage.py resume_text_extraction`, whose process exits before a worker pool would drain.
+        `stale_seconds` limits the sweep to extractions no slice has touched for that long, so a
+        periodic sweep leaves the ones web workers are still running alone.
+        """
+        pending = ResearchNoteFileExtraction.objects.filter(status=ResearchNoteFileExtraction.Status.PENDING)
+        if stale_seconds:
+            pending = pending.filter(updated_at__lt=timezone.now() - timedelta(seconds=stale_seconds))
+        file_ids = list(pending.values_list("file_id", flat=True))
+        for file_id in file_ids:
+            if inline:
+                self.run(file_id, budget_seconds=float("inf"))
+            else:
+                submit_background(self.run, file_id)
+        return len(file_ids)
+
+    def run(self, file_id: int, budget_seconds: float | None = None) -> str:
+        extraction = ResearchNoteFileExtraction.objects.select_related("file").filter(file_id=file_id).first()
+        if not extraction or extraction.status != ResearchNoteFileExtraction.Status.PENDING:
+            return extraction.status if extraction else ""
+
+        note_file = extraction.file
+        source = self.repository.resolve_note_file_path(str(note_file.note_id), note_file.name)
+        if not source:
+            return self._fail(extraction, "원본 파일을 찾을 수 없습니다.")
+        try:
+            reader = pdf_toolkit.PdfReader(str(source))
+            page_count = len(reader.pages)
+        except Exception as exc:
+            return self._fail(extraction, f"PDF를 열 수 없습니다: {exc}")
+
+        if budget_seconds is None:
+            budget_seconds = getattr(settings, "RESEARCH_NOTE_TEXT_EXTRACTION_BUDGET", 2.0)
+        deadline = time.monotonic() + budget_seconds
+        page_index = extraction.next_page
+        while page_index < page_count:
+            try:
+                text = reader.pages[page_index].extract_text() or ""
+            except Exception:
+                text = ""
+            with transaction.atomic():
+                page, _ = ResearchNoteFilePage.objects.update_or_create(
+                    file_id=file_id,
+                    page_number=page_index + 1,
+                    defaults={"text": text},
+                )
+                self.search_index.index_page(page.id, text)
+                page_index += 1
+                ResearchNoteFileExtraction.objects.filter(id=extraction.id).update(
+                    next_page=page_index, page_count=page_count, updated_at=timezone.now()
+                )
+            if page_index < page_count and time.monotonic() >= deadline:
+                transaction.on_commit(lambda: submit_background(self.run, file_id))
+                return ResearchNoteFileExtraction.Status.PENDING
+
+        ResearchNoteFileExtraction.objects.filter(id=extraction.id).update(
+            status=ResearchNoteFileExtraction.Status.DONE,
+            next_page=page_count,
+            page_count=page_count,
+            error="",
+        )
+        return ResearchNoteFileExtraction.Status.DONE
+
+    @staticmethod
+    def _fail(extraction: ResearchNoteFileExtraction, message: str) -> str:
+        extraction.status = ResearchNoteFileExtraction.Status.FAILED
+        extraction.error = message[:255]
+        extraction.save(update_fields=["status", "error", "updated_at"])
+        return extraction.status
@@ -1,3 +1,5 @@
+import json
+
 from django.http import JsonResponse
 from django.shortcuts import render
 from django.views.decorators.csrf import ensure_csrf_cookie
@@ -6,6 +8,8 @@ from django.views.decorators.http import require_GET, require_http_methods
 from server.application.web_support import effective_user_profile, login_required_page, page_context, researcher_repository
 from server.domains.admin.models import Team
 
+BULK_INVITE_LIMIT = 500
+
 
 def _can_manage(request) -> bool:
     profile = effective_user_profile(request) or {}
@@ -45,23 +49,19 @@ def researchers_api(request):
 
     if request.method == "GET":
         action = request.GET.get("action", "").strip()
-        q = request.GET.get("q", "").strip().lower()
-        all_items = researcher_repository.list_researchers()
+        q = request.GET.get("q", "").strip()
 
         if action == "unassigned":
-            rows = [item for item in all_items if not item.get("team_id")]
-            if q:
-                rows = [item for item in rows if q in str(item.get("username", "")).lower()]
-            return JsonResponse(rows, safe=False)
+            return JsonResponse(researcher_repository.list_researchers(unassigned=True, q=q), safe=False)
 
         if action == "pending_for_my_team":
-            rows = [item for item in all_items if item.get("team_id") == team_id and not item.get("is_approved")]
+            rows = researcher_repository.list_researchers(team_id=team_id, unassigned=team_id is None, is_approved=False)
             return JsonResponse(rows, safe=False)
 
         if _can_manage(request):
-            return JsonResponse(all_items, safe=False)
+            return JsonResponse(researcher_repository.list_researchers(), safe=False)
 
-        rows = [item for item in all_items if item.get("team_id") == team_id and item.get("is_approved")]
+        rows = researcher_repository.list_researchers(team_id=team_id, unassigned=team_id is None, is_approved=True)
         return JsonResponse(rows, safe=False)
 
     action = request.POST.get("action", "create").strip()
@@ -74,7 +74,7 @@ def researchers_api(request):
 
     if action == "verify_id":
         username = request.POST.get("username", "").strip()
-        can_invite = bool(username) and not any(item.get("username") == username for item in researcher_repository.list_researchers())
+        can_invite = bool(username) and not researcher_repository.username_exists(username)
         return JsonResponse({"can_invite": can_invite})
 
     if not _can_manage(request):
@@ -103,14 +103,36 @@ def researchers_api(request):
     return JsonResponse(payload)
 
 
+@require_http_methods(["POST"])
+@login_required_page
+def researchers_bulk_invite_api(request):
+    if not _can_manage(request):
+        return JsonResponse({"detail": "관리 권한이 없습니다."}, status=403)
+    try:
+        payload = json.loads(request.body.decode("utf-8") or "{}")
+    except Exception:
+        return JsonResponse({"detail": "잘못된 요청 형식입니다."}, status=400)
+
+    researchers = payload.get("researchers", [])
+    if not isinstance(researchers, list) or not researchers or not all(isinstance(item, dict) for item in researchers):
+        return JsonResponse({"detail": "초대할 연구원 목록이 없습니다."}, status=400)
+    if len(researchers) > BULK_INVITE_LIMIT:
+        return JsonResponse({"detail": f"한 번에 최대 {BULK_INVITE_LIMIT}명까지 초대할 수 있습니다."}, status=400)
+
+    try:
+        created = researcher_repository.bulk_create_researchers(researchers)
+    except ValueError as exc:
+        return JsonResponse({"detail": str(exc)}, status=400)
+    return JsonResponse({"researchers": created}, status=201)
+
+
 @require_GET
 @ensure_csrf_cookie
 @login_required_page
 def researchers_page(request):
     profile = effective_user_profile(request) or {}
     team_id = _resolve_team_id_from_session(profile)
-    all_researchers = researcher_repository.list_researchers()
-    scoped = [item for item in all_researchers if team_id is None or item.get("team_id") == team_id]
+    scoped = researcher_repository.list_researchers(team_id=team_id)
     owner_researchers = [item for item in scoped if item.get("role") == "소유자"]
     member_researchers = [item for item in scoped if item.get("role") != "소유자" and item.get("is_approved")]
     pending_researchers = [
@@ -1,6 +1,10 @@
 from collections import defaultdict
 
+from django.db import transaction
+from django.db.models import Q
+
 from server.domains.admin.models import Team, UserAccount
+from server.domains.stats.repository import StatsRepository
 
 
 def _as_text(value, default: str = "") -> str:
@@ -14,27 +18,49 @@ def _as_text(value, default: str = "") -> str:
 class ResearcherRepository:
     """Legacy-named repository backed by UserAccount (not Researcher model)."""
 
-    def list_researchers(self) -> list[dict]:
-        users = UserAccount.objects.select_related("team").order_by("id")
-        return [
-            {
-                "id": user.id,
-                "username": user.username,
-                "name": user.display_name,
-                "role": (
-                    "소유자"
-                    if user.role == UserAccount.Role.OWNER
-                    else "관리자" if user.role == UserAccount.Role.ADMIN else "연구원"
-                ),
-                "email": user.email,
-                "organization": user.team.name if user.team else "미지정",
-                "team_id": user.team_id,
-                "major": "미지정",
-                "status": "승인" if user.is_approved else "승인대기",
-                "is_approved": user.is_approved,
-            }
-            for user in users
-        ]
+    RESEARCHER_FIELDS = ("id", "username", "display_name", "role", "email", "team_id", "team__name", "is_approved")
+
+    @staticmethod
+    def _role_label(role: str) -> str:
+        if role == UserAccount.Role.OWNER:
+            return "소유자"
+        return "관리자" if role == UserAccount.Role.ADMIN else "연구원"
+
+    def _researcher_row(self, row: dict) -> dict:
+        return {
+            "id": row["id"],
+            "username": row["username"],
+            "name": row["display_name"],
+            "role": self._role_label(row["role"]),
+            "email": row["email"],
+            "organization": row["team__name"] or "미지정",
+            "team_id": row["team_id"],
+            "major": "미지정",
+            "status": "승인" if row["is_approved"] else "승인대기",
+            "is_approved": row["is_approved"],
+        }
+
+    def list_researchers(
+        self,
+        team_id: int | None = None,
+        is_approved: bool | None = None,
+        unassigned: bool = False,
+        q: str = "",
+    ) -> list[dict]:
+        """Researchers matching the given filters; every filter is applied in SQL."""
+        users = UserAccount.objects.all()
+        if unassigned:
+            users = users.filter(team__isnull=True)
+        elif team_id is not None:
+            users = users.filter(team_id=team_id)
+        if is_approved is not None:
+            users = users.filter(is_approved=is_approved)
+        if q:
+            users = users.filter(username__icontains=q)
+        return [self._researcher_row(row) for row in users.order_by("id").values(*self.RESEARCHER_FIELDS)]
+
+    def username_exists(self, username: str) -> bool:
+        return UserAccount.objects.filter(username=username).exists()
 
     def list_teams(self) -> list[dict]:
         return [{"id": team.id, "name": team.name} for team in Team.objects.order_by("name", "id")]
@@ -44,32 +70,12 @@ class ResearcherRepository:
         if not email:
             raise ValueError("이메일은 필수입니다.")
 
-        existing = UserAccount.objects.select_related("team").filter(email=email).first()
+        existing = UserAccount.objects.filter(email=email).values(*self.RESEARCHER_FIELDS).first()
         if existing:
-            return {
-                "id": existing.id,
-                "username": existing.username,
-                "name": existing.display_name,
-                "role": (
-                    "소유자"
-                    if existing.role == UserAccount.Role.OWNER
-                    else "관리자" if existing.role == UserAccount.Role.ADMIN else "연구원"
-                ),
-                "email": existing.email,
-                "organization": existing.team.name if existing.team else "미지정",
-                "team_id": existing.team_id,
-                "major": "미지정",
-                "status": "승인" if existing.is_approved else "승인대기",
-                "is_approved": existing.is_approved,
-            }
+            return self._researcher_row(existing)
 
         name = _as_text(payload.get("name"), "신규 연구원").strip()
-        username_base = email.split("@")[0] or "user"
-        username = username_base
-        suffix = 1
-        while UserAccount.objects.filter(username=username).exists():
-            suffix += 1
-            username = f"{username_base}{suffix}"
+        username = self._allocate_usernames([self._username_base(email)])[0]
 
         team_name = _as_text(payload.get("organization")).strip()
         team = Team.objects.filter(name=team_name).first() if team_name else None
@@ -97,6 +103,94 @@ class ResearcherRepository:
             "is_approved": created.is_approved,
         }
 
+    def bulk_create_researchers(self, payloads: list[dict]) -> list[dict]:
+        """Invite many researchers in one transaction; existing emails are returned unchanged."""
+        entries = []
+        seen_emails = set()
+        for payload in payloads:
+            email = _as_text(payload.get("email")).strip()
+            if not email:
+                raise ValueError("이메일은 필수입니다.")
+            if email in seen_emails:
+                continue
+            seen_emails.add(email)
+            entries.append(
+                {
+                    "email": email,
+                    "name": _as_text(payload.get("name"), "신규 연구원").strip(),
+                    "organization": _as_text(payload.get("organization")).strip(),
+                }
+            )
+
+        with transaction.atomic():
+            existing = {
+                row["email"]: self._researcher_row(row)
+                for row in UserAccount.objects.filter(email__in=seen_emails).values(*self.RESEARCHER_FIELDS)
+            }
+            new_entries = [entry for entry in entries if entry["email"] not in existing]
+            team_names = {entry["organization"] for entry in new_entries if entry["organization"]}
+            teams = {team.name: team for team in Team.objects.filter(name__in=team_names)}
+            usernames = self._allocate_usernames([self._username_base(entry["email"]) for entry in new_entries])
+
+            created = UserAccount.objects.bulk_create(
+                [
+                    UserAccount(
+                        username=username,
+                        display_name=entry["name"],
+                        email=entry["email"],
+                        password="temp1234",
+                        role=UserAccount.Role.MEMBER,
+                        team=teams.get(entry["organization"]),
+                        is_approved=False,
+                    )
+                    for entry, username in zip(new_entries, usernames)
+                ]
+            )
+            # bulk_create skips post_save, so the researcher counter is moved here.
+            StatsRepository.bump_global("researchers", len(created))
+
+        created_by_email = {
+            user.email: {
+                "id": user.id,
+                "username": user.username,
+                "name": user.display_name,
+                "role": "연구원",
+                "email": user.email,
+                "organization": user.team.name if user.team else "미지정",
+                "team_id": user.team_id,
+                "major": "미지정",
+                "status": "승인대기",
+                "is_approved": False,
+            }
+            for user in created
+        }
+        return [existing.get(entry["email"]) or created_by_email[entry["email"]] for entry in entries]
+
+    @staticmethod
+    def _username_base(email: str) -> str:
+        return email.split("@")[0] or "user"
+
+    @staticmethod
+    def _allocate_usernames(bases: list[str]) -> list[str]:
+        """Pick the first free `base`, `base2`, `base3`, ... for each base with a single prefix query."""
+        if not bases:
+            return []
+        prefix_filter = Q()
+        for base in set(bases):
+            prefix_filter |= Q(username__startswith=base)
+        taken = set(UserAccount.objects.filter(prefix_filter).values_list("username", flat=True))
+
+        usernames = []
+        for base in bases:
+            candidate = base
+            suffix = 1
+            while candidate in taken:
+                suffix += 1
+                candidate = f"{base}{suffix}"
+            taken.add(candidate)
+            usernames.append(candidate)
+        return usernames
+
     def approve_user(self, user_id: int) -> dict:
         user = UserAccount.objects.select_related("team").filter(id=user_id).first()
         if not user:
@@ -6,6 +6,7 @@ from django.shortcuts import render
 from django.views.decorators.csrf import ensure_csrf_cookie
 from django.views.decorators.http import require_GET, require_http_methods
 
+from server.application import metrics
 from server.application.web_support import effective_user_profile, login_required_page, page_context, signature_repository
 from server.domains.research_notes.models import ResearchNote, ResearchNoteFile, ResearchNoteFolder
 
@@ -100,10 +101,9 @@ def upload_my_research_note(request):
     note = ResearchNote.objects.create(
         title=safe_name,
         owner=owner_name,
+        owner_username=username,
         project_code="",
         period=datetime.now(timezone.utc).strftime("%Y.%m.%d"),
-        files=1,
-        members=1,
         summary=f"업로드 파일: {safe_name}",
     )
 
@@ -113,6 +113,7 @@ def upload_my_research_note(request):
     with target_path.open("wb") as destination:
         for chunk in upload.chunks():
             destination.write(chunk)
+    metrics.UPLOAD_BYTES.inc(upload.size, endpoint="my_page_research_note")
 
     extension = target_path.suffix.lstrip(".").lower() or "bin"
     created_text = datetime.now(timezone.utc).strftime("%Y.%m.%d / %I:%M %p")
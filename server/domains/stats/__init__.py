@@ -0,0 +1,3 @@
+from .repository import StatsRepository
+
+__all__ = ["StatsRepository"]
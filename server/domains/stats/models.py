@@ -0,0 +1,8 @@
+from django.db import models
+
+from server.domains.common_models import TimestampedModel
+
+
+class SummaryCounter(TimestampedModel):
+    name = models.CharField(max_length=50, unique=True)
+    value = models.BigIntegerField(default=0)
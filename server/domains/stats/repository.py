@@ -0,0 +1,116 @@
+from django.db import connection
+from django.db.models import Count, F, Max, OuterRef, Subquery
+from django.db.models.functions import Coalesce, Greatest
+
+from server.domains.admin.models import Team, UserAccount
+from server.domains.projects.models import Project, ProjectMember
+from server.domains.research_notes.models import ResearchNote, ResearchNoteFile
+
+from .models import SummaryCounter
+
+GLOBAL_COUNTER_MODELS = {
+    "teams": Team,
+    "projects": Project,
+    "researchers": UserAccount,
+    "notes": ResearchNote,
+}
+
+
+class StatsRepository:
+    """Denormalized counters kept in step with writes by the stats signal handlers."""
+
+    def dashboard_counts(self) -> dict[str, int]:
+        counters = dict(SummaryCounter.objects.filter(name__in=GLOBAL_COUNTER_MODELS).values_list("name", "value"))
+        missing = [name for name in GLOBAL_COUNTER_MODELS if name not in counters]
+        if missing:
+            counted = self.count_rows(missing)
+            SummaryCounter.objects.bulk_create(
+                [SummaryCounter(name=name, value=value) for name, value in counted.items()],
+                ignore_conflicts=True,
+            )
+            counters.update(counted)
+        return {name: counters[name] for name in GLOBAL_COUNTER_MODELS}
+
+    @staticmethod
+    def count_rows(names: list[str]) -> dict[str, int]:
+        """Count the source tables of several global counters in one statement."""
+        quote = connection.ops.quote_name
+        selects = ", ".join(f"(SELECT COUNT(*) FROM {quote(GLOBAL_COUNTER_MODELS[name]._meta.db_table)})" for name in names)
+        with connection.cursor() as cursor:
+            cursor.execute(f"SELECT {selects}")
+            return dict(zip(names, cursor.fetchone()))
+
+    def recount_global(self, name: str) -> int:
+        value = GLOBAL_COUNTER_MODELS[name].objects.count()
+        SummaryCounter.objects.update_or_create(name=name, defaults={"value": value})
+        return value
+
+    @staticmethod
+    def bump_global(name: str, delta: int) -> None:
+        # A missing row is recounted on the next read, so only existing counters are moved.
+        SummaryCounter.objects.filter(name=name).update(value=Greatest(F("value") + delta, 0))
+
+    @staticmethod
+    def bump_project(project_id, notes: int = 0, files: int = 0, activity_at=None) -> None:
+        if not project_id:
+            return
+        # Clamped at zero: the columns are unsigned, and a drifted counter must not turn a
+        # delete into a CHECK constraint failure. recount_all() repairs any drift.
+        changes = {}
+        if notes:
+            changes["note_count"] = Greatest(F("note_count") + notes, 0)
+        if files:
+            changes["file_count"] = Greatest(F("file_count") + files, 0)
+        if activity_at:
+            changes["last_activity_at"] = activity_at
+        if not changes:
+            return
+        Project.objects.filter(id=project_id).update(**changes)
+        company_id = Project.objects.filter(id=project_id).values("company_id")[:1]
+        Team.objects.filter(id=Subquery(company_id)).update(**changes)
+
+    @staticmethod
+    def bump_content_version(project_id=None, note_id=None) -> None:
+        """Advance the version that keys a project's and/or a note's cached page fragments."""
+        if note_id:
+            ResearchNote.objects.filter(id=note_id).update(content_version=F("content_version") + 1)
+        if project_id:
+            Project.objects.filter(id=project_id).update(content_version=F("content_version") + 1)
+
+    @staticmethod
+    def refresh_note_files(note_id) -> None:
+        ResearchNote.objects.filter(id=note_id).update(files=ResearchNoteFile.objects.filter(note_id=note_id).count())
+
+    @staticmethod
+    def refresh_project_note_members(project_id) -> None:
+        if not project_id:
+            return
+        member_count = ProjectMember.objects.filter(project_id=project_id, user__isnull=False).count()
+        ResearchNote.objects.filter(project_id=project_id).update(members=max(member_count, 1))
+
+    def recount_all(self) -> dict[str, int]:
+        """Rebuild every counter from the source tables (used after raw table deletes)."""
+        note_files = ResearchNoteFile.objects.filter(note_id=OuterRef("pk")).values("note_id").annotate(total=Count("id")).values("total")
+        ResearchNote.objects.update(files=Coalesce(Subquery(note_files), 0))
+        project_members = (
+            ProjectMember.objects.filter(project_id=OuterRef("project_id"), user__isnull=False)
+            .values("project_id")
+            .annotate(total=Count("id"))
+            .values("total")
+        )
+        ResearchNote.objects.filter(project__isnull=False).update(members=Greatest(Coalesce(Subquery(project_members), 0), 1))
+
+        project_notes = ResearchNote.objects.filter(project_id=OuterRef("pk")).values("project_id")
+        Project.objects.update(
+            note_count=Coalesce(Subquery(project_notes.annotate(total=Count("id")).values("total")), 0),
+            file_count=Coalesce(Subquery(project_notes.annotate(total=Count("note_files")).values("total")), 0),
+            last_activity_at=Subquery(project_notes.annotate(latest=Max("last_updated_at")).values("latest")),
+        )
+
+        team_projects = Project.objects.filter(company_id=OuterRef("pk")).values("company_id")
+        Team.objects.update(
+            note_count=Coalesce(Subquery(team_projects.annotate(total=Count("notes")).values("total")), 0),
+            file_count=Coalesce(Subquery(team_projects.annotate(total=Count("notes__note_files")).values("total")), 0),
+            last_activity_at=Subquery(team_projects.annotate(latest=Max("last_activity_at")).values("latest")),
+        )
+        return {name: self.recount_global(name) for name in GLOBAL_COUNTER_MODELS}
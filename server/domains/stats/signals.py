@@ -0,0 +1,97 @@
+from django.db.models.signals import post_delete, post_init, post_save
+from django.dispatch import receiver
+from django.utils import timezone
+
+from server.domains.admin.models import Team, UserAccount
+from server.domains.projects.models import Project, ProjectMember, ProjectNoteCover
+from server.domains.research_notes.models import ResearchNote, ResearchNoteFile
+
+from .repository import StatsRepository
+
+stats_repository = StatsRepository()
+GLOBAL_COUNTER_SENDERS = {Team: "teams", Project: "projects", UserAccount: "researchers", ResearchNote: "notes"}
+
+
+def _bump_global_on_save(sender, created: bool = False, **kwargs) -> None:
+    if created:
+        stats_repository.bump_global(GLOBAL_COUNTER_SENDERS[sender], 1)
+
+
+def _bump_global_on_delete(sender, **kwargs) -> None:
+    stats_repository.bump_global(GLOBAL_COUNTER_SENDERS[sender], -1)
+
+
+for _sender in GLOBAL_COUNTER_SENDERS:
+    post_save.connect(_bump_global_on_save, sender=_sender, dispatch_uid=f"stats_global_save_{_sender.__name__}")
+    post_delete.connect(_bump_global_on_delete, sender=_sender, dispatch_uid=f"stats_global_delete_{_sender.__name__}")
+
+
+@receiver(post_init, sender=ResearchNote, dispatch_uid="stats_note_loaded")
+def _note_loaded(sender, instance: ResearchNote, **kwargs) -> None:
+    # Reading __dict__ keeps a deferred project_id deferred; such notes are not tracked.
+    if "project_id" in instance.__dict__:
+        instance._stats_project_id = instance.project_id
+
+
+@receiver(post_save, sender=ResearchNote, dispatch_uid="stats_note_saved")
+def _note_saved(sender, instance: ResearchNote, created: bool, **kwargs) -> None:
+    if created:
+        instance.files = ResearchNoteFile.objects.filter(note_id=instance.id).count()
+        if instance.project_id:
+            instance.members = max(ProjectMember.objects.filter(project_id=instance.project_id, user__isnull=False).count(), 1)
+        else:
+            instance.members = 1
+        ResearchNote.objects.filter(id=instance.id).update(files=instance.files, members=instance.members)
+    elif hasattr(instance, "_stats_project_id") and instance._stats_project_id != instance.project_id:
+        _note_moved(instance, instance._stats_project_id)
+    instance._stats_project_id = instance.project_id
+    stats_repository.bump_project(instance.project_id, notes=1 if created else 0, activity_at=timezone.now())
+    stats_repository.bump_content_version(instance.project_id, instance.id)
+
+
+def _note_moved(instance: ResearchNote, old_project_id) -> None:
+    files = ResearchNoteFile.objects.filter(note_id=instance.id).count()
+    stats_repository.bump_project(old_project_id, notes=-1, files=-files)
+    stats_repository.bump_project(instance.project_id, notes=1, files=files)
+    stats_repository.bump_content_version(old_project_id)
+    stats_repository.refresh_project_note_members(instance.project_id)
+
+
+@receiver(post_delete, sender=ResearchNote, dispatch_uid="stats_note_deleted")
+def _note_deleted(sender, instance: ResearchNote, **kwargs) -> None:
+    stats_repository.bump_project(instance.project_id, notes=-1)
+    stats_repository.bump_content_version(instance.project_id)
+
+
+def _note_project_id(note_id):
+    return ResearchNote.objects.filter(id=note_id).values_list("project_id", flat=True).first()
+
+
+@receiver(post_save, sender=ResearchNoteFile, dispatch_uid="stats_note_file_saved")
+def _note_file_saved(sender, instance: ResearchNoteFile, created: bool, **kwargs) -> None:
+    if created:
+        stats_repository.refresh_note_files(instance.note_id)
+    project_id = _note_project_id(instance.note_id)
+    stats_repository.bump_project(project_id, files=1 if created else 0, activity_at=timezone.now())
+    stats_repository.bump_content_version(project_id, instance.note_id)
+
+
+@receiver(post_delete, sender=ResearchNoteFile, dispatch_uid="stats_note_file_deleted")
+def _note_file_deleted(sender, instance: ResearchNoteFile, **kwargs) -> None:
+    stats_repository.refresh_note_files(instance.note_id)
+    project_id = _note_project_id(instance.note_id)
+    stats_repository.bump_project(project_id, files=-1)
+    stats_repository.bump_content_version(project_id, instance.note_id)
+
+
+@receiver(post_save, sender=ProjectMember, dispatch_uid="stats_member_saved")
+@receiver(post_delete, sender=ProjectMember, dispatch_uid="stats_member_deleted")
+def _member_changed(sender, instance: ProjectMember, **kwargs) -> None:
+    stats_repository.refresh_project_note_members(instance.project_id)
+    stats_repository.bump_content_version(instance.project_id)
+
+
+@receiver(post_save, sender=Project, dispatch_uid="stats_project_content_saved")
+@receiver(post_save, sender=ProjectNoteCover, dispatch_uid="stats_project_cover_saved")
+def _project_content_saved(sender, instance: Project | ProjectNoteCover, **kwargs) -> None:
+    stats_repository.bump_content_version(instance.pk if sender is Project else instance.project_id)
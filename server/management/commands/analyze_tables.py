@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from server.application.web_support import admin_repository
+
+
+class Command(BaseCommand):
+    help = "ANALYZE로 sqlite_stat1 통계를 갱신합니다 (관리자 테이블 목록의 대략적인 row 수에 사용)."
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument("--full", action="store_true", help="ADMIN_ANALYZE_LIMIT 없이 모든 row를 읽어 통계를 만듭니다.")
+
+    def handle(self, *args, **options) -> None:
+        admin_repository.analyze_tables(limit=0 if options["full"] else None)
+        self.stdout.write("sqlite_stat1 통계 갱신 완료")
@@ -0,0 +1,30 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from server.application.web_support import research_note_text_extractor
+
+
+class Command(BaseCommand):
+    help = "끝나지 않은 PDF 본문 추출을 이 프로세스에서 마저 처리합니다 (배포 시 migrate 다음에 실행, --watch로 상주)."
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument("--watch", action="store_true", help="종료하지 않고 --interval초마다 대기 중인 추출을 처리합니다.")
+        parser.add_argument("--interval", type=float, default=30.0, help="--watch 주기(초)")
+
+    def handle(self, *args, **options) -> None:
+        if not options["watch"]:
+            resumed = research_note_text_extractor.resume_pending(inline=True)
+            self.stdout.write(f"PDF 본문 추출 {resumed}건 처리")
+            return
+
+        # While web workers extract in-process, only rows they stopped touching (a dead worker) are swept.
+        stale_seconds = settings.RESEARCH_NOTE_TEXT_EXTRACTION_STALE_SECONDS if settings.RESEARCH_NOTE_TEXT_EXTRACTION_IN_WEB else None
+        while True:
+            close_old_connections()
+            resumed = research_note_text_extractor.resume_pending(inline=True, stale_seconds=stale_seconds)
+            if resumed:
+                self.stdout.write(f"PDF 본문 추출 {resumed}건 처리")
+            time.sleep(options["interval"])
@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from server.application.web_support import SUPER_ADMIN_JSON_PATH, sync_super_admin_accounts
+
+
+class Command(BaseCommand):
+    help = "super_admin_accounts.json의 슈퍼 어드민 계정을 DB에 동기화합니다 (변경된 계정만 갱신)."
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument("--force", action="store_true", help="변경 여부와 관계없이 모든 계정을 다시 저장합니다.")
+
+    def handle(self, *args, **options) -> None:
+        written = sync_super_admin_accounts(force=options["force"])
+        self.stdout.write(f"{SUPER_ADMIN_JSON_PATH.name}: {written}개 계정 동기화")
@@ -0,0 +1,35 @@
+from django.db import migrations, models
+
+
+def move_cover_images_to_assets(apps, schema_editor):
+    from server.domains.projects.cover_assets import store_cover_data_url
+
+    ProjectNoteCover = apps.get_model("workflow_app", "ProjectNoteCover")
+    for cover in ProjectNoteCover.objects.exclude(cover_image_data_url="").iterator():
+        image_hash, mime = store_cover_data_url(str(cover.project_id), cover.cover_image_data_url)
+        if not image_hash:
+            continue
+        cover.cover_image_hash = image_hash
+        cover.cover_image_mime = mime
+        cover.cover_image_data_url = ""
+        cover.save(update_fields=["cover_image_hash", "cover_image_mime", "cover_image_data_url"])
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("workflow_app", "0016_projectnotecover_cover_image_data_url"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="projectnotecover",
+            name="cover_image_hash",
+            field=models.CharField(blank=True, default="", max_length=64),
+        ),
+        migrations.AddField(
+            model_name="projectnotecover",
+            name="cover_image_mime",
+            field=models.CharField(blank=True, default="", max_length=100),
+        ),
+        migrations.RunPython(move_cover_images_to_assets, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,88 @@
+# Generated by Django 5.2.18 on 2026-10-19 15:59
+
+from django.db import migrations, models
+from django.db.models import Count, Max, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_counters(apps, schema_editor):
+    Team = apps.get_model("workflow_app", "Team")
+    Project = apps.get_model("workflow_app", "Project")
+    ResearchNote = apps.get_model("workflow_app", "ResearchNote")
+    ResearchNoteFile = apps.get_model("workflow_app", "ResearchNoteFile")
+    UserAccount = apps.get_model("workflow_app", "UserAccount")
+    SummaryCounter = apps.get_model("workflow_app", "SummaryCounter")
+
+    note_files = ResearchNoteFile.objects.filter(note_id=OuterRef("pk")).values("note_id").annotate(total=Count("id")).values("total")
+    ResearchNote.objects.update(files=Coalesce(Subquery(note_files), 0))
+
+    project_notes = ResearchNote.objects.filter(project_id=OuterRef("pk")).values("project_id")
+    Project.objects.update(
+        note_count=Coalesce(Subquery(project_notes.annotate(total=Count("id")).values("total")), 0),
+        file_count=Coalesce(Subquery(project_notes.annotate(total=Count("note_files")).values("total")), 0),
+        last_activity_at=Subquery(project_notes.annotate(latest=Max("last_updated_at")).values("latest")),
+    )
+
+    team_projects = Project.objects.filter(company_id=OuterRef("pk")).values("company_id")
+    Team.objects.update(
+        note_count=Coalesce(Subquery(team_projects.annotate(total=Count("notes")).values("total")), 0),
+        file_count=Coalesce(Subquery(team_projects.annotate(total=Count("notes__note_files")).values("total")), 0),
+        last_activity_at=Subquery(team_projects.annotate(latest=Max("last_activity_at")).values("latest")),
+    )
+
+    for name, model in (("teams", Team), ("projects", Project), ("researchers", UserAccount), ("notes", ResearchNote)):
+        SummaryCounter.objects.update_or_create(name=name, defaults={"value": model.objects.count()})
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('workflow_app', '0017_projectnotecover_cover_image_asset'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SummaryCounter',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('name', models.CharField(max_length=50, unique=True)),
+                ('value', models.BigIntegerField(default=0)),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.AddField(
+            model_name='project',
+            name='file_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='project',
+            name='last_activity_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='project',
+            name='note_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='team',
+            name='file_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='team',
+            name='last_activity_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='team',
+            name='note_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(backfill_counters, migrations.RunPython.noop),
+    ]
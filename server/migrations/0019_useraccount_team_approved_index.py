@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-19 16:11
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('workflow_app', '0018_materialized_counters'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='useraccount',
+            index=models.Index(fields=['team', 'is_approved'], name='useraccount_team_approved_idx'),
+        ),
+    ]
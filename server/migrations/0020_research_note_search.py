@@ -0,0 +1,46 @@
+from django.db import migrations
+
+CREATE_SEARCH_SQL = [
+    """
+    CREATE TABLE research_note_search_ids (
+        doc_id INTEGER PRIMARY KEY,
+        note_id TEXT NOT NULL UNIQUE
+    )
+    """,
+    """
+    CREATE VIRTUAL TABLE research_note_search USING fts5(
+        title, summary, owner, project_code, file_names, file_authors,
+        tokenize = 'unicode61 remove_diacritics 2',
+        prefix = '1 2 3'
+    )
+    """,
+]
+DROP_SEARCH_SQL = [
+    "DROP TABLE IF EXISTS research_note_search",
+    "DROP TABLE IF EXISTS research_note_search_ids",
+]
+
+
+def build_search_index(apps, schema_editor):
+    schema_editor.execute("INSERT INTO research_note_search_ids (note_id) SELECT id FROM workflow_app_researchnote")
+    schema_editor.execute(
+        """
+        INSERT INTO research_note_search (rowid, title, summary, owner, project_code, file_names, file_authors)
+        SELECT ids.doc_id, n.title, n.summary, n.owner, n.project_code,
+               (SELECT group_concat(f.name, ' ') FROM workflow_app_researchnotefile f WHERE f.note_id = n.id),
+               (SELECT group_concat(f.author, ' ') FROM workflow_app_researchnotefile f WHERE f.note_id = n.id)
+        FROM research_note_search_ids ids JOIN workflow_app_researchnote n ON n.id = ids.note_id
+        """
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('workflow_app', '0019_useraccount_team_approved_index'),
+    ]
+
+    operations = [
+        migrations.RunSQL(CREATE_SEARCH_SQL, reverse_sql=DROP_SEARCH_SQL),
+        migrations.RunPython(build_search_index, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,63 @@
+# Generated by Django 5.2.18 on 2026-10-19 16:24
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def queue_existing_pdfs(apps, schema_editor):
+    ResearchNoteFile = apps.get_model("workflow_app", "ResearchNoteFile")
+    ResearchNoteFileExtraction = apps.get_model("workflow_app", "ResearchNoteFileExtraction")
+    ResearchNoteFileExtraction.objects.bulk_create(
+        [ResearchNoteFileExtraction(file_id=file_id) for file_id in ResearchNoteFile.objects.filter(format="pdf").values_list("id", flat=True)]
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('workflow_app', '0020_research_note_search'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ResearchNoteFileExtraction',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('status', models.CharField(choices=[('pending', 'pending'), ('done', 'done'), ('failed', 'failed')], default='pending', max_length=20)),
+                ('next_page', models.PositiveIntegerField(default=0)),
+                ('page_count', models.PositiveIntegerField(blank=True, null=True)),
+                ('error', models.CharField(blank=True, default='', max_length=255)),
+                ('file', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='text_extraction', to='workflow_app.researchnotefile')),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='ResearchNoteFilePage',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('page_number', models.PositiveIntegerField()),
+                ('text', models.TextField(blank=True, default='')),
+                ('file', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='pages', to='workflow_app.researchnotefile')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('file', 'page_number'), name='unique_research_note_file_page')],
+            },
+        ),
+        migrations.RunSQL(
+            """
+            CREATE VIRTUAL TABLE research_note_page_search USING fts5(
+                text,
+                tokenize = 'unicode61 remove_diacritics 2',
+                prefix = '1 2 3'
+            )
+            """,
+            reverse_sql="DROP TABLE IF EXISTS research_note_page_search",
+        ),
+        migrations.RunPython(queue_existing_pdfs, migrations.RunPython.noop),
+    ]
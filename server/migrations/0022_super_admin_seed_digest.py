@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-19 16:29
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('workflow_app', '0021_research_note_file_text'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='superadminaccount',
+            name='seed_digest',
+            field=models.CharField(blank=True, default='', max_length=64),
+        ),
+    ]
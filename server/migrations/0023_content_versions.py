@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-19 16:43
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('workflow_app', '0022_super_admin_seed_digest'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='project',
+            name='content_version',
+            field=models.PositiveIntegerField(default=1),
+        ),
+        migrations.AddField(
+            model_name='researchnote',
+            name='content_version',
+            field=models.PositiveIntegerField(default=1),
+        ),
+    ]
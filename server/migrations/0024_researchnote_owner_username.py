@@ -0,0 +1,29 @@
+from pathlib import PurePath
+
+from django.db import migrations, models
+
+
+def backfill_owner_usernames(apps, schema_editor):
+    # Uploads are stored under <storage root>/<username>/<note id>, so the folder row names the uploader.
+    ResearchNoteFolder = apps.get_model("workflow_app", "ResearchNoteFolder")
+    ResearchNote = apps.get_model("workflow_app", "ResearchNote")
+    for folder in ResearchNoteFolder.objects.filter(note__owner_username="").iterator():
+        path = PurePath(folder.name)
+        if path.name != str(folder.note_id) or not path.parent.name:
+            continue
+        ResearchNote.objects.filter(id=folder.note_id, owner_username="").update(owner_username=path.parent.name)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("workflow_app", "0023_content_versions"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="researchnote",
+            name="owner_username",
+            field=models.CharField(blank=True, db_index=True, default="", max_length=150),
+        ),
+        migrations.RunPython(backfill_owner_usernames, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,11 @@
+import os
+import tempfile
+
+# Loaded before the test modules call django.setup(): keep the metrics snapshots, profiles and
+# file-based caches written by test requests out of the real storage/ directories.
+_storage = tempfile.TemporaryDirectory(prefix="projectnote-tests-")
+os.environ.setdefault("METRICS_DIR", os.path.join(_storage.name, "metrics"))
+os.environ.setdefault("PROFILES_DIR", os.path.join(_storage.name, "profiles"))
+os.environ.setdefault("SESSION_CACHE_LOCATION", os.path.join(_storage.name, "session_cache"))
+os.environ.setdefault("PROJECT_ACCESS_CACHE_LOCATION", os.path.join(_storage.name, "project_access_cache"))
+os.environ.setdefault("SHARED_CACHE_LOCATION", os.path.join(_storage.name, "shared_cache"))
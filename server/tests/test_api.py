@@ -10,6 +10,7 @@ os.environ.setdefault("DJANGO_SETTINGS_MODULE", "server.config.settings")
 import django
 from django.contrib.auth import get_user_model
 from django.contrib.auth.hashers import check_password, make_password
+from django.core.cache import cache, caches
 from django.core.files.uploadedfile import SimpleUploadedFile
 from django.core.management import call_command
 from django.test import Client, override_settings
@@ -21,9 +22,9 @@ from server.domains.projects.schemas import CreateProjectPayload
 from server.domains.projects.service import ProjectService
 from server.application.sqlalchemy_session import sqlalchemy_database_url
 from server.application import web_support
-from server.application.mock_data import seed_demo_data
+from server.application.mock_data import seed_demo_data, seed_scale_data
 from server.domains.admin.models import Team, UserAccount
-from server.domains.projects.models import Project, ProjectMember
+from server.domains.projects.models import Project, ProjectMember, ProjectNoteCover
 from server.domains.research_notes.models import ResearchNote, ResearchNoteFile, ResearchNoteFolder
 
 pytestmark = pytest.mark.django_db
@@ -35,6 +36,9 @@ User = get_user_model()
 
 def reset_db() -> None:
     call_command("flush", interactive=False, verbosity=0)
+    cache.clear()
+    caches["project_access"].clear()
+    caches["shared"].clear()
 
 
 def login(client_obj: Client) -> None:
@@ -96,6 +100,15 @@ def seed_workflow_data() -> tuple[str, str]:
     return str(project.id), str(note.id)
 
 
+def assert_within_request_budget(response, metrics: tuple[str, ...] = ("queries",)) -> None:
+    """Fail when the request behind `response` exceeded its REQUEST_BUDGETS entry."""
+    from server.application.instrumentation import budget_violations
+
+    stats = response.wsgi_request.request_stats
+    violations = budget_violations(stats, metrics)
+    assert not violations, f"{stats.route}: {'; '.join(violations)} (queries={stats.queries})"
+
+
 def test_health() -> None:
     response = client.get("/api/v1/health")
     assert response.status_code == 200
@@ -266,12 +279,75 @@ def test_super_admin_seed_password_accepts_hashed_value(monkeypatch) -> None:
             }
         },
     )
-    monkeypatch.setattr(web_support, "_super_admin_table_exists", lambda: False)
 
     user = web_support.authenticate_super_admin("admin", "admin1234")
 
     assert user is not None
     assert user["is_super_admin"] is True
+    assert web_support.SuperAdminAccount.objects.get(username="admin").password == hashed
+
+
+def test_super_admin_login_verifies_password_once_without_reseeding(monkeypatch) -> None:
+    from io import StringIO
+
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+
+    from server.domains.admin import repository as admin_repository_module
+
+    reset_db()
+
+    calls = {"check": 0, "make": 0}
+    real_check, real_make = admin_repository_module.check_password, admin_repository_module.make_password
+
+    def counting_check(*args, **kwargs):
+        calls["check"] += 1
+        return real_check(*args, **kwargs)
+
+    def counting_make(*args, **kwargs):
+        calls["make"] += 1
+        return real_make(*args, **kwargs)
+
+    monkeypatch.setattr(admin_repository_module, "check_password", counting_check)
+    monkeypatch.setattr(admin_repository_module, "make_password", counting_make)
+
+    # The first login after a flush re-seeds once; later logins only verify the password.
+    assert web_support.authenticate_super_admin("admin", "admin1234") is not None
+    assert calls == {"check": 1, "make": 1}
+    assert caches["shared"].get(web_support.SUPER_ADMIN_SEED_CACHE_KEY) is True
+
+    with CaptureQueriesContext(connection) as queries:
+        assert web_support.authenticate_super_admin("admin", "admin1234") is not None
+    assert calls == {"check": 2, "make": 1}
+    assert len(queries) == 1
+
+    cache.clear()
+    assert web_support.authenticate_super_admin("admin", "admin1234") is not None
+    assert calls == {"check": 3, "make": 1}
+
+    users = web_support._load_super_admin_users()
+    users["admin"] = {**users["admin"], "password": "changed-5678"}
+    monkeypatch.setattr(web_support, "_load_super_admin_users", lambda: users)
+    out = StringIO()
+    call_command("sync_super_admins", stdout=out)
+    assert "1개 계정" in out.getvalue()
+    assert calls["make"] == 2
+    assert web_support.authenticate_super_admin("admin", "admin1234") is None
+    assert web_support.authenticate_super_admin("admin", "changed-5678") is not None
+
+    call_command("sync_super_admins", stdout=StringIO())
+    assert calls["make"] == 2
+
+    # Another worker emptied the table while the shared flag still says "synced": the login re-seeds.
+    web_support.SuperAdminAccount.objects.all().delete()
+    assert caches["shared"].get(web_support.SUPER_ADMIN_SEED_CACHE_KEY) is True
+    assert web_support.authenticate_super_admin("admin", "changed-5678") is not None
+
+    # A truncate from the admin UI clears the flag for every worker, not only its own.
+    admin_client = Client()
+    assert admin_client.post("/admin/login", {"username": "admin", "password": "changed-5678"}).status_code == 302
+    assert admin_client.post("/api/v1/admin/tables/workflow_app_superadminaccount/truncate").status_code == 200
+    assert caches["shared"].get(web_support.SUPER_ADMIN_SEED_CACHE_KEY) is None
 
 
 
@@ -296,6 +372,69 @@ def test_login_sets_django_auth_session_keys() -> None:
     assert "user_profile" in client.session
 
 
+def test_login_verifies_password_once_and_links_shadow_user_without_hashing(monkeypatch) -> None:
+    from django.contrib.auth.hashers import get_hasher
+
+    reset_db()
+    team = Team.objects.create(name="해시팀", description="해시", join_code="565656")
+    UserAccount.objects.create(
+        username="hash-user",
+        display_name="해시유저",
+        email="hash-user@example.com",
+        password=make_password("secret123"),
+        role=UserAccount.Role.MEMBER,
+        team=team,
+        is_approved=True,
+    )
+    hasher = get_hasher()
+    encodes = []
+    real_encode = hasher.encode
+    monkeypatch.setattr(hasher, "encode", lambda *args, **kwargs: encodes.append(1) or real_encode(*args, **kwargs))
+
+    for _ in range(2):
+        response = Client().post("/login", {"username": "hash-user", "password": "secret123"})
+        assert response.status_code == 302
+
+    assert len(encodes) == 2
+    assert User.objects.get(username="hash-user").has_usable_password() is False
+
+
+def test_page_views_do_not_rewrite_compact_session_profile() -> None:
+    from django.contrib.sessions.models import Session
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+
+    reset_db()
+    team = Team.objects.create(name="세션쓰기팀", description="세션", join_code="575757")
+    UserAccount.objects.create(
+        username="session-writes",
+        display_name="세션쓰기",
+        email="session-writes@example.com",
+        password=make_password("secret123"),
+        role=UserAccount.Role.MEMBER,
+        team=team,
+        is_approved=True,
+    )
+    client_obj = Client()
+    client_obj.post("/login", {"username": "session-writes", "password": "secret123"})
+    client_obj.get("/frontend/workflows")
+
+    with CaptureQueriesContext(connection) as queries:
+        assert client_obj.get("/frontend/workflows").status_code == 200
+    session_writes = [q["sql"] for q in queries if "django_session" in q["sql"] and not q["sql"].startswith("SELECT")]
+    assert session_writes == []
+    assert set(client_obj.session["user_profile"]) == set(web_support.SESSION_PROFILE_FIELDS)
+
+    with override_settings(SESSION_ENGINE="django.contrib.sessions.backends.signed_cookies"):
+        Session.objects.all().delete()
+        cookie_client = Client()
+        cookie_client.post("/login", {"username": "session-writes", "password": "secret123"})
+        assert cookie_client.get("/frontend/workflows").status_code == 200
+        assert cookie_client.session["user_profile"]["username"] == "session-writes"
+        assert len(cookie_client.cookies["sessionid"].value) < 4096
+        assert Session.objects.count() == 0
+
+
 def test_logout_clears_django_auth_and_custom_session() -> None:
     reset_db()
     team = Team.objects.create(name="로그아웃팀", description="로그아웃", join_code="666666")
@@ -385,6 +524,43 @@ def test_effective_user_profile_refreshes_session_data_after_account_change() ->
     assert client.session.get("user_profile", {}).get("name") == "변경된이름"
 
 
+def test_effective_user_profile_is_memoized_per_request_and_skips_unchanged_session_writes(monkeypatch) -> None:
+    reset_db()
+    team = Team.objects.create(name="메모팀", description="메모", join_code="272727")
+    UserAccount.objects.create(
+        username="memo-user",
+        display_name="메모유저",
+        email="memo-user@example.com",
+        password=make_password("secret123"),
+        role=UserAccount.Role.MEMBER,
+        team=team,
+        is_approved=True,
+    )
+    local_client = Client()
+    assert local_client.post("/login", {"username": "memo-user", "password": "secret123"}).status_code == 302
+    assert local_client.get("/frontend/workflows").status_code == 200
+
+    lookups = []
+    original_lookup = web_support.admin_repository.find_user_profile_by_username
+
+    def counting_lookup(username):
+        lookups.append(username)
+        return original_lookup(username)
+
+    monkeypatch.setattr(web_support.admin_repository, "find_user_profile_by_username", counting_lookup)
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+
+    with CaptureQueriesContext(connection) as queries:
+        response = local_client.get("/frontend/projects")
+
+    assert response.status_code == 200
+    assert lookups == ["memo-user"]
+    session_writes = [q["sql"] for q in queries if "django_session" in q["sql"] and not q["sql"].startswith("SELECT")]
+    assert session_writes == []
+    assert set(local_client.session["user_profile"]) == set(web_support.SESSION_PROFILE_FIELDS)
+
+
 def test_researchers_api_allows_staff_user_without_custom_profile() -> None:
     reset_db()
     staff = User.objects.create_user(username="staff-manager", password="secret123", is_staff=True, is_superuser=True)
@@ -412,6 +588,86 @@ def test_dashboard_summary() -> None:
     assert body["notes"] >= 1
 
 
+def test_materialized_counters_follow_note_and_file_writes() -> None:
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+
+    reset_db()
+    team = Team.objects.create(name="카운터팀", description="카운터", join_code="313131")
+    project = Project.objects.create(name="카운터 프로젝트", company=team, code="CT-001")
+    note = ResearchNote.objects.create(project=project, title="카운터 노트", owner="관리자")
+    ResearchNoteFile.objects.create(note=note, name="a.pdf", author="관리자", format="pdf", created="-")
+    ResearchNoteFile.objects.create(note=note, name="b.png", author="관리자", format="png", created="-")
+
+    project.refresh_from_db()
+    team.refresh_from_db()
+    note.refresh_from_db()
+    assert (project.note_count, project.file_count) == (1, 2)
+    assert (team.note_count, team.file_count) == (1, 2)
+    assert note.files == 2
+    assert project.last_activity_at is not None
+
+    assert web_support.dashboard_counts() == {"teams": 1, "projects": 1, "researchers": 0, "notes": 1}
+    with CaptureQueriesContext(connection) as queries:
+        web_support.dashboard_counts()
+    assert len(queries) == 1
+
+    note.delete()
+    project.refresh_from_db()
+    team.refresh_from_db()
+    assert (project.note_count, project.file_count) == (0, 0)
+    assert (team.note_count, team.file_count) == (0, 0)
+    assert web_support.dashboard_counts()["notes"] == 0
+
+    Project.objects.filter(id=project.id).update(note_count=99)
+    web_support.stats_repository.recount_all()
+    project.refresh_from_db()
+    assert project.note_count == 0
+
+    from server.domains.stats.models import SummaryCounter
+
+    SummaryCounter.objects.all().delete()
+    with CaptureQueriesContext(connection) as queries:
+        assert web_support.dashboard_counts() == {"teams": 1, "projects": 1, "researchers": 0, "notes": 0}
+    assert len(queries) <= 3
+    assert SummaryCounter.objects.count() == 4
+
+    other = Project.objects.create(name="이동 프로젝트", company=team, code="CT-002")
+    moved = ResearchNote.objects.create(project=project, title="이동 노트", owner="관리자")
+    ResearchNoteFile.objects.create(note=moved, name="c.pdf", author="관리자", format="pdf", created="-")
+    moved.project = other
+    moved.save()
+    project.refresh_from_db()
+    other.refresh_from_db()
+    assert (project.note_count, project.file_count) == (0, 0)
+    assert (other.note_count, other.file_count) == (1, 1)
+
+    # A counter that drifted to zero is clamped instead of failing the delete on its CHECK constraint.
+    Project.objects.filter(id=other.id).update(note_count=0, file_count=0)
+    moved.delete()
+    other.refresh_from_db()
+    assert (other.note_count, other.file_count) == (0, 0)
+
+    # A note written between update_project() loading the project and saving it keeps its bumps.
+    from django.db.models.signals import post_init
+
+    def concurrent_note(sender, instance, **kwargs):
+        post_init.disconnect(concurrent_note, sender=Project)
+        ResearchNote.objects.create(project_id=other.id, title="동시 노트", owner="관리자")
+
+    other.refresh_from_db()
+    before_version = other.content_version
+    post_init.connect(concurrent_note, sender=Project)
+    try:
+        web_support.project_repository.update_project(str(other.id), {"name": "이름만 변경"})
+    finally:
+        post_init.disconnect(concurrent_note, sender=Project)
+    other.refresh_from_db()
+    assert other.name == "이름만 변경"
+    assert other.note_count == 1
+    assert other.content_version == before_version + 2
+
+
 def test_projects_list_success_without_org_id() -> None:
     reset_db()
     seed_workflow_data()
@@ -421,6 +677,26 @@ def test_projects_list_success_without_org_id() -> None:
     assert len(response.json()) >= 1
 
 
+def test_projects_list_runs_single_query_and_supports_sparse_fields() -> None:
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+
+    reset_db()
+    for index in range(3):
+        team = Team.objects.create(name=f"목록팀{index}", description="목록", join_code=f"29000{index}")
+        Project.objects.create(name=f"목록 프로젝트 {index}", company=team, organization="기관", code=f"LP-{index}")
+
+    with CaptureQueriesContext(connection) as queries:
+        response = client.get("/api/v1/projects")
+    assert response.status_code == 200
+    assert len(queries) == 1
+    assert {row["company_name"] for row in response.json()} == {"목록팀0", "목록팀1", "목록팀2"}
+
+    sparse = client.get("/api/v1/projects", {"fields": "id,name,status,unknown"})
+    assert sparse.status_code == 200
+    assert all(set(row) == {"id", "name", "status"} for row in sparse.json())
+
+
 def test_projects_list_success_with_org_id() -> None:
     reset_db()
     seed_workflow_data()
@@ -581,6 +857,30 @@ def test_organization_user_stats_includes_owner_name() -> None:
     assert dashboard_team["owner_name"] == "대시보드소유자"
 
 
+def test_organization_user_stats_query_count_is_constant() -> None:
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+
+    reset_db()
+    for index in range(5):
+        team = Team.objects.create(name=f"통계팀{index}", description="통계", join_code=f"30000{index}")
+        for member_index in range(2):
+            UserAccount.objects.create(
+                username=f"stats-{index}-{member_index}",
+                display_name=f"통계유저{index}-{member_index}",
+                email=f"stats-{index}-{member_index}@example.com",
+                password="secret123",
+                role=UserAccount.Role.MEMBER,
+                team=team,
+                is_approved=True,
+            )
+
+    with CaptureQueriesContext(connection) as queries:
+        stats = web_support.organization_user_stats()
+
+    assert len(queries) == 3
+    assert all(len(item["members"]) == 2 for item in stats if item["team_id"])
+
 
 def test_super_admin_can_login_from_general_login_page() -> None:
     reset_db()
@@ -609,6 +909,156 @@ def test_super_admin_cannot_access_regular_workflow_pages() -> None:
     assert workflow_page["Location"] == "/frontend/admin/dashboard"
 
 
+def test_fetch_core_rows_reads_a_file_database_through_the_pooled_engine(tmp_path, monkeypatch) -> None:
+    import sqlite3
+
+    from sqlalchemy import column, select, table
+
+    from server.application import sqlalchemy_session
+
+    db_path = tmp_path / "reporting.db"
+    with sqlite3.connect(db_path) as raw:
+        raw.execute("CREATE TABLE report_row (id INTEGER PRIMARY KEY, label TEXT)")
+        raw.executemany("INSERT INTO report_row (label) VALUES (?)", [("a",), ("b",), ("c",)])
+
+    monkeypatch.setattr(sqlalchemy_session, "sqlalchemy_database_url", lambda: f"sqlite:///{db_path}")
+    monkeypatch.setattr(sqlalchemy_session, "_uses_django_connection", lambda: False)
+    try:
+        report_row = table("report_row", column("id"), column("label"))
+        statement = select(report_row.c.label).where(report_row.c.id > 1).order_by(report_row.c.id)
+        assert sqlalchemy_session.fetch_core_rows(statement) == [{"label": "b"}, {"label": "c"}]
+        assert sqlalchemy_session.fetch_core_rows(statement) == [{"label": "b"}, {"label": "c"}]
+
+        engine = sqlalchemy_session.sqlalchemy_engine()
+        assert engine.url.database == str(db_path)
+        assert engine.pool.checkedin() == 1
+        with engine.connect() as conn:
+            assert conn.exec_driver_sql("PRAGMA journal_mode").scalar() == "wal"
+    finally:
+        sqlalchemy_session.dispose_sqlalchemy_engines()
+
+
+def test_sqlalchemy_engine_is_pooled_singleton_and_reports_use_core_queries() -> None:
+    from server.application import reporting
+    from server.application.sqlalchemy_session import sqlalchemy_engine, sqlalchemy_session_factory
+    from server.domains.data_updates.models import DataUpdate
+
+    assert sqlalchemy_engine() is sqlalchemy_engine()
+    assert sqlalchemy_session_factory() is sqlalchemy_session_factory()
+    assert sqlalchemy_engine().pool.size() == 5
+
+    reset_db()
+    team = Team.objects.create(name="리포트팀", description="리포트", join_code="343434")
+    UserAccount.objects.create(username="report-owner", display_name="리포트소유자", email="report-owner@example.com", team=team, role=UserAccount.Role.OWNER, is_approved=True)
+    UserAccount.objects.create(username="report-member", display_name="리포트멤버", email="report-member@example.com", team=team, is_approved=True)
+    project = Project.objects.create(name="리포트 프로젝트", company=team)
+    Project.objects.create(name="조용한 프로젝트", company=team)
+    ResearchNote.objects.create(project=project, title="리포트 노트", owner="리포트소유자")
+    DataUpdate.objects.create(target="연구데이터", status="queued")
+    DataUpdate.objects.create(target="최종본", status="done")
+
+    team_row = next(row for row in reporting.team_stats() if row["team_id"] == team.id)
+    assert team_row["user_count"] == 2
+    assert team_row["project_count"] == 2
+    assert team_row["owner_name"] == "리포트소유자"
+    assert team_row["note_count"] == 1
+
+    activity = reporting.project_activity()
+    assert activity[0]["project_id"] == str(project.id)
+    assert activity[0]["recent_notes"] == 1
+    assert activity[0]["team_name"] == "리포트팀"
+
+    history = reporting.data_update_history()
+    assert {row["status"]: row["count"] for row in history["by_status"]} == {"done": 1, "queued": 1}
+    assert history["recent"][0]["target"] == "최종본"
+
+    local_client = Client()
+    assert local_client.post("/admin/login", {"username": "admin", "password": "admin1234"}).status_code == 302
+    report = local_client.get("/api/v1/admin/reports?limit=5").json()
+    assert report["projects"][0]["name"] == "리포트 프로젝트"
+    assert "리포트 프로젝트" in local_client.get("/frontend/admin/dashboard").content.decode()
+
+
+def test_admin_table_counts_are_cached_until_recount() -> None:
+    from django.conf import settings
+    from django.core.cache.backends.filebased import FileBasedCache
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+
+    from server.domains.admin import repository as admin_repository_module
+
+    reset_db()
+    local_client = Client()
+    assert local_client.post("/admin/login", {"username": "admin", "password": "admin1234"}).status_code == 302
+    Team.objects.create(name="집계팀", description="집계", join_code="323232")
+
+    first = local_client.get("/api/v1/admin/tables").json()
+    team_row = next(item for item in first if item["table"] == "workflow_app_company")
+    assert team_row["rows"] == 1
+
+    Team.objects.create(name="집계팀2", description="집계", join_code="323233")
+    with CaptureQueriesContext(connection) as queries:
+        cached = local_client.get("/api/v1/admin/tables").json()
+    assert not any("COUNT(*)" in query["sql"] for query in queries.captured_queries)
+    assert next(item for item in cached if item["table"] == "workflow_app_company")["rows"] == 1
+
+    with CaptureQueriesContext(connection) as queries:
+        recounted = local_client.post("/api/v1/admin/tables/recount").json()
+    team_row = next(item for item in recounted if item["table"] == "workflow_app_company")
+    assert team_row["rows"] == 2
+    assert team_row["approximate"] is False
+
+    # Recount ran a bounded ANALYZE, so a cold cache reads sqlite_stat1 estimates instead of counting.
+    assert any("PRAGMA analysis_limit = 1000" in query["sql"] for query in queries.captured_queries)
+    caches["shared"].clear()
+    with CaptureQueriesContext(connection) as queries:
+        estimated = local_client.get("/api/v1/admin/tables").json()
+    team_row = next(item for item in estimated if item["table"] == "workflow_app_company")
+    assert (team_row["rows"], team_row["approximate"]) == (2, True)
+    assert not any('COUNT(*) FROM "workflow_app_company"' in query["sql"] for query in queries.captured_queries)
+
+    assert local_client.post("/api/v1/admin/tables/workflow_app_company/truncate").status_code == 200
+    after = local_client.get("/api/v1/admin/tables").json()
+    assert next(item for item in after if item["table"] == "workflow_app_company")["rows"] == 0
+    # Other workers read the counts from the same on-disk cache, so they see the truncate too.
+    other_worker = FileBasedCache(settings.CACHES["shared"]["LOCATION"], {})
+    other_counts = other_worker.get(admin_repository_module.TABLE_COUNTS_CACHE_KEY)
+    assert other_counts["workflow_app_company"]["rows"] == 0
+    caches["shared"].clear()
+    cold = local_client.get("/api/v1/admin/tables").json()
+    assert next(item for item in cold if item["table"] == "workflow_app_company")["rows"] == 0
+
+
+def test_sqlite_connections_use_tuned_pragma_profile() -> None:
+    from django.core import checks
+    from django.db import connection
+    from server.application.sqlite_tuning import DEFAULT_SQLITE_PRAGMAS, sqlite_pragma_report, sqlite_pragma_statements
+
+    report = sqlite_pragma_report("default")
+    assert report["enabled"] is True
+    assert report["pragmas"]["synchronous"]["effective"] == "NORMAL"
+    assert report["pragmas"]["busy_timeout"]["effective"] == 5000
+    assert report["pragmas"]["temp_store"]["effective"] == "MEMORY"
+    assert all(row["matches"] for row in report["pragmas"].values())
+    assert report["transaction_mode"] == "IMMEDIATE"
+    # Django begins every atomic() block with "BEGIN <transaction_mode>".
+    assert connection.transaction_mode == "IMMEDIATE"
+
+    assert "PRAGMA journal_mode=WAL" in sqlite_pragma_statements(DEFAULT_SQLITE_PRAGMAS)
+    assert "PRAGMA journal_mode=WAL" not in sqlite_pragma_statements(DEFAULT_SQLITE_PRAGMAS, in_memory=True)
+    messages = checks.run_checks(tags=[checks.Tags.database], databases=["default"])
+    assert not [message for message in messages if message.id == "workflow_app.W001"]
+
+    # Read-then-write transactions: DEFERRED ones fail on the lock upgrade, IMMEDIATE ones wait their turn.
+    from server.benchmarks.sqlite_concurrency import run as run_concurrency_benchmark
+
+    results = {row["profile"]: row for row in run_concurrency_benchmark(writers=4, readers=2, ops=20)["results"]}
+    assert results["tuned"]["transaction_mode"] == "IMMEDIATE"
+    assert results["tuned"]["locked_errors"] == 0
+    assert results["tuned"]["writes"] == 4 * 20
+    assert results["tuned_deferred"]["locked_errors"] > 0
+
+
 def test_super_admin_can_manage_only_data_tables() -> None:
     reset_db()
     local_client = Client()
@@ -632,7 +1082,13 @@ def test_super_admin_can_manage_only_data_tables() -> None:
 
 
 def test_super_admin_login_falls_back_when_super_admin_table_missing(monkeypatch) -> None:
+    from django.db.utils import OperationalError
+
+    def missing_table(*args, **kwargs):
+        raise OperationalError("no such table: workflow_app_superadminaccount")
+
     monkeypatch.setattr(web_support, "_super_admin_table_exists", lambda: False)
+    monkeypatch.setattr(web_support.admin_repository, "find_super_admin_for_login", missing_table)
 
     user = web_support.authenticate_super_admin("admin", "admin1234")
 
@@ -790,6 +1246,43 @@ def test_member_sees_only_participating_projects_and_cannot_manage_researchers()
     assert forbidden_add.status_code == 403
 
 
+def test_project_permission_service_caches_access_and_invalidates_on_membership_change() -> None:
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+
+    from server.domains.projects import ProjectPermissionService
+
+    reset_db()
+    project_id, _ = seed_workflow_data()
+    other = Project.objects.create(name="비참여 프로젝트", code="TP-002")
+    profile = {"username": "tester"}
+    permissions = ProjectPermissionService()
+
+    assert permissions.can_view(project_id, profile) is True
+    with CaptureQueriesContext(connection) as queries:
+        visible = permissions.viewable_project_ids([project_id, str(other.id)], profile)
+    assert visible == {project_id}
+    assert len(queries) == 0
+
+    # Another worker process reads the same cache files, so it sees the entry and its invalidation.
+    from django.core.cache.backends.filebased import FileBasedCache
+
+    from server.domains.projects.permissions import _access_cache_key
+
+    other_worker = FileBasedCache(caches["project_access"]._dir, {})
+    assert other_worker.get(_access_cache_key("tester")).member_project_ids == {project_id}
+
+    ProjectMember.objects.create(project=other, user=UserAccount.objects.get(username="tester"), role="member")
+    assert other_worker.get(_access_cache_key("tester")) is None
+    assert permissions.viewable_project_ids([project_id, str(other.id)], profile) == {project_id, str(other.id)}
+    assert permissions.can_manage_members(project_id, profile) is False
+
+    tester = UserAccount.objects.get(username="tester")
+    tester.role = UserAccount.Role.ADMIN
+    tester.save(update_fields=["role", "updated_at"])
+    assert permissions.can_manage_members(project_id, profile) is True
+
+
 def test_admin_can_view_all_project_pages() -> None:
     reset_db()
     team = Team.objects.create(name="운영팀", description="운영팀", join_code="787878")
@@ -1096,6 +1589,377 @@ def test_project_detail_and_viewer_pages() -> None:
     assert "현재 보기 PDF 저장" in viewer_response.content.decode()
 
 
+def test_project_pages_serve_cached_fragments_until_content_version_changes() -> None:
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+
+    reset_db()
+    project_id, note_id = seed_workflow_data()
+    client_obj = Client()
+    assert client_obj.post("/login", {"username": "tester", "password": "secret123"}).status_code == 302
+    pages = [f"/frontend/projects/{project_id}", f"/frontend/projects/{project_id}/research-notes", f"/frontend/research-notes/{note_id}"]
+    # The first project detail view creates the cover row, which itself bumps the version once.
+    for url in pages + pages[:1]:
+        assert client_obj.get(url).status_code == 200
+
+    fragment_tables = ("workflow_app_researchnotefile", "workflow_app_projectnotecover")
+    for url in pages:
+        with CaptureQueriesContext(connection) as queries:
+            response = client_obj.get(url)
+        assert response.status_code == 200
+        assert "sample.pdf" in response.content.decode() or url.endswith(project_id)
+        assert not [q["sql"] for q in queries if any(table in q["sql"] for table in fragment_tables)]
+
+    ResearchNoteFile.objects.create(note_id=note_id, name="added.pdf", author="관리자", format="pdf", created="2026.03.01 / 10:00 AM")
+    assert "added.pdf" in client_obj.get(pages[1]).content.decode()
+    assert "added.pdf" in client_obj.get(pages[2]).content.decode()
+    assert "연구파일 (2)" in client_obj.get(pages[1]).content.decode()
+
+    client_obj.get(pages[0])
+    # A raw update skips the signals, so the cached cover keeps the old title until a real save.
+    ProjectNoteCover.objects.filter(project_id=project_id).update(title="캐시 전 제목")
+    assert "캐시 전 제목" not in client_obj.get(pages[0]).content.decode()
+    cover = ProjectNoteCover.objects.get(project_id=project_id)
+    cover.title = "새 표지 제목"
+    cover.save()
+    assert "새 표지 제목" in client_obj.get(pages[0]).content.decode()
+
+
+def test_request_budgets_hold_for_key_routes(tmp_path) -> None:
+    from django.conf import settings
+
+    reset_db()
+    project_id, note_id = seed_workflow_data()
+    budget_client = Client()
+    assert budget_client.post("/login", {"username": "tester", "password": "secret123"}).status_code == 302
+
+    urls = [
+        "/api/v1/projects",
+        "/api/v1/research-notes",
+        f"/api/v1/research-notes/{note_id}",
+        "/api/v1/dashboard/summary",
+        "/frontend/workflows",
+        "/frontend/projects",
+        f"/frontend/projects/{project_id}",
+        f"/frontend/projects/{project_id}/research-notes",
+        f"/frontend/projects/{project_id}/research-notes/print",
+        f"/frontend/projects/{project_id}/researchers",
+        f"/frontend/research-notes/{note_id}",
+        f"/frontend/research-notes/{note_id}/viewer",
+        "/frontend/research-notes",
+        f"/api/v1/projects/{project_id}/research-notes/export-pdf",
+    ]
+    routes = set()
+    with override_settings(RESEARCH_NOTES_STORAGE_ROOT=str(tmp_path)):
+        for url in urls:
+            response = budget_client.get(url)
+            assert response.status_code == 200, url
+            assert_within_request_budget(response)
+            routes.add(response.wsgi_request.request_stats.route)
+    assert routes == set(settings.REQUEST_BUDGETS)
+
+
+def test_request_budget_violation_is_logged(caplog) -> None:
+    reset_db()
+    with override_settings(REQUEST_BUDGETS={"api/v1/projects": {"queries": 0}}):
+        with caplog.at_level("WARNING", logger="server.application.instrumentation"):
+            response = client.get("/api/v1/projects")
+
+    stats = response.wsgi_request.request_stats
+    assert stats.route == "api/v1/projects" and stats.queries == 1 and stats.total_ms >= stats.db_ms
+    assert "Request budget exceeded for GET api/v1/projects: queries 1 > 0" in caplog.text
+
+def test_project_export_reports_server_timing_stages(tmp_path, caplog) -> None:
+    reset_db()
+    with override_settings(RESEARCH_NOTES_STORAGE_ROOT=str(tmp_path), SERVER_TIMING_ENABLED=True):
+        seed_scale_data(teams=1, users=2, projects=1, notes_per_project=2, files_per_note=1, write_files=True, pdf_pages=1, reset=True)
+        project_id = str(Project.objects.get().id)
+        timing_client = Client()
+        assert timing_client.post("/login", {"username": "scale-user-00001", "password": "secret123"}).status_code == 302
+
+        with caplog.at_level("INFO", logger="server.application.instrumentation"):
+            cold = timing_client.get(f"/api/v1/projects/{project_id}/research-notes/export-pdf")
+        warm = timing_client.get(f"/api/v1/projects/{project_id}/research-notes/export-pdf")
+
+    assert cold.status_code == 200 and cold["X-Merged-File-Count"] == "2"
+    cold_stages = {entry.split(";")[0].strip() for entry in cold["Server-Timing"].split(",")}
+    assert {"io", "render", "merge", "signature", "db", "total"} <= cold_stages
+    assert 'desc="' in cold["Server-Timing"]
+    warm_stages = {entry.split(";")[0].strip() for entry in warm["Server-Timing"].split(",")}
+    assert "render" not in warm_stages and {"io", "merge"} <= warm_stages
+
+    record = next(item for item in caplog.records if getattr(item, "spans", None))
+    assert record.route == "api/v1/projects/<str:project_id>/research-notes/export-pdf"
+    assert set(record.spans) == cold_stages - {"db", "total"}
+
+    # Without SERVER_TIMING_ENABLED only super admins see internal timings; the log entry stays.
+    with override_settings(RESEARCH_NOTES_STORAGE_ROOT=str(tmp_path)), caplog.at_level("INFO", logger="server.application.instrumentation"):
+        caplog.clear()
+        member_export = timing_client.get(f"/api/v1/projects/{project_id}/research-notes/export-pdf")
+    assert member_export.status_code == 200 and "Server-Timing" not in member_export
+    assert any(getattr(item, "spans", None) for item in caplog.records)
+    assert "Server-Timing" not in client.get("/api/v1/health")
+    super_client = Client()
+    assert super_client.post("/admin/login", {"username": "admin", "password": "admin1234"}).status_code == 302
+    assert "total;dur=" in super_client.get("/api/v1/admin/tables")["Server-Timing"]
+
+
+def test_asgi_streams_note_files_and_serves_lists_without_blocking(tmp_path) -> None:
+    import asyncio
+    import json
+    import warnings
+
+    from asgiref.sync import async_to_sync
+    from django.core.asgi import get_asgi_application
+
+    reset_db()
+    _project_id, note_id = seed_workflow_data()
+    note_file = ResearchNoteFile.objects.get(note_id=note_id)
+    ResearchNoteFolder.objects.filter(note_id=note_id).update(name=str(tmp_path))
+    payload = os.urandom(300 * 1024)
+    (tmp_path / "sample.pdf").write_bytes(payload)
+
+    asgi_client = Client()
+    assert asgi_client.post("/login", {"username": "tester", "password": "secret123"}).status_code == 302
+    cookie = "; ".join(f"{name}={morsel.value}" for name, morsel in asgi_client.cookies.items())
+    application = get_asgi_application()
+
+    async def fetch(path: str, query: str = "") -> tuple[dict, list[bytes]]:
+        messages = []
+        request_sent = False
+
+        async def receive():
+            nonlocal request_sent
+            if request_sent:
+                await asyncio.Event().wait()
+            request_sent = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+
+        async def send(message):
+            messages.append(message)
+
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": "GET",
+            "scheme": "http",
+            "path": path,
+            "raw_path": path.encode(),
+            "query_string": query.encode(),
+            "root_path": "",
+            "headers": [(b"host", b"testserver"), (b"cookie", cookie.encode())],
+            "client": ("127.0.0.1", 50000),
+            "server": ("testserver", 80),
+        }
+        await application(scope, receive, send)
+        start = messages[0]
+        headers = {name.decode().lower(): value.decode() for name, value in start["headers"]}
+        return {"status": start["status"], **headers}, [message["body"] for message in messages[1:] if message.get("body")]
+
+    cached_pdf = tmp_path / "_pdf_cache" / note_id / f"{note_file.id}.pdf"
+    cached_pdf.parent.mkdir(parents=True)
+    cached_pdf.write_bytes(payload[: 100 * 1024])
+
+    with warnings.catch_warnings(record=True) as caught, override_settings(RESEARCH_NOTES_STORAGE_ROOT=str(tmp_path)):
+        warnings.simplefilter("always")
+        head, chunks = async_to_sync(fetch)(f"/frontend/research-notes/{note_id}/files/{note_file.id}/content", "download=1")
+        pdf_head, pdf_chunks = async_to_sync(fetch)(f"/api/v1/research-notes/{note_id}/viewer-export-pdf")
+        projects_head, projects_body = async_to_sync(fetch)("/api/v1/projects")
+        notes_head, notes_body = async_to_sync(fetch)("/api/v1/research-notes")
+        cookie = ""
+        anonymous_head, _ = async_to_sync(fetch)(f"/frontend/research-notes/{note_id}/files/{note_file.id}/content")
+
+    assert head["status"] == 200 and "attachment" in head["content-disposition"]
+    assert b"".join(chunks) == payload and len(chunks) > 1
+    assert pdf_head["content-type"] == "application/pdf" and b"".join(pdf_chunks) == payload[: 100 * 1024]
+    assert not [warning for warning in caught if "synchronous iterators" in str(warning.message)]
+    assert anonymous_head["status"] == 302 and anonymous_head["location"].startswith("/login?next=")
+
+    assert projects_head["status"] == 200 and notes_head["status"] == 200
+    assert json.loads(b"".join(projects_body))[0]["code"] == "TP-001"
+    assert json.loads(b"".join(notes_body))[0]["id"] == note_id
+    assert "server-timing" not in projects_head
+
+
+def test_metrics_endpoint_aggregates_worker_snapshots(tmp_path) -> None:
+    import base64
+    import json
+    import subprocess
+    import sys
+    from io import BytesIO
+
+    from PIL import Image
+
+    from server.application import metrics
+
+    def sample(body: str, series: str) -> float:
+        return next((float(line.rsplit(" ", 1)[1]) for line in body.splitlines() if line.startswith(series + " ")), 0.0)
+
+    reset_db()
+    metrics_dir = tmp_path / "metrics"
+    with override_settings(RESEARCH_NOTES_STORAGE_ROOT=str(tmp_path / "notes"), METRICS_DIR=str(metrics_dir)):
+        seed_scale_data(teams=1, users=2, projects=1, notes_per_project=2, files_per_note=1, write_files=True, pdf_pages=1, reset=True)
+        project_id = str(Project.objects.get().id)
+        metrics_client = Client()
+        assert metrics_client.post("/login", {"username": "scale-user-00001", "password": "secret123"}).status_code == 302
+
+        before = metrics_client.get("/metrics").content.decode()
+        export_url = f"/api/v1/projects/{project_id}/research-notes/export-pdf"
+        assert metrics_client.get(export_url).status_code == 200
+        assert metrics_client.get(export_url).status_code == 200
+        upload = SimpleUploadedFile("memo.png", b"x" * 2048, content_type="image/png")
+        assert metrics_client.post(f"/api/v1/projects/{project_id}/research-notes/upload", {"research_note_file": upload}).status_code == 201
+        image_buffer = BytesIO()
+        Image.new("RGB", (20, 28), "white").save(image_buffer, format="PNG")
+        page_image = "data:image/png;base64," + base64.b64encode(image_buffer.getvalue()).decode()
+        snapshot = metrics_client.post(export_url, json.dumps({"page_images": [page_image, page_image, "not-an-image"]}), content_type="application/json")
+        assert snapshot.status_code == 200
+
+        # Another worker process on the same host writes its own snapshot next to ours.
+        subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "from django.conf import settings\n"
+                f"settings.configure(METRICS_DIR={str(metrics_dir)!r}, METRICS_FLUSH_INTERVAL=0.0)\n"
+                "from server.application import metrics\n"
+                "metrics.UPLOAD_BYTES.inc(1000, endpoint='project_research_note')\n",
+            ],
+            cwd=Path(__file__).resolve().parents[2],
+            check=True,
+        )
+        response = metrics_client.get("/metrics")
+        assert client.get("/metrics", REMOTE_ADDR="10.0.0.8").status_code == 403
+
+        # The exited worker's snapshot was folded into retired.json without changing the totals.
+        assert sorted(path.name for path in metrics_dir.glob("*.json")) == sorted(["retired.json", metrics._snapshot_name])
+        rescrape = metrics_client.get("/metrics").content.decode()
+
+        # Behind a same-host proxy REMOTE_ADDR is always loopback; a configured token is then required.
+        with override_settings(METRICS_TOKEN="scrape-secret"):
+            assert metrics_client.get("/metrics").status_code == 403
+            assert metrics_client.get("/metrics", HTTP_AUTHORIZATION="Bearer wrong").status_code == 403
+            assert metrics_client.get("/metrics", HTTP_AUTHORIZATION="Bearer scrape-secret").status_code == 200
+
+    assert response.status_code == 200
+    assert response["Content-Type"].startswith("text/plain; version=0.0.4")
+    after = response.content.decode()
+
+    def delta(series: str) -> float:
+        return sample(after, series) - sample(before, series)
+
+    export_route = 'route="api/v1/projects/<str:project_id>/research-notes/export-pdf"'
+    assert delta(f'projectnote_requests_total{{{export_route},method="GET",status="200"}}') == 2
+    assert delta(f'projectnote_requests_total{{{export_route},method="POST",status="200"}}') == 1
+    assert delta(f"projectnote_request_duration_seconds_count{{{export_route}}}") == 3
+    assert delta(f'projectnote_request_queries_bucket{{{export_route},le="+Inf"}}') == 3
+    assert delta('projectnote_pdf_cache_requests_total{cache="note_file",result="miss"}') == 2
+    assert delta('projectnote_pdf_cache_requests_total{cache="note_file",result="hit"}') == 2
+    assert delta('projectnote_pdf_cache_requests_total{cache="project_cover",result="hit"}') == 1
+    assert delta('projectnote_pdf_render_seconds_count{format="cover"}') == 1
+    assert delta('projectnote_pdf_merge_files_sum{kind="project_export"}') == 4
+    assert delta('projectnote_pdf_merge_files_sum{kind="viewer_snapshot"}') == 2
+    assert delta('projectnote_pdf_merge_files_count{kind="viewer_snapshot"}') == 1
+    assert delta('projectnote_upload_bytes_total{endpoint="project_research_note"}') == 2048 + 1000
+    assert sample(rescrape, 'projectnote_upload_bytes_total{endpoint="project_research_note"}') == sample(
+        after, 'projectnote_upload_bytes_total{endpoint="project_research_note"}'
+    )
+    assert "# TYPE projectnote_pdf_merge_bytes histogram" in after
+
+def test_metrics_from_forked_workers_are_summed_not_overwritten(tmp_path) -> None:
+    import subprocess
+    import sys
+
+    # A preforking server imports the module in the master, then forks the workers.
+    script = (
+        "import os\n"
+        "from django.conf import settings\n"
+        f"settings.configure(METRICS_DIR={str(tmp_path)!r}, METRICS_FLUSH_INTERVAL=0.0)\n"
+        "from server.application import metrics\n"
+        "metrics.UPLOAD_BYTES.inc(5, endpoint='preload')\n"
+        "children = []\n"
+        "for amount in (3, 4):\n"
+        "    pid = os.fork()\n"
+        "    if pid == 0:\n"
+        "        metrics.UPLOAD_BYTES.inc(amount, endpoint='preload')\n"
+        "        metrics.flush()\n"
+        "        os._exit(0)\n"
+        "    children.append(pid)\n"
+        "for pid in children:\n"
+        "    os.waitpid(pid, 0)\n"
+        "print(metrics.render_prometheus())\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script], cwd=Path(__file__).resolve().parents[2], capture_output=True, text=True, check=True
+    )
+    line = next(line for line in result.stdout.splitlines() if line.startswith('projectnote_upload_bytes_total{endpoint="preload"}'))
+    assert float(line.rsplit(" ", 1)[1]) == 5 + 3 + 4
+    # Each child wrote its own file, since folded into retired.json next to the parent's snapshot.
+    assert len(list(tmp_path.glob("*.json"))) == 2 and (tmp_path / "retired.json").exists()
+
+
+def test_super_admin_can_profile_a_request_and_download_collapsed_stacks(tmp_path) -> None:
+    reset_db()
+    with override_settings(
+        RESEARCH_NOTES_STORAGE_ROOT=str(tmp_path / "notes"),
+        PROFILES_DIR=str(tmp_path / "profiles"),
+        PROFILES_KEEP=2,
+        PROFILE_SAMPLE_INTERVAL_MS=0.5,
+    ):
+        seed_scale_data(teams=1, users=2, projects=1, notes_per_project=2, files_per_note=1, write_files=True, pdf_pages=1, reset=True)
+        project_id = str(Project.objects.get().id)
+
+        member_client = Client()
+        assert member_client.post("/login", {"username": "scale-user-00001", "password": "secret123"}).status_code == 302
+        assert "X-Profile-Id" not in member_client.get("/api/v1/projects?_profile=1")
+
+        super_client = Client()
+        assert super_client.post("/admin/login", {"username": "admin", "password": "admin1234"}).status_code == 302
+        export = super_client.get(f"/api/v1/projects/{project_id}/research-notes/export-pdf?_profile=1")
+        assert export.status_code == 200
+        export_profile = export["X-Profile-Id"]
+
+        download = super_client.get(f"/frontend/admin/profiles/{export_profile}")
+        assert download.status_code == 200
+        stacks = b"".join(download.streaming_content).decode()
+        assert "project_research_notes_export_pdf_api (server/domains/projects/api.py:" in stacks
+        assert all(line.rsplit(" ", 1)[1].isdigit() for line in stacks.splitlines())
+
+        header_profiles = [super_client.get("/api/v1/projects", HTTP_X_PROFILE_REQUEST="1")["X-Profile-Id"] for _ in range(2)]
+        page = super_client.get("/frontend/admin/profiles")
+        assert super_client.get("/frontend/admin/profiles/../../settings").status_code == 404
+        assert super_client.get(f"/frontend/admin/profiles/{export_profile}").status_code == 404
+        assert member_client.get("/frontend/admin/profiles").status_code == 302
+
+    assert page.status_code == 200
+    body = page.content.decode()
+    assert all(profile_id in body for profile_id in header_profiles)
+    assert export_profile not in body
+
+def test_profiling_under_asgi_samples_the_thread_running_the_sync_view(tmp_path) -> None:
+    from asgiref.sync import async_to_sync
+    from django.test import AsyncClient
+
+    reset_db()
+    with override_settings(
+        RESEARCH_NOTES_STORAGE_ROOT=str(tmp_path / "notes"),
+        PROFILES_DIR=str(tmp_path / "profiles"),
+        PROFILE_SAMPLE_INTERVAL_MS=0.5,
+    ):
+        seed_scale_data(teams=1, users=1, projects=1, notes_per_project=2, files_per_note=1, write_files=True, pdf_pages=1, reset=True)
+        project_id = str(Project.objects.get().id)
+        super_client = Client()
+        assert super_client.post("/admin/login", {"username": "admin", "password": "admin1234"}).status_code == 302
+        async_client = AsyncClient()
+        async_client.cookies = super_client.cookies
+
+        export = async_to_sync(async_client.get)(f"/api/v1/projects/{project_id}/research-notes/export-pdf?_profile=1")
+        assert export.status_code == 200
+        stacks = (tmp_path / "profiles" / f"{export['X-Profile-Id']}.collapsed").read_text(encoding="utf-8")
+
+    assert "project_research_notes_export_pdf_api (server/domains/projects/api.py:" in stacks
+
 def test_project_create_and_my_page_content() -> None:
     reset_db()
     seed_workflow_data()
@@ -1178,6 +2042,167 @@ def test_research_note_update_api() -> None:
     assert payload["note"]["title"] == "업데이트 제목"
 
 
+def test_research_note_search_is_ranked_paginated_and_scoped() -> None:
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+
+    reset_db()
+    team = Team.objects.create(name="검색팀", description="검색", join_code="585858")
+    UserAccount.objects.create(username="search-owner", display_name="검색소유자", email="search-owner@example.com", password="secret123", team=team, role=UserAccount.Role.OWNER, is_approved=True)
+    member = UserAccount.objects.create(username="search-member", display_name="검색멤버", email="search-member@example.com", password="secret123", team=team, is_approved=True)
+    visible_project = Project.objects.create(name="보이는 과제", company=team)
+    hidden_project = Project.objects.create(name="숨은 과제", company=team)
+    ProjectMember.objects.create(project=visible_project, user=member)
+
+    title_hit = ResearchNote.objects.create(project=visible_project, title="Graphene 합성 실험", owner="검색멤버", summary="기록")
+    summary_hit = ResearchNote.objects.create(project=visible_project, title="주간 기록", owner="검색멤버", summary="graphene 박막 측정")
+    hidden_hit = ResearchNote.objects.create(project=hidden_project, title="Graphene 비공개", owner="검색소유자")
+    own_upload = ResearchNote.objects.create(title="개인 업로드", owner="검색멤버", owner_username="search-member")
+    ResearchNoteFile.objects.create(note=own_upload, name="graphene-raman.pdf", author="검색멤버", format="pdf", created="2026.10.19")
+    other_team = Team.objects.create(name="다른팀", description="검색", join_code="585859")
+    UserAccount.objects.create(username="other-owner", display_name="다른소유자", email="other-owner@example.com", password="secret123", team=other_team, role=UserAccount.Role.OWNER, is_approved=True)
+    UserAccount.objects.create(username="namesake", display_name="검색멤버", email="namesake@example.com", password="secret123", team=other_team, is_approved=True)
+    other_hit = ResearchNote.objects.create(project=Project.objects.create(name="다른 과제", company=other_team), title="Graphene 타팀", owner="다른소유자")
+
+    member_client = Client()
+    assert member_client.post("/login", {"username": "search-member", "password": "secret123"}).status_code == 302
+    payload = member_client.get("/api/v1/research-notes/search", {"q": "graph"}).json()
+    ids = [item["id"] for item in payload["results"]]
+    assert payload["total"] == 3
+    assert str(hidden_hit.id) not in ids
+    assert ids[0] == str(title_hit.id)
+    assert set(ids) == {str(title_hit.id), str(summary_hit.id), str(own_upload.id)}
+
+    first_page = member_client.get("/api/v1/research-notes/search", {"q": "graphene", "page_size": 2}).json()
+    second_page = member_client.get("/api/v1/research-notes/search", {"q": "graphene", "page_size": 2, "page": 2}).json()
+    assert first_page["has_next"] is True and second_page["has_next"] is False
+    assert len(first_page["results"]) == 2 and len(second_page["results"]) == 1
+
+    owner_client = Client()
+    assert owner_client.post("/login", {"username": "search-owner", "password": "secret123"}).status_code == 302
+    with CaptureQueriesContext(connection) as queries:
+        owner_results = owner_client.get("/api/v1/research-notes/search", {"q": "graphene"}).json()["results"]
+    assert {item["id"] for item in owner_results} == {str(title_hit.id), str(summary_hit.id), str(hidden_hit.id)}
+    # The team is matched by a subquery, not by binding one parameter per project.
+    count_sql = next(query["sql"] for query in queries.captured_queries if "research_note_search MATCH" in query["sql"])
+    assert "p.company_id = " in count_sql and "n.project_id IN ('" not in count_sql
+
+    # Another team's owner sees only that team's notes, and a user sharing the uploader's display name
+    # does not see their project-less upload.
+    other_client = Client()
+    assert other_client.post("/login", {"username": "other-owner", "password": "secret123"}).status_code == 302
+    other_ids = [item["id"] for item in other_client.get("/api/v1/research-notes/search", {"q": "graphene"}).json()["results"]]
+    assert other_ids == [str(other_hit.id)]
+    namesake_client = Client()
+    assert namesake_client.post("/login", {"username": "namesake", "password": "secret123"}).status_code == 302
+    assert namesake_client.get("/api/v1/research-notes/search", {"q": "graphene"}).json()["total"] == 0
+
+    title_hit.title = "탄소 소재 실험"
+    title_hit.save()
+    summary_hit.delete()
+    refreshed = member_client.get("/api/v1/research-notes/search", {"q": "graphene"}).json()
+    assert [item["id"] for item in refreshed["results"]] == [str(own_upload.id)]
+    assert member_client.get("/api/v1/research-notes/search", {"q": "탄소"}).json()["total"] == 1
+    assert Client().get("/api/v1/research-notes/search", {"q": "graphene"}).status_code == 401
+
+
+def test_uploaded_pdf_text_is_extracted_in_slices_and_searchable_by_page() -> None:
+    from io import BytesIO, StringIO
+
+    from django.test import TestCase
+    from reportlab.pdfgen import canvas as pdf_canvas
+    from server.domains.research_notes.models import ResearchNoteFileExtraction, ResearchNoteFilePage
+
+    reset_db()
+    team = Team.objects.create(name="추출팀", description="추출", join_code="595959")
+    UserAccount.objects.create(username="extract-owner", display_name="추출소유자", email="extract-owner@example.com", password="secret123", team=team, role=UserAccount.Role.OWNER, is_approved=True)
+    project = Project.objects.create(name="추출 과제", company=team)
+
+    buffer = BytesIO()
+    pdf = pdf_canvas.Canvas(buffer)
+    for text in ("Overview of the assay", "Centrifuge protocol at 4000 rpm", "Appendix tables"):
+        pdf.drawString(72, 720, text)
+        pdf.showPage()
+    pdf.save()
+
+    local_client = Client()
+    assert local_client.post("/login", {"username": "extract-owner", "password": "secret123"}).status_code == 302
+    with tempfile.TemporaryDirectory() as temp_dir:
+        with override_settings(RESEARCH_NOTES_STORAGE_ROOT=temp_dir, BACKGROUND_TASKS_EAGER=True, RESEARCH_NOTE_TEXT_EXTRACTION_BUDGET=0):
+            with TestCase.captureOnCommitCallbacks(execute=True) as callbacks:
+                response = local_client.post(
+                    f"/api/v1/projects/{project.id}/research-notes/upload",
+                    {"title": "원심분리", "research_note_file": SimpleUploadedFile("protocol.pdf", buffer.getvalue(), content_type="application/pdf")},
+                )
+            assert response.status_code == 201
+
+            # An extraction interrupted mid-document is finished by the deploy-time command.
+            ResearchNoteFileExtraction.objects.filter(file__note_id=response.json()["note_id"]).update(
+                status=ResearchNoteFileExtraction.Status.PENDING, next_page=2
+            )
+            out = StringIO()
+            call_command("resume_text_extraction", stdout=out)
+            assert "1건" in out.getvalue()
+
+    # A zero budget extracts one page per slice, re-queueing itself until the document is done.
+    assert len(callbacks) == 3
+    extraction = ResearchNoteFileExtraction.objects.get(file__note_id=response.json()["note_id"])
+    assert extraction.status == ResearchNoteFileExtraction.Status.DONE
+    assert extraction.page_count == 3
+    assert ResearchNoteFilePage.objects.filter(file=extraction.file).count() == 3
+
+    hits = local_client.get("/api/v1/research-notes/search/pages", {"q": "centrifuge"}).json()
+    assert hits["total"] == 1
+    assert hits["results"][0]["page_number"] == 2
+    assert "Centrifuge" in hits["results"][0]["snippet"]
+    viewer_url = hits["results"][0]["viewer_url"]
+    assert viewer_url.endswith(f"file={extraction.file_id}&page=2")
+    assert "#page=2" in local_client.get(viewer_url).content.decode()
+
+    extraction.file.delete()
+    assert local_client.get("/api/v1/research-notes/search/pages", {"q": "centrifuge"}).json()["total"] == 0
+
+
+def test_text_extraction_can_be_left_to_the_sweeping_worker_process() -> None:
+    from datetime import timedelta
+    from io import BytesIO
+
+    from django.utils import timezone
+    from reportlab.pdfgen import canvas as pdf_canvas
+    from server.domains.research_notes.models import ResearchNoteFileExtraction
+
+    reset_db()
+    team = Team.objects.create(name="스윕팀", description="스윕", join_code="595960")
+    UserAccount.objects.create(username="sweep-owner", display_name="스윕소유자", email="sweep-owner@example.com", password="secret123", team=team, role=UserAccount.Role.OWNER, is_approved=True)
+    project = Project.objects.create(name="스윕 과제", company=team)
+    buffer = BytesIO()
+    pdf = pdf_canvas.Canvas(buffer)
+    pdf.drawString(72, 720, "Sweep page")
+    pdf.save()
+
+    local_client = Client()
+    assert local_client.post("/login", {"username": "sweep-owner", "password": "secret123"}).status_code == 302
+    with tempfile.TemporaryDirectory() as temp_dir:
+        with override_settings(RESEARCH_NOTES_STORAGE_ROOT=temp_dir, BACKGROUND_TASKS_EAGER=True, RESEARCH_NOTE_TEXT_EXTRACTION_IN_WEB=False):
+            response = local_client.post(
+                f"/api/v1/projects/{project.id}/research-notes/upload",
+                {"title": "스윕", "research_note_file": SimpleUploadedFile("sweep.pdf", buffer.getvalue(), content_type="application/pdf")},
+            )
+            assert response.status_code == 201
+            extraction = ResearchNoteFileExtraction.objects.get(file__note_id=response.json()["note_id"])
+            assert extraction.status == ResearchNoteFileExtraction.Status.PENDING
+
+            # A sweep with a staleness threshold leaves fresh rows to the web workers that queued them.
+            extractor = web_support.research_note_text_extractor
+            assert extractor.resume_pending(inline=True, stale_seconds=300) == 0
+            ResearchNoteFileExtraction.objects.filter(id=extraction.id).update(updated_at=timezone.now() - timedelta(seconds=600))
+            assert extractor.resume_pending(inline=True, stale_seconds=300) == 1
+
+    extraction.refresh_from_db()
+    assert extraction.status == ResearchNoteFileExtraction.Status.DONE
+    assert local_client.get("/api/v1/research-notes/search/pages", {"q": "sweep"}).json()["total"] == 1
+
+
 def test_login_logout_and_auth_redirect() -> None:
     reset_db()
     anon = Client()
@@ -1358,6 +2383,64 @@ def test_researchers_support_unassigned_verify_id_and_pending_for_my_team_querie
     assert not any(item["id"] == team_pending.id for item in pending_payload)
 
 
+def test_researcher_filters_run_in_sql() -> None:
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+
+    reset_db()
+    team = Team.objects.create(name="필터팀", description="필터", join_code="565656")
+    for index in range(5):
+        UserAccount.objects.create(username=f"filter-{index}", display_name=f"필터{index}", email=f"filter-{index}@example.com", team=team, is_approved=index % 2 == 0)
+    UserAccount.objects.create(username="Lonely-One", display_name="무소속", email="lonely@example.com")
+
+    repository = web_support.researcher_repository
+    with CaptureQueriesContext(connection) as queries:
+        approved = repository.list_researchers(team_id=team.id, is_approved=True)
+        unassigned = repository.list_researchers(unassigned=True, q="lonely")
+        exists = repository.username_exists("filter-3")
+    assert len(queries.captured_queries) == 3
+    assert [item["username"] for item in approved] == ["filter-0", "filter-2", "filter-4"]
+    assert all(item["organization"] == "필터팀" for item in approved)
+    assert [item["username"] for item in unassigned] == ["Lonely-One"]
+    assert exists is True
+    assert repository.username_exists("filter-9") is False
+
+
+def test_bulk_invite_allocates_usernames_with_one_prefix_query() -> None:
+    import json
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+
+    reset_db()
+    team = Team.objects.create(name="초대팀", description="초대", join_code="575757")
+    UserAccount.objects.create(username="invite-owner", display_name="초대소유자", email="invite-owner@example.com", password="secret123", team=team, role=UserAccount.Role.OWNER, is_approved=True)
+    UserAccount.objects.create(username="kim", display_name="김", email="kim@old.example.com")
+    UserAccount.objects.create(username="kim2", display_name="김2", email="kim2@old.example.com")
+    web_support.dashboard_counts()
+
+    with CaptureQueriesContext(connection) as queries:
+        single = web_support.researcher_repository.create_researcher({"email": "kim@single.example.com", "name": "김단일"})
+    assert single["username"] == "kim3"
+    assert sum("LIKE" in query["sql"] for query in queries.captured_queries) == 1
+
+    local_client = Client()
+    assert local_client.post("/login", {"username": "invite-owner", "password": "secret123"}).status_code == 302
+    roster = [
+        {"email": "kim@lab.example.com", "name": "김하나", "organization": "초대팀"},
+        {"email": "kim@other.example.com", "name": "김둘"},
+        {"email": "lee@lab.example.com", "name": "이셋", "organization": "초대팀"},
+        {"email": "kim@old.example.com", "name": "기존"},
+    ]
+    response = local_client.post("/api/v1/researchers/bulk-invite", json.dumps({"researchers": roster}), content_type="application/json")
+    assert response.status_code == 201
+    invited = response.json()["researchers"]
+    assert [item["username"] for item in invited] == ["kim4", "kim5", "lee", "kim"]
+    assert invited[0]["organization"] == "초대팀"
+    assert web_support.dashboard_counts()["researchers"] == UserAccount.objects.count() == 7
+
+    empty = local_client.post("/api/v1/researchers/bulk-invite", json.dumps({"researchers": []}), content_type="application/json")
+    assert empty.status_code == 400
+
 
 def test_researchers_pending_for_my_team_includes_linked_unapproved_user() -> None:
     reset_db()
@@ -1436,6 +2519,39 @@ def test_seed_demo_data_populates_tables() -> None:
     assert len(response.json()) >= 1
 
 
+def test_seed_scale_data_is_deterministic_per_seed(tmp_path) -> None:
+    from server.domains.research_notes.repository import ResearchNoteRepository
+
+    reset_db()
+
+    def snapshot() -> list[tuple]:
+        return list(ResearchNote.objects.order_by("id").values_list("id", "project_id", "title", "owner", "files"))
+
+    counts = seed_scale_data(
+        teams=2, users=6, projects=3, notes_per_project=4, files_per_note=2, seed=7, image_ratio=0.5,
+        write_files=True, pdf_pages=1, storage_root=tmp_path, batch_size=5, reset=True,
+    )
+    first = snapshot()
+    assert counts == {"teams": 2, "researchers": 6, "projects": 3, "notes": 12, "files": 24}
+    assert len(first) == 12 and all(row[4] == 2 for row in first)
+    assert all(project.note_count == 4 and project.file_count == 8 for project in Project.objects.all())
+
+    note_file = ResearchNoteFile.objects.order_by("id").first()
+    path = ResearchNoteRepository().resolve_note_file_path(str(note_file.note_id), note_file.name)
+    assert path is not None and str(path).startswith(str(tmp_path))
+
+    seed_scale_data(teams=2, users=6, projects=3, notes_per_project=4, files_per_note=2, seed=7, image_ratio=0.5, reset=True)
+    assert snapshot() == first
+    seed_scale_data(teams=2, users=6, projects=3, notes_per_project=4, files_per_note=2, seed=8, image_ratio=0.5, reset=True)
+    assert snapshot() != first
+
+    login_client = Client()
+    response = login_client.post("/login", {"username": "scale-user-00001", "password": "secret123"})
+    assert response.status_code == 302
+    owned = Project.objects.filter(memberships__user__username="scale-user-00001").order_by("code")
+    assert [project.code for project in owned] == ["PN-SCALE-00001", "PN-SCALE-00003"]
+    assert login_client.get(f"/frontend/projects/{owned[0].id}").status_code == 200
+
 def test_ddd_supporting_layers_are_wired() -> None:
     reset_db()
 
@@ -1642,3 +2758,76 @@ def test_super_admin_can_approve_grant_and_expel_user() -> None:
     expel = admin_client.post("/api/v1/admin/users", {"action": "expel", "user_id": str(user.id)})
     assert expel.status_code == 200
     assert not UserAccount.objects.filter(id=user.id).exists()
+
+
+def test_project_cover_image_is_stored_as_asset_and_served_by_url() -> None:
+    import base64
+    from io import BytesIO
+
+    from PIL import Image
+
+    from server.domains.projects.models import ProjectNoteCover
+
+    reset_db()
+    team = Team.objects.create(name="표지팀", description="표지", join_code="262626")
+    UserAccount.objects.create(
+        username="cover-owner",
+        display_name="표지소유자",
+        email="cover-owner@example.com",
+        password="secret123",
+        role=UserAccount.Role.OWNER,
+        team=team,
+        is_approved=True,
+    )
+    project = Project.objects.create(name="표지 프로젝트", company=team, organization=team.name, code="CV-001")
+
+    image_buffer = BytesIO()
+    Image.new("RGB", (1200, 1700), "white").save(image_buffer, format="PNG")
+    data_url = "data:image/png;base64," + base64.b64encode(image_buffer.getvalue()).decode()
+
+    local_client = Client()
+    assert local_client.post("/login", {"username": "cover-owner", "password": "secret123"}).status_code == 302
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        with override_settings(RESEARCH_NOTES_STORAGE_ROOT=temp_dir):
+            saved = local_client.post(f"/api/v1/projects/{project.id}/cover", {"title": "표지", "cover_image_data_url": data_url})
+            assert saved.status_code == 200
+
+            cover = ProjectNoteCover.objects.get(project=project)
+            assert cover.cover_image_data_url == ""
+            assert cover.cover_image_mime == "image/png"
+            assert len(cover.cover_image_hash) == 64
+
+            detail = local_client.get(f"/frontend/projects/{project.id}")
+            html = detail.content.decode()
+            assert "data:image/png;base64" not in html
+            assert f"/api/v1/projects/{project.id}/cover/image?v={cover.cover_image_hash[:16]}" in html
+
+            original = local_client.get(f"/api/v1/projects/{project.id}/cover/image?v={cover.cover_image_hash[:16]}")
+            assert original.status_code == 200
+            assert b"".join(original.streaming_content) == image_buffer.getvalue()
+            assert "immutable" in original["Cache-Control"]
+
+            preview = local_client.get(f"/api/v1/projects/{project.id}/cover/image?variant=preview")
+            with Image.open(BytesIO(b"".join(preview.streaming_content))) as preview_image:
+                assert preview_image.width <= 420 and preview_image.height <= 594
+
+            cover_pdf = local_client.get(f"/api/v1/projects/{project.id}/cover/print")
+            assert cover_pdf.status_code == 200
+            assert original["X-Content-Type-Options"] == "nosniff"
+
+            svg_url = "data:image/svg+xml;base64," + base64.b64encode(b"<svg xmlns='http://www.w3.org/2000/svg'><script>alert(1)</script></svg>").decode()
+            rejected = local_client.post(f"/api/v1/projects/{project.id}/cover", {"title": "표지", "cover_image_data_url": svg_url})
+            assert rejected.status_code == 400
+            assert ProjectNoteCover.objects.get(project=project).cover_image_mime == "image/png"
+
+            # An SVG cover stored before uploads were restricted is only offered as a sandboxed download.
+            from server.domains.projects.cover_assets import cover_asset_path
+
+            legacy_path = cover_asset_path(str(project.id), "f" * 64, "image/svg+xml")
+            legacy_path.write_bytes(b"<svg xmlns='http://www.w3.org/2000/svg'/>")
+            ProjectNoteCover.objects.filter(project=project).update(cover_image_hash="f" * 64, cover_image_mime="image/svg+xml")
+            legacy = local_client.get(f"/api/v1/projects/{project.id}/cover/image")
+            assert legacy.status_code == 200
+            assert legacy["Content-Disposition"].startswith("attachment")
+            assert legacy["Content-Security-Policy"] == "sandbox"
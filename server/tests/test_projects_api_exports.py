@@ -23,3 +23,57 @@ def test_projects_api_exports_required_route_handlers() -> None:
 
     for name in required_handlers:
         assert callable(getattr(projects_api, name)), f"projects_api.{name} is not callable"
+
+
+def test_url_import_does_not_load_pdf_stack() -> None:
+    """Worker boot stays light: pypdf/reportlab load only when a PDF is built, through pdf_toolkit."""
+    import json
+    import subprocess
+    import sys
+    from pathlib import Path
+
+    script = (
+        "import json, sys, time, django\n"
+        "django.setup()\n"
+        "started = time.perf_counter()\n"
+        "import server.config.urls\n"
+        "elapsed = time.perf_counter() - started\n"
+        "heavy = sorted({name.split('.')[0] for name in sys.modules} & {'pypdf', 'reportlab'})\n"
+        "print(json.dumps({'elapsed': elapsed, 'heavy': heavy}))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=Path(__file__).resolve().parents[2],
+        env={**os.environ, "DJANGO_SETTINGS_MODULE": "server.config.settings"},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    report = json.loads(result.stdout.strip().splitlines()[-1])
+    assert report["heavy"] == [], f"PDF stack imported at start-up ({report['elapsed']:.3f}s): {report['heavy']}"
+
+    # pdf_toolkit is the only module allowed to import the PDF stack directly.
+    server_root = Path(__file__).resolve().parents[1]
+    direct = [
+        str(path.relative_to(server_root))
+        for path in server_root.rglob("*.py")
+        if "tests" not in path.parts and path.name != "pdf_toolkit.py"
+        and any(line.lstrip().startswith(("import pypdf", "from pypdf", "import reportlab", "from reportlab")) for line in path.read_text(encoding="utf-8").splitlines())
+    ]
+    assert direct == [], f"Import the PDF stack through server.application.pdf_toolkit: {direct}"
+
+
+def test_pdf_toolkit_registers_korean_font_once() -> None:
+    from io import BytesIO
+
+    from server.application import pdf_toolkit
+
+    font_name = pdf_toolkit.korean_font()
+    assert pdf_toolkit.korean_font() == font_name
+
+    buffer = BytesIO()
+    pdf = pdf_toolkit.canvas.Canvas(buffer, pagesize=pdf_toolkit.A4)
+    pdf_toolkit.set_pdf_font(pdf, 12)
+    pdf.drawString(40, 40, "연구노트")
+    pdf.save()
+    assert len(pdf_toolkit.PdfReader(BytesIO(buffer.getvalue())).pages) == 1